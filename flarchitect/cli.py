@@ -0,0 +1,108 @@
+"""Command line tools for flarchitect applications."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from flask.cli import NoAppException, ScriptInfo
+
+from flarchitect import __version__ as PACKAGE_VERSION
+from flarchitect.core.architect import FLASK_APP_NAME
+from flarchitect.utils.startup_profile import StartupProfile
+
+
+def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="flarchitect", description="flarchitect command line tools")
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"flarchitect {PACKAGE_VERSION}",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    profile = commands.add_parser(
+        "startup-profile",
+        help="Break application boot time down by phase and model",
+        description="Create the application and report where flarchitect spent its start-up time.",
+    )
+    profile.add_argument(
+        "app",
+        help="Application or factory in Flask's --app format, e.g. 'myapp:create_app()'",
+    )
+    profile.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="Number of models to list, slowest first",
+    )
+    profile.add_argument(
+        "--warmup",
+        action="store_true",
+        help="Also time Architect.warmup(), which builds routes deferred by API_LAZY_SCHEMAS",
+    )
+    profile.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the profile as JSON",
+    )
+    return parser.parse_args(argv)
+
+
+def startup_profile(app_path: str, *, warmup: bool = False) -> tuple[StartupProfile, dict[str, Any]]:
+    """Create the application at ``app_path`` and return its start-up profile.
+
+    Args:
+        app_path: Import path of the app or factory, as accepted by ``flask --app``.
+        warmup: Run :meth:`~flarchitect.Architect.warmup` after creating the app.
+
+    Returns:
+        tuple[StartupProfile, dict[str, Any]]: The Architect's profile, and a
+        summary with ``app_ms`` (the whole factory), the profile's
+        ``total_ms``, ``phases_ms`` and ``models_ms``, and
+        ``rate_limit_detection``.
+
+    Raises:
+        NoAppException: If the app cannot be loaded or does not use flarchitect.
+    """
+
+    started = time.perf_counter()
+    app = ScriptInfo(app_import_path=app_path, set_debug_flag=False).load_app()
+    app_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    architect = app.extensions.get(FLASK_APP_NAME)
+    if architect is None or architect.startup_profile is None:
+        raise NoAppException(f"{app_path!r} does not initialise flarchitect.")
+    if warmup:
+        architect.warmup()
+    profile = architect.startup_profile
+    return profile, {
+        "app_ms": app_ms,
+        **profile.as_dict(),
+        "rate_limit_detection": architect.rate_limit_detection,
+    }
+
+
+def main(argv: Iterable[str] | None = None) -> None:
+    args = parse_args(argv)
+    try:
+        profile, summary = startup_profile(args.app, warmup=args.warmup)
+    except NoAppException as exc:
+        raise SystemExit(f"Error: {exc}") from exc
+
+    if args.json:
+        print(json.dumps(summary, indent=2, default=str))
+        return
+
+    print(f"Application created in {summary['app_ms']:.1f} ms")
+    detection = summary["rate_limit_detection"] or {}
+    if detection:
+        print(f"Rate limit storage {detection.get('uri') or 'memory://'} resolved from {detection.get('source')} in {detection.get('elapsed_ms')} ms")
+    print(profile.report(top=args.top))
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    main()
@@ -1,15 +1,18 @@
 import base64
 import binascii
+import gc
 import importlib
 import importlib.resources
 import os
 import re
+import time
 from collections.abc import Callable, Iterable, Mapping
 from functools import wraps
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, TypeVar, cast
+from weakref import WeakKeyDictionary
 
-from flask import Flask, Response, g, has_request_context, jsonify, redirect, request
+from flask import Flask, Response, current_app, g, has_request_context, redirect, request
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from marshmallow import Schema
@@ -17,25 +20,33 @@ from sqlalchemy.orm import DeclarativeBase, Session
 
 from flarchitect.authentication.token_providers import extract_token_from_request
 from flarchitect.authentication.user import set_current_user
+from flarchitect.core.route_config import RouteConfig, activate_route_config, app_route_configs, resolve_route_config, route_config_for
 from flarchitect.core.routes import RouteCreator, find_rule_by_function
+from flarchitect.core.warmup import warm_models
 from flarchitect.exceptions import CustomHTTPException
 from flarchitect.logging import logger
 from flarchitect.plugins import PluginManager
 from flarchitect.specs.generator import CustomSpec
-from flarchitect.utils.config_helpers import get_config_or_model_meta
+from flarchitect.utils.config_helpers import config_version, get_config_or_model_meta, invalidate_config_cache
 from flarchitect.utils.decorators import handle_many, handle_one
 from flarchitect.utils.general import (
     AttributeInitialiserMixin,
     check_rate_services,
+    rate_service_detection,
     validate_flask_limiter_rate_limit_string,
 )
+from flarchitect.utils.json_encoding import json_response, resolve_json_encoder
+from flarchitect.utils.rate_limit import LAZY_DETECT_URI
 from flarchitect.utils.response_helpers import create_response
 from flarchitect.utils.session import get_session
+from flarchitect.utils.startup_profile import StartupProfile
+from flarchitect.utils.timing import current_timer, server_timing_header, stage, start_request_timer, timed, timing_enabled
 
 if TYPE_CHECKING:  # pragma: no cover - used for type checkers only
     from flask_caching import Cache
 
     from flarchitect.authentication.jwt import get_user_from_token as _get_user_from_token
+    from flarchitect.database.registry import ModelRegistry
 
 FLASK_APP_NAME = "flarchitect"
 
@@ -155,8 +166,11 @@ class Architect(AttributeInitialiserMixin):
     base_dir: str = os.path.dirname(os.path.abspath(__file__))
     route_spec: list[dict[str, Any]] | None = None
     limiter: Limiter
+    startup_profile: StartupProfile | None = None
+    rate_limit_detection: dict[str, Any] | None = None
     cache: "Cache | None" = None
     plugins: PluginManager
+    model_registry: "ModelRegistry | None" = None
 
     def __init__(self, app: Flask | None = None, *args, **kwargs):
         """Initialise the extension and optionally bind to a Flask app.
@@ -174,6 +188,7 @@ class Architect(AttributeInitialiserMixin):
             **kwargs: Keyword arguments forwarded to :meth:`init_app`.
         """
         self.route_spec: list[dict[str, Any]] = []
+        self._config_generation = 0
 
         if app is not None:
             if self._is_reloader_start():
@@ -219,17 +234,26 @@ class Architect(AttributeInitialiserMixin):
         Returns:
             None. The Flask app is modified in place.
         """
-        super().__init__(app, *args, **kwargs)
-        self._register_app(app)
-        self._configure_logging()
-        self.api_spec = None
-        self.plugins = self._load_plugins()
-        self._init_cache(app)
-        self._init_cors(app)
+        self.startup_profile = profile = StartupProfile()
+        with profile.phase("configure"):
+            super().__init__(app, *args, **kwargs)
+            self._register_app(app)
+            self._configure_logging()
+            self.api_spec = None
+        with profile.phase("plugins"):
+            self.plugins = self._load_plugins()
+        with profile.phase("cache"):
+            self._init_cache(app)
+        with profile.phase("cors"):
+            self._init_cors(app)
         self._init_auto_api(app, **kwargs)
-        self._init_websockets()
-        self._init_rate_limiter(app)
-        self._register_request_hooks(app)
+        with profile.phase("websockets"):
+            self._init_websockets()
+        with profile.phase("rate-limiter"):
+            self._init_rate_limiter(app)
+        with profile.phase("request-hooks"):
+            self._register_request_hooks(app)
+        logger.log(2, f"flarchitect initialised in {profile.total * 1000:.1f}ms")
 
     def _configure_logging(self) -> None:
         logger.verbosity_level = self.get_config("API_VERBOSITY_LEVEL", 0)
@@ -237,10 +261,16 @@ class Architect(AttributeInitialiserMixin):
             logger.json_mode = bool(self.get_config("API_JSON_LOGS", False))
         except Exception:
             logger.json_mode = False
+        encoder = resolve_json_encoder(self.get_config("API_JSON_ENCODER", "json"), sort_keys=False)
+        logger.json_encoder = encoder.dumps if encoder else None
 
     def _load_plugins(self) -> PluginManager:
         try:
-            return PluginManager.from_config(self.get_config("API_PLUGINS", []))
+            return PluginManager.from_config(
+                self.get_config("API_PLUGINS", []),
+                after_response_workers=self.get_config("API_PLUGIN_AFTER_RESPONSE_WORKERS", 2),
+                after_response_queue=self.get_config("API_PLUGIN_AFTER_RESPONSE_QUEUE", 1000),
+            )
         except Exception:
             return PluginManager()
 
@@ -304,10 +334,14 @@ class Architect(AttributeInitialiserMixin):
             return response
 
     def _init_auto_api(self, app: Flask, **kwargs: Any) -> None:
+        profile = self.startup_profile
         if self.get_config("FULL_AUTO", True):
-            self.init_api(app=app, **kwargs)
+            with profile.phase("routes"):
+                self.init_api(app=app, **kwargs)
+        self._init_config_debug_route(app)
         if self.get_config("API_CREATE_DOCS", True):
-            self.init_apispec(app=app, **kwargs)
+            with profile.phase("spec"):
+                self.init_apispec(app=app, **kwargs)
 
     def _init_websockets(self) -> None:
         if not self.get_config("API_ENABLE_WEBSOCKETS", False):
@@ -323,7 +357,20 @@ class Architect(AttributeInitialiserMixin):
 
     def _init_rate_limiter(self, app: Flask) -> None:
         logger.log(2, "Creating rate limiter")
-        storage_uri = check_rate_services()
+        strategy = app.config.get("RATELIMIT_STRATEGY", "fixed-window")
+        if (
+            self.get_config("API_RATE_LIMIT_LAZY_DETECT", False)
+            and not self.get_config("API_RATE_LIMIT_STORAGE_URI", None)
+            and self.get_config("API_RATE_LIMIT_AUTODETECT", True) is not False
+            and strategy == "fixed-window"
+        ):
+            storage_uri = LAZY_DETECT_URI
+            self.rate_limit_detection = {"uri": None, "source": "lazy", "elapsed_ms": 0.0}
+        else:
+            storage_uri = check_rate_services()
+            self.rate_limit_detection = dict(rate_service_detection)
+        detection = self.rate_limit_detection
+        logger.log(2, f"Rate limit storage `{storage_uri or 'memory://'}` resolved from {detection.get('source')} in {detection.get('elapsed_ms')}ms")
         self.app.config["RATELIMIT_HEADERS_ENABLED"] = True
         self.app.config["RATELIMIT_SWALLOW_ERRORS"] = True
         self.app.config["RATELIMIT_IN_MEMORY_FALLBACK_ENABLED"] = True
@@ -354,8 +401,10 @@ class Architect(AttributeInitialiserMixin):
 
                 _g.request_id = rid
                 _g._flarch_req_start = _t.perf_counter()
-            with contextlib.suppress(Exception):
-                self.plugins.request_started(request)
+                start_request_timer()
+            if self.plugins.has_hook("request_started"):
+                with contextlib.suppress(Exception):
+                    self.plugins.request_started(request)
 
         @app.after_request
         def _attach_request_id_and_log(response: Response) -> Response:  # pragma: no cover - Flask integration
@@ -367,6 +416,8 @@ class Architect(AttributeInitialiserMixin):
                 if rid:
                     response.headers["X-Request-ID"] = rid
 
+                self._report_stage_timings(response)
+
                 if get_config_or_model_meta("API_LOG_REQUESTS", default=True):
                     # Single-line request log with context provided by logger
                     logger.log(
@@ -374,11 +425,57 @@ class Architect(AttributeInitialiserMixin):
                         f"Completed {request.method} {request.path} -> {response.status_code}",
                     )
             # Allow plugins to modify/replace the response
-            with contextlib.suppress(Exception):
-                new_resp = self.plugins.request_finished(request, response)
-                return new_resp or response
+            if self.plugins.has_hook("request_finished"):
+                with contextlib.suppress(Exception):
+                    response = self.plugins.request_finished(request, response) or response
+            if self.plugins.has_hook("after_response"):
+                with contextlib.suppress(Exception):
+                    self.plugins.after_response(self._after_response_info(response))
             return response
 
+    @staticmethod
+    def _report_stage_timings(response: Response) -> None:
+        """Emit the request's stage timings as ``Server-Timing`` and to the metrics sink."""
+
+        timer = current_timer()
+        if timer is None:
+            return
+        start = getattr(g, "_flarch_req_start", None)
+        total = None if start is None else time.perf_counter() - start
+        if get_config_or_model_meta("API_SERVER_TIMING", default=False):
+            response.headers["Server-Timing"] = server_timing_header(timer, total)
+        sink = get_config_or_model_meta("API_METRICS_SINK", default=None)
+        if callable(sink):
+            try:
+                sink(
+                    {
+                        "method": request.method,
+                        "path": request.path,
+                        "endpoint": request.endpoint,
+                        "status_code": response.status_code,
+                        "request_id": getattr(g, "request_id", None),
+                        "total_ms": None if total is None else round(total * 1000, 3),
+                        "stages_ms": timer.as_ms(),
+                    }
+                )
+            except Exception as exc:
+                logger.debug(4, f"API_METRICS_SINK failed: {exc}")
+
+    @staticmethod
+    def _after_response_info(response: Response) -> dict[str, Any]:
+        """Snapshot the request and response for ``after_response`` plugins."""
+
+        start = getattr(g, "_flarch_req_start", None)
+        return {
+            "method": request.method,
+            "path": request.path,
+            "endpoint": request.endpoint,
+            "status_code": response.status_code,
+            "request_id": getattr(g, "request_id", None),
+            "duration_ms": None if start is None else (time.perf_counter() - start) * 1000,
+            "stages_ms": timer.as_ms() if (timer := current_timer()) is not None else None,
+        }
+
     def _register_global_authentication_hook(self, app: Flask) -> None:
         @app.before_request
         def _global_authentication() -> None:
@@ -545,7 +642,7 @@ class Architect(AttributeInitialiserMixin):
                 response_data["errors"] = [str(err) for err in result.errors]
             if result.data is not None:
                 response_data["data"] = result.data
-            return jsonify(response_data)
+            return json_response(response_data)
 
         route = {
             "function": graphql_endpoint,
@@ -559,6 +656,63 @@ class Architect(AttributeInitialiserMixin):
 
             register_routes_with_spec(self, [route])
 
+    @property
+    def route_configs(self) -> dict[str, RouteConfig]:
+        """Configuration snapshots of the bound app's generated routes, keyed by endpoint."""
+
+        return app_route_configs(self.app)
+
+    def reload_config(self) -> None:
+        """Re-resolve cached configuration after changing it at runtime.
+
+        Why/How:
+            Generated routes answer configuration lookups from
+            :class:`~flarchitect.core.route_config.RouteConfig` snapshots, and
+            ``schema_constructor`` composes each route's rate limit and role
+            checks once. Both are rebuilt on the next request after
+            ``app.config`` or a model's ``Meta`` changes. Call this to rebuild
+            them straight away, e.g. after changing a base class of a
+            ``Meta``; the JSON encoder and logging settings are refreshed too.
+        """
+
+        invalidate_config_cache()
+        configs = self.route_configs
+        memo: dict[tuple[str, Any, str], Any] = {}
+        for endpoint, snapshot in list(configs.items()):
+            configs[endpoint] = resolve_route_config(endpoint, snapshot.model, snapshot.method, app=self.app, memo=memo)
+        self._config_generation += 1
+        self.app.extensions.pop("flarchitect.json_encoder", None)
+        self._configure_logging()
+
+    def _init_config_debug_route(self, app: Flask) -> None:
+        """Serve the resolved route configuration when ``API_CONFIG_DEBUG_ROUTE`` is set."""
+
+        route = self.get_config("API_CONFIG_DEBUG_ROUTE")
+        if not route:
+            return
+
+        @self.schema_constructor(
+            output_schema=None,
+            group_tag="Debug",
+            tag="Debug",
+            summary="Resolved route configuration.",
+        )
+        def route_config_snapshot() -> dict[str, Any]:
+            """Return the configuration snapshot of each generated route.
+
+            ``?endpoint=`` narrows the result to endpoints containing the value.
+            """
+
+            self._materialise_routes()
+            wanted = request.args.get("endpoint")
+            return {
+                endpoint: snapshot.as_dict()
+                for endpoint, snapshot in sorted(app_route_configs(current_app).items())
+                if not wanted or wanted in endpoint
+            }
+
+        app.add_url_rule(route, endpoint=route_config_snapshot.__name__, view_func=route_config_snapshot, methods=["GET"])
+
     def to_api_spec(self):
         """
         Returns the api spec object.
@@ -567,9 +721,49 @@ class Architect(AttributeInitialiserMixin):
             APISpec: The api spec json object.
         """
         if self.api_spec:
+            self._materialise_routes()
             return self.api_spec.to_dict()
         return None
 
+    def _materialise_routes(self) -> int:
+        return self.api.materialise_routes() if self.api is not None else 0
+
+    def warmup(self, *, freeze: bool = True) -> dict[str, Any]:
+        """Build lazily created state before a pre-forking server forks.
+
+        Configures mappers, builds routes deferred by ``API_LAZY_SCHEMAS``,
+        generates each model's schema fields, runs its default collection
+        read to fill the SQL compilation cache, and builds the OpenAPI spec.
+        Workers forked afterwards inherit all of it instead of rebuilding it
+        on their first requests. See :mod:`flarchitect.core.warmup`.
+
+        Call it once in the parent process, for example at the end of the app
+        factory when running gunicorn with ``--preload``.
+
+        Args:
+            freeze: Finish with :func:`gc.freeze`, which moves every object to
+                a permanent generation the collector never scans. Otherwise
+                the first collection in each worker writes to every tracked
+                object and copies the shared pages they live on.
+
+        Returns:
+            dict[str, Any]: ``routes`` materialised, ``schemas`` and
+            ``statements`` warmed, ``frozen`` objects and ``elapsed_ms``.
+        """
+        started = time.perf_counter()
+        with self.startup_profile.phase("warmup"):
+            summary: dict[str, Any] = {"routes": self._materialise_routes(), **warm_models(self)}
+            if self.api_spec is not None:
+                with self.app.app_context():
+                    self.to_api_spec()
+        if freeze:
+            gc.collect()
+            gc.freeze()
+        summary["frozen"] = gc.get_freeze_count()
+        summary["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        logger.log(2, f"Warmup built {summary['routes']} routes and {summary['statements']} statements in {summary['elapsed_ms']}ms")
+        return summary
+
     def get_config(self, key, default: Optional = None):
         """
         Gets a config value from the app config.
@@ -1061,6 +1255,10 @@ class Architect(AttributeInitialiserMixin):
     ) -> Callable:
         """Decorate an endpoint with schema, role, and OpenAPI metadata.
 
+        The schema, rate-limit and role wrappers are composed once per
+        application on the route's first request; later requests only run
+        authentication and the composed chain.
+
         Args:
             output_schema: Output schema. Defaults to ``None``.
             input_schema: Input schema. Defaults to ``None``.
@@ -1077,6 +1275,7 @@ class Architect(AttributeInitialiserMixin):
         """
 
         auth_flag = route_kwargs.get("auth")
+        route_config_key = route_kwargs.get("route_config_key")
         # Support roles provided as list/tuple/str or dict({"roles": [...], "any_of": bool})
         roles_tuple: tuple[str, ...] = ()
         roles_any_of_flag: bool = bool(route_kwargs.get("roles_any_of", False))
@@ -1088,47 +1287,77 @@ class Architect(AttributeInitialiserMixin):
             roles_tuple = tuple(roles) if isinstance(roles, list | tuple) else (str(roles),)
 
         def decorator(f: Callable) -> Callable:
-            @wraps(f)
-            def wrapped(*_args, **_kwargs):
-                auth_context = {
-                    "many": many,
-                    "is_relation": bool(route_kwargs.get("relation_name")),
-                    "relation_name": route_kwargs.get("relation_name"),
-                    "method_hint": route_kwargs.get("method"),
-                }
-
-                should_auth = self._should_enforce_auth(
+            auth_context = {
+                "many": many,
+                "is_relation": bool(route_kwargs.get("relation_name")),
+                "relation_name": route_kwargs.get("relation_name"),
+                "method_hint": route_kwargs.get("method"),
+            }
+            # Deserialise -> action -> serialise -> envelope is composed once per
+            # route; rate limits and roles wrap it on the first request for each
+            # application, as they are resolved from its config and the limiter.
+            schema_chain = self._apply_schemas(f, output_schema, input_schema, bool(many))
+            pipelines: WeakKeyDictionary[Flask, tuple[int, Callable]] = WeakKeyDictionary()
+
+            def compose_pipeline() -> Callable:
+                # With stage timing on, each layer's own work is timed by
+                # excluding the call it wraps.
+                measure = timing_enabled()
+                inner = timed(None, schema_chain) if measure else schema_chain
+                pipeline = self._apply_rate_limit(
+                    inner,
                     model=model,
                     output_schema=output_schema,
                     input_schema=input_schema,
-                    auth_flag=auth_flag,
-                    auth_context=auth_context,
                 )
+                if measure and pipeline is not inner:
+                    pipeline = timed("rate-limit", pipeline)
+
+                if roles and auth_flag is not False:
+                    from flarchitect.authentication import require_roles as _require_roles
 
-                if should_auth:
-                    self._handle_auth(
+                    inner = timed(None, pipeline) if measure else pipeline
+                    pipeline = _require_roles(*roles_tuple, any_of=roles_any_of_flag)(inner)
+                    if measure:
+                        pipeline = timed("roles", pipeline)
+
+                return pipeline
+
+            def serve(*_args, **_kwargs):
+                with stage("auth"):
+                    should_auth = self._should_enforce_auth(
                         model=model,
                         output_schema=output_schema,
                         input_schema=input_schema,
                         auth_flag=auth_flag,
-                        auth_context=auth_context,
-                        pre_resolved=should_auth,
+                        auth_context=dict(auth_context),
                     )
 
-                f_decorated = self._apply_schemas(f, output_schema, input_schema, bool(many))
-                f_decorated = self._apply_rate_limit(
-                    f_decorated,
-                    model=model,
-                    output_schema=output_schema,
-                    input_schema=input_schema,
-                )
-
-                if roles and auth_flag is not False:
-                    from flarchitect.authentication import require_roles as _require_roles
-
-                    f_decorated = _require_roles(*roles_tuple, any_of=roles_any_of_flag)(f_decorated)
+                    if should_auth:
+                        self._handle_auth(
+                            model=model,
+                            output_schema=output_schema,
+                            input_schema=input_schema,
+                            auth_flag=auth_flag,
+                            auth_context=dict(auth_context),
+                            pre_resolved=should_auth,
+                        )
+
+                app = current_app._get_current_object()
+                current = (self._config_generation, config_version(model))
+                generation, pipeline = pipelines.get(app, (None, None))
+                if pipeline is None or generation != current:
+                    pipeline = compose_pipeline()
+                    pipelines[app] = (current, pipeline)
+                return pipeline(*_args, **_kwargs)
 
-                return f_decorated(*_args, **_kwargs)
+            @wraps(f)
+            def wrapped(*_args, **_kwargs):
+                if route_config_key is None:
+                    return serve(*_args, **_kwargs)
+                # Generated routes answer config lookups from their snapshot.
+                with activate_route_config(route_config_for(current_app._get_current_object(), route_config_key)):
+                    return serve(*_args, **_kwargs)
 
             wrapped._has_schema_constructor = True
             if auth_flag is False:
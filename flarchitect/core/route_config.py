@@ -0,0 +1,305 @@
+"""Frozen per-route configuration snapshots built once at route generation.
+
+A generated ``GET`` resolves dozens of settings (serialisation, query options,
+soft delete, the response envelope) through
+:func:`~flarchitect.utils.config_helpers.get_config_or_model_meta`, each walking
+model ``Meta`` and Flask config, including for settings that are not set at
+all. :class:`RouteConfig` resolves :data:`ROUTE_CONFIG_KEYS` once in
+:meth:`RouteCreator.generate_route <flarchitect.core.routes.RouteCreator.generate_route>`
+for the route's model and HTTP method. While the route serves a request the
+snapshot is active and ``get_config_or_model_meta`` answers matching lookups
+from it.
+
+Snapshots are stored per application in ``app.extensions`` (exposed as
+``architect.route_configs``) keyed by endpoint name. Each records the
+:func:`~flarchitect.utils.config_helpers.config_version` it was resolved at
+and the route model's ``Meta`` attributes. :func:`route_config_for` resolves
+it again once ``app.config`` has been written to or the ``Meta`` has changed,
+including direct assignments, which also invalidate the lookup cache.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from flask import Flask, g, has_app_context, has_request_context
+from sqlalchemy.orm import DeclarativeBase
+
+from flarchitect.utils.config_helpers import config_version, get_config_or_model_meta, invalidate_config_cache
+
+__all__ = [
+    "ROUTE_CONFIG_KEYS",
+    "RouteConfig",
+    "activate_route_config",
+    "app_route_configs",
+    "current_route_config",
+    "resolve_route_config",
+    "route_config_for",
+]
+
+_EXTENSION_KEY = "flarchitect.route_configs"
+
+#: Settings read while serving generated routes.
+ROUTE_CONFIG_KEYS: tuple[str, ...] = (
+    # Schemas and serialisation
+    "API_ADD_RELATIONS",
+    "API_ALLOW_JOIN",
+    "API_AUTO_VALIDATE",
+    "API_BASE_SCHEMA",
+    "API_COMPILED_SERIALIZER",
+    "API_DUMP_CALLBACK",
+    "API_DUMP_HYBRID_PROPERTIES",
+    "API_ENDPOINT_CASE",
+    "API_FIELD_CASE",
+    "API_IGNORE_UNDERSCORE_ATTRIBUTES",
+    "API_SCHEMA_CASE",
+    "API_SERIALIZATION_DEPTH",
+    "API_SERIALIZATION_IGNORE_DETACHED",
+    "API_SERIALIZATION_TYPE",
+    "ALLOW_NESTED_WRITES",
+    # Querying
+    "API_ALLOW_AGGREGATION",
+    "API_ALLOW_CASCADE_DELETE",
+    "API_ALLOW_FILTERS",
+    "API_ALLOW_GROUPBY",
+    "API_ALLOW_ORDER_BY",
+    "API_ALLOW_SELECT_FIELDS",
+    "API_CACHE_TYPE",
+    "API_CASCADE_DELETE_MODE",
+    "API_FILTER_CALLBACK",
+    "API_PAGINATION_MODE",
+    "API_PAGINATION_SIZE_DEFAULT",
+    "API_PAGINATION_SIZE_MAX",
+    "API_SOFT_DELETE",
+    "API_SOFT_DELETE_ATTRIBUTE",
+    "API_SOFT_DELETE_VALUES",
+    "API_STREAMING",
+    "API_STREAM_BATCH_SIZE",
+    "API_TOTAL_COUNT_MODE",
+    # Writes
+    "API_ACCESS_POLICY",
+    "API_ADD_CALLBACK",
+    "API_BULK_ADD_CALLBACK",
+    "API_BULK_CHUNK_SIZE",
+    "API_BULK_MAX_ITEMS",
+    "API_REMOVE_CALLBACK",
+    "API_UPDATE_CALLBACK",
+    # Response envelope
+    "API_DUMP_DATETIME",
+    "API_DUMP_NULL_ERRORS",
+    "API_DUMP_NULL_NEXT_URL",
+    "API_DUMP_NULL_PREVIOUS_URL",
+    "API_DUMP_REQUEST_ID",
+    "API_DUMP_RESPONSE_MS",
+    "API_DUMP_STATUS_CODE",
+    "API_DUMP_TOTAL_COUNT",
+    "API_DUMP_VERSION",
+    "API_ERROR_CALLBACK",
+    "API_FINAL_CALLBACK",
+    "API_LOG_REQUESTS",
+    "API_PRINT_EXCEPTIONS",
+    "API_VERSION",
+    "API_XML_AS_TEXT",
+)
+
+# Lookup shapes a snapshot answers: (uses the route model, uses the route method).
+_SCOPES: tuple[tuple[bool, bool], ...] = ((False, False), (True, False), (True, True))
+
+_ResolvedKey = tuple[str, bool, bool]
+
+
+@dataclass(frozen=True)
+class RouteConfig:
+    """Settings resolved for one generated route.
+
+    Attributes:
+        endpoint: Endpoint (view function) name of the route.
+        model: Model the route serves, or ``None``.
+        method: HTTP method of the route.
+        values: Resolved values keyed by ``(lower-cased key, with model, with
+            method)``. ``None`` records a setting that is not configured, so
+            callers receive their own default.
+        version: Configuration version the values were resolved at.
+        meta: The route model's ``Meta`` attributes at that time, compared by
+            identity to pick up direct ``Meta`` assignments.
+    """
+
+    endpoint: str
+    model: type[DeclarativeBase] | None
+    method: str
+    values: Mapping[_ResolvedKey, Any]
+    version: int | None = None
+    meta: tuple[tuple[str, Any], ...] = ()
+
+    def lookup(self, key: str, model: Any = None, method: str = "IGNORE") -> tuple[bool, Any]:
+        """Return ``(found, value)`` for a ``get_config_or_model_meta`` lookup.
+
+        Args:
+            key: Setting name, e.g. ``"API_FIELD_CASE"``.
+            model: Model passed to the lookup; only ``None`` and the route's
+                model are answered.
+            method: Method passed to the lookup; only ``"IGNORE"`` and the
+                route's method are answered.
+
+        Returns:
+            tuple[bool, Any]: ``found`` is ``False`` when the snapshot does not
+            cover the lookup and it must be resolved normally.
+        """
+
+        with_model = model is not None
+        if with_model and model is not self.model:
+            return False, None
+        with_method = method != "IGNORE"
+        if with_method and (not with_model or str(method).upper() != self.method):
+            return False, None
+        resolved_key = (key.lower(), with_model, with_method)
+        if resolved_key not in self.values:
+            return False, None
+        return True, self.values[resolved_key]
+
+    def get(self, key: str, default: Any = None, *, with_model: bool = True) -> Any:
+        """Return a resolved setting, or ``default`` when it is not configured.
+
+        Args:
+            key: Setting name, e.g. ``"API_SOFT_DELETE"``.
+            default: Value returned when the setting is not configured.
+            with_model: Resolve with the route model's ``Meta`` (the default)
+                or from the application config only.
+        """
+
+        value = self.values.get((key.lower(), with_model and self.model is not None, False))
+        return default if value is None else value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly description of the snapshot."""
+
+        settings: dict[str, dict[str, Any]] = {}
+        for (key, with_model, with_method), value in self.values.items():
+            scope = "method" if with_method else "model" if with_model else "app"
+            settings.setdefault(key.upper(), {})[scope] = _describe(value)
+        return {
+            "endpoint": self.endpoint,
+            "model": getattr(self.model, "__name__", None),
+            "method": self.method,
+            "settings": settings,
+        }
+
+
+def resolve_route_config(
+    endpoint: str,
+    model: type[DeclarativeBase] | None,
+    method: str,
+    *,
+    app: Flask | None = None,
+    keys: tuple[str, ...] = ROUTE_CONFIG_KEYS,
+    memo: dict[tuple[str, Any, str], Any] | None = None,
+) -> RouteConfig:
+    """Resolve ``keys`` for a route into a :class:`RouteConfig`.
+
+    Args:
+        endpoint: Endpoint name of the route.
+        model: Model the route serves.
+        method: HTTP method of the route.
+        app: Application whose config is read when no app context is active.
+        keys: Settings to resolve.
+        memo: Optional lookup memo shared across routes resolved together, so
+            each ``(key, model, method)`` combination is resolved once.
+
+    Returns:
+        RouteConfig: The frozen snapshot.
+    """
+
+    method = method.upper()
+    memo = {} if memo is None else memo
+    values: dict[_ResolvedKey, Any] = {}
+    context = app.app_context() if app is not None and not has_app_context() else nullcontext()
+    with context:
+        for key in keys:
+            for with_model, with_method in _SCOPES:
+                if with_model and model is None:
+                    continue
+                lookup_model = model if with_model else None
+                lookup_method = method if with_method else "IGNORE"
+                memo_key = (key, lookup_model, lookup_method)
+                if memo_key not in memo:
+                    memo[memo_key] = get_config_or_model_meta(key, model=lookup_model, method=lookup_method, default=None)
+                values[(key.lower(), with_model, with_method)] = memo[memo_key]
+        version = config_version(model)
+    return RouteConfig(endpoint=endpoint, model=model, method=method, values=MappingProxyType(values), version=version, meta=_meta_items(model))
+
+
+def app_route_configs(app: Flask) -> dict[str, RouteConfig]:
+    """Return the snapshots of ``app``'s generated routes keyed by endpoint name."""
+
+    return app.extensions.setdefault(_EXTENSION_KEY, {})
+
+
+def route_config_for(app: Flask, endpoint: str) -> RouteConfig | None:
+    """Return the snapshot of ``endpoint``, resolving it again if it is stale.
+
+    Args:
+        app: Application serving the route; requires its app context.
+        endpoint: Endpoint name of the generated route.
+
+    Returns:
+        RouteConfig | None: The current snapshot, or ``None`` when the
+        endpoint has none.
+    """
+
+    configs = app_route_configs(app)
+    snapshot = configs.get(endpoint)
+    if snapshot is None:
+        return None
+    if not _same_items(_meta_items(snapshot.model), snapshot.meta):
+        # Assigned directly rather than through ``set_model_meta``.
+        invalidate_config_cache()
+    if snapshot.version != config_version(snapshot.model):
+        snapshot = configs[endpoint] = resolve_route_config(endpoint, snapshot.model, snapshot.method)
+    return snapshot
+
+
+def current_route_config() -> RouteConfig | None:
+    """Return the snapshot of the generated route serving this request, if any."""
+
+    if not has_request_context():
+        return None
+    return g.get("_flarch_route_config")
+
+
+@contextmanager
+def activate_route_config(route_config: RouteConfig | None) -> Iterator[None]:
+    """Make ``route_config`` the active snapshot for the duration of the block."""
+
+    previous = g.get("_flarch_route_config")
+    g._flarch_route_config = route_config
+    try:
+        yield
+    finally:
+        g._flarch_route_config = previous
+
+
+def _meta_items(model: Any) -> tuple[tuple[str, Any], ...]:
+    meta = getattr(model, "Meta", None)
+    return tuple(vars(meta).items()) if meta is not None else ()
+
+
+def _same_items(items: tuple[tuple[str, Any], ...], previous: tuple[tuple[str, Any], ...]) -> bool:
+    if len(items) != len(previous):
+        return False
+    return all(key == old_key and value is old_value for (key, value), (old_key, old_value) in zip(items, previous, strict=True))
+
+
+def _describe(value: Any) -> Any:
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, list | tuple | set | frozenset):
+        return [_describe(item) for item in value]
+    if isinstance(value, Mapping):
+        return {str(key): _describe(item) for key, item in value.items()}
+    if callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}".lstrip(".")
+    return repr(value)
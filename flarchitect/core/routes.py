@@ -4,6 +4,7 @@ import base64
 import binascii
 import os
 import secrets
+import threading
 import time
 from collections.abc import Callable
 from types import FunctionType
@@ -19,8 +20,12 @@ from flarchitect.authentication.token_store import rotate_refresh_token
 from flarchitect.authentication.user import get_current_user, set_current_user
 from flarchitect.core.discovery import build_schema_discovery_payload
 from flarchitect.core.docbundle import build_docs_bundle
+from flarchitect.core.route_config import resolve_route_config
 from flarchitect.core.utils import get_primary_key_info, get_url_pk
+from flarchitect.core.websockets import MUTATING_METHODS, broadcast_change
 from flarchitect.database.operations import CrudService
+from flarchitect.database.registry import ModelRegistry
+from flarchitect.database.session_router import route_session
 from flarchitect.database.utils import get_models_relationships, get_primary_keys
 from flarchitect.exceptions import CustomHTTPException, handle_http_exception
 from flarchitect.logging import logger
@@ -30,20 +35,32 @@ from flarchitect.schemas.utils import get_input_output_from_model_or_make
 from flarchitect.specs.utils import (
     endpoint_namer,
     generate_additional_query_params,
+    generate_bulk_write_query_params,
     generate_delete_query_params,
     generate_get_query_params,
     get_param_schema,
     get_tag_group,
 )
 from flarchitect.utils.config_helpers import get_config_or_model_meta
-from flarchitect.utils.core_utils import convert_case
+from flarchitect.utils.core_utils import convert_case, resolve_awaitable
 from flarchitect.utils.general import AttributeInitialiserMixin
 from flarchitect.utils.response_helpers import create_response
 from flarchitect.utils.session import get_session
+from flarchitect.utils.startup_profile import model_stage
+from flarchitect.utils.timing import stage
 
 if TYPE_CHECKING:
     from flarchitect import Architect
 
+# Pseudo-methods for collection routes mapped to the HTTP method they register.
+_COLLECTION_METHODS = {"GETS": "GET", "PATCHES": "PATCH", "DELETES": "DELETE"}
+# Collection writes are opt-in per model or globally.
+_BULK_WRITE_FLAGS = {"PATCHES": "API_ALLOW_BULK_PATCH", "DELETES": "API_ALLOW_BULK_DELETE"}
+
+
+# Stands in for schemas that ``API_LAZY_SCHEMAS`` builds on a route's first request.
+_LAZY_SCHEMA: Any = object()
+
 
 def _import_jwt_module():
     """Import the JWT helpers lazily to avoid circular dependencies."""
@@ -88,7 +105,7 @@ def _global_pre_process(service: CrudService, global_pre_hook: Callable | None,
     """
     if global_pre_hook:
         model = hook_kwargs.pop("model", None) or service.model
-        return global_pre_hook(model=model, **hook_kwargs)
+        return resolve_awaitable(global_pre_hook(model=model, **hook_kwargs))
     return hook_kwargs
 
 
@@ -105,7 +122,7 @@ def _pre_process(service: CrudService, pre_hook: Callable | None, **hook_kwargs:
     """
     if pre_hook:
         model = hook_kwargs.pop("model", None) or service.model
-        return pre_hook(model=model, **hook_kwargs)
+        return resolve_awaitable(pre_hook(model=model, **hook_kwargs))
     return hook_kwargs
 
 
@@ -123,7 +140,7 @@ def _post_process(service: CrudService, post_hook: Callable | None, output: Any,
     """
     if post_hook:
         model = hook_kwargs.pop("model", None) or service.model
-        out_val = post_hook(model=model, output=output, **hook_kwargs).get("output")
+        out_val = resolve_awaitable(post_hook(model=model, output=output, **hook_kwargs)).get("output")
         return out_val.get("output") if isinstance(out_val, dict) and "output" in out_val else out_val
     return output
 
@@ -141,6 +158,7 @@ def _route_function_factory(
     http_method: str = "GET",
     plugins: PluginManager | None = None,
     relation_name: str | None = None,
+    relation_join: Any = None,
 ) -> Callable:
     """Construct the route function tying together hooks and action.
 
@@ -154,14 +172,21 @@ def _route_function_factory(
         get_field (str | None): Field used for lookups.
         join_model (type[DeclarativeBase] | None): Related model for joins.
         output_schema (Schema | None): Schema used for output serialisation.
+        relation_join (Any): Relationship attribute resolved when a relation
+            route is generated; joins the child query to its parent.
 
     Returns:
         Callable: Configured Flask route function.
     """
 
+    # Resolved once so routes without model-op plugins skip building contexts.
+    plugin_before_op = plugins is not None and plugins.has_hook("before_model_op")
+    plugin_after_op = plugins is not None and plugins.has_hook("after_model_op")
+    broadcasts = http_method.upper() in MUTATING_METHODS
+
     def route_function(id: int | None = None, **hook_kwargs: Any) -> Any:
         # Plugin pre-hook
-        if plugins:
+        if plugin_before_op:
             ctx = {
                 "model": service.model,
                 "method": http_method,
@@ -181,12 +206,13 @@ def _route_function_factory(
         pre_kwargs.setdefault("join_model", join_model)
         pre_kwargs.setdefault("output_schema", output_schema)
         pre_kwargs.setdefault("relation_name", relation_name)
-        hook_kwargs = _global_pre_process(
-            service,
-            global_pre_hook,
-            **pre_kwargs,
-        )
-        hook_kwargs = _pre_process(service, pre_hook, **hook_kwargs)
+        with stage("pre-hook"):
+            hook_kwargs = _global_pre_process(
+                service,
+                global_pre_hook,
+                **pre_kwargs,
+            )
+            hook_kwargs = _pre_process(service, pre_hook, **hook_kwargs)
         action_kwargs: dict[str, Any] = {"lookup_val": id} if id else {}
         action_kwargs.update(hook_kwargs)
         action_kwargs["many"] = many
@@ -195,13 +221,15 @@ def _route_function_factory(
         action_kwargs["id"] = hook_kwargs.get("id")
         action_kwargs["model"] = hook_kwargs.get("model")
         action_kwargs["relation_name"] = hook_kwargs.get("relation_name")
+        action_kwargs["relation_join"] = relation_join
         action_kwargs["http_method"] = http_method
 
         output = action(**action_kwargs) or abort(404)
-        final_output = _post_process(service, post_hook, output, **hook_kwargs)
+        with stage("post-hook"):
+            final_output = _post_process(service, post_hook, output, **hook_kwargs)
 
         # Plugin post-hook
-        if plugins:
+        if plugin_after_op:
             ctx_after = {
                 "model": hook_kwargs.get("model", service.model),
                 "method": http_method,
@@ -215,20 +243,17 @@ def _route_function_factory(
             if maybe is not None:
                 final_output = maybe
 
-        # Attempt to broadcast change events to WS subscribers
-        try:
-            from flarchitect.core.websockets import broadcast_change
-
+        # Broadcast mutations to WS subscribers; best-effort and a no-op
+        # without subscribers.
+        if broadcasts:
             broadcast_change(
                 model=hook_kwargs.get("model", service.model),
                 method=http_method,
                 payload=final_output,
                 id=id,
                 many=many,
+                schema=output_schema,
             )
-        except Exception:
-            # best-effort; broadcasting should never break the response
-            pass
 
         return final_output
 
@@ -291,7 +316,10 @@ def create_query_params_from_rule(
     Returns:
         List[Dict[str, Any]]: List of query parameters.
     """
-    query_params = generate_delete_query_params(schema, model) if "DELETE" in methods else []
+    if many and "GET" not in methods and methods & {"PATCH", "DELETE"}:
+        query_params = generate_bulk_write_query_params(model)
+    else:
+        query_params = generate_delete_query_params(schema, model) if "DELETE" in methods else []
 
     if "GET" in methods and many:
         query_params.extend(generate_get_query_params(schema, model))
@@ -356,6 +384,11 @@ def create_route_function(
         "POST": service.add_object,
     }
 
+    if many:
+        # Collection-level writes compile the request filters into one statement.
+        action_map["PATCH"] = lambda **action_kwargs: service.update_objects(request.args.to_dict(flat=False), **action_kwargs)
+        action_map["DELETE"] = lambda **action_kwargs: service.delete_objects(request.args.to_dict(flat=False), **action_kwargs)
+
     action = action_map.get(method)
     return _route_function_factory(
         service,
@@ -370,6 +403,7 @@ def create_route_function(
         method,
         plugins=kwargs.get("plugins"),
         relation_name=kwargs.get("relation_name"),
+        relation_join=kwargs.get("relation_join"),
     )
 
 
@@ -400,6 +434,7 @@ class RouteCreator(AttributeInitialiserMixin):
     db_service: Callable | None = CrudService
     session: Session | list[Session] | None = None
     blueprint: Blueprint | None = None
+    model_registry: ModelRegistry | None = None
 
     def __init__(self, architect: Architect, *args, **kwargs):
         """Initialise the RouteCreator object.
@@ -412,19 +447,29 @@ class RouteCreator(AttributeInitialiserMixin):
         super().__init__(*args, **kwargs)
         self.architect = architect
         self.created_routes: dict[str, dict[str, Any]] = {}
+        self._route_config_memo: dict[tuple[str, Any, str], Any] = {}
+        self.lazy_schemas = bool(get_config_or_model_meta("API_LAZY_SCHEMAS", default=False))
+        self._pending_routes: dict[str, dict[str, Any]] = {}
+        self._route_views: dict[str, Callable] = {}
+        self._lazy_schemas: dict[type, tuple[Any, Any]] = {}
+        self._materialise_lock = threading.RLock()
         if self.api_full_auto:
             self.setup_models()
             self.validate()
             self.setup_api_routes()
 
     def setup_models(self):
-        """Set up the models for the API by adding necessary configurations."""
+        """Set up the models for the API and build the model metadata registry.
+
+        The :class:`~flarchitect.database.registry.ModelRegistry` captures
+        columns, relationships and primary keys once so request handlers do not
+        re-inspect mappers. It is exposed as ``architect.model_registry``.
+        """
         self.api_base_model = [self.api_base_model] if not isinstance(self.api_base_model, list) else self.api_base_model
 
-        for base in self.api_base_model:
-            for _ in base.__subclasses__():
-                # Add any necessary setup here for model_class
-                pass
+        bases = [base for base in self.api_base_model if base is not None]
+        self.model_registry = ModelRegistry.from_bases(bases)
+        self.architect.model_registry = self.model_registry
 
     def validate(self):
         """Validate the RiceAPI configuration."""
@@ -634,6 +679,7 @@ class RouteCreator(AttributeInitialiserMixin):
             if isinstance(depth_param, int) and depth_param > 0:
                 depth = depth_param
 
+            self.materialise_routes()
             created_routes = getattr(self, "created_routes", {}) or {}
             return build_schema_discovery_payload(
                 models=self._schema_discovery_models(created_routes),
@@ -670,6 +716,7 @@ class RouteCreator(AttributeInitialiserMixin):
         @self.architect.app.route(path, methods=["GET"])
         @self.architect.schema_constructor(**decorator_kwargs)
         def docs_bundle() -> dict[str, Any]:
+            self.materialise_routes()
             return build_docs_bundle(
                 app=self.architect.app,
                 route_spec=self.architect.route_spec,
@@ -1121,8 +1168,21 @@ class RouteCreator(AttributeInitialiserMixin):
         Returns:
             None: Routes for the model and its relations are registered.
         """
-        self._generate_relation_routes(model, session)
-        self._generate_model_routes(model, session)
+        with model_stage(self.architect, model, "relations"):
+            self._generate_relation_routes(model, session)
+        with model_stage(self.architect, model, "routes"):
+            self._generate_model_routes(model, session)
+
+    def _model_schemas(self, model: Callable) -> tuple[Any, Any]:
+        """Return the model's input and output schemas.
+
+        With ``API_LAZY_SCHEMAS`` placeholders are returned instead, and the
+        schemas are built when one of the model's routes is first requested.
+        """
+        if self.lazy_schemas:
+            return _LAZY_SCHEMA, _LAZY_SCHEMA
+        with model_stage(self.architect, model, "schemas"):
+            return get_input_output_from_model_or_make(model)
 
     def _model_route_segments(
         self,
@@ -1180,13 +1240,13 @@ class RouteCreator(AttributeInitialiserMixin):
         }
 
     def _model_route_method_allowed(self, http_method: str, policy: dict[str, Any]) -> bool:
-        check_method = http_method.removesuffix("S")
+        check_method = _COLLECTION_METHODS.get(http_method, http_method)
         allowed_methods = policy["allowed_methods"]
         allowed_from = policy["allowed_from"]
         blocked_methods = policy["blocked_methods"]
         blocked_from = policy["blocked_from"]
 
-        if policy["read_only"] and http_method in {"POST", "PATCH", "DELETE"} and http_method not in allowed_methods:
+        if policy["read_only"] and check_method in {"POST", "PATCH", "DELETE"} and check_method not in allowed_methods:
             return False
         if check_method in blocked_methods and blocked_from == "config" and allowed_from == "default":
             return False
@@ -1211,7 +1271,7 @@ class RouteCreator(AttributeInitialiserMixin):
             None: CRUD endpoints are generated for the provided model.
         """
 
-        input_schema_class, output_schema_class = get_input_output_from_model_or_make(model)
+        input_schema_class, output_schema_class = self._model_schemas(model)
         route_segments, to_url_segment, canonical_segment = self._model_route_segments(
             model,
             input_schema_class,
@@ -1227,9 +1287,12 @@ class RouteCreator(AttributeInitialiserMixin):
             return
 
         policy = self._model_route_policy(model)
-        for http_method in ["GETS", "GET", "POST", "PATCH", "DELETE"]:
+        for http_method in ["GETS", "GET", "POST", "PATCH", "DELETE", "PATCHES", "DELETES"]:
             if not self._model_route_method_allowed(http_method, policy):
                 continue
+            bulk_flag = _BULK_WRITE_FLAGS.get(http_method)
+            if bulk_flag and not get_config_or_model_meta(bulk_flag, model=model, default=False):
+                continue
 
             for segment in route_segments:
                 route_data = self._prepare_route_data(
@@ -1303,12 +1366,12 @@ class RouteCreator(AttributeInitialiserMixin):
         """
 
         many = False
-        if http_method == "GETS":
+        if http_method in _COLLECTION_METHODS:
             many = True
-            http_method = "GET"
+            http_method = _COLLECTION_METHODS[http_method]
 
         if input_schema_class is None or output_schema_class is None:
-            input_schema_class, output_schema_class = get_input_output_from_model_or_make(model)
+            input_schema_class, output_schema_class = self._model_schemas(model)
 
         canonical_segment = (canonical_segment or self._get_url_naming_function(model, input_schema_class, output_schema_class)).strip("/")
         segment = endpoint.strip("/") if isinstance(endpoint, str) else canonical_segment
@@ -1317,7 +1380,7 @@ class RouteCreator(AttributeInitialiserMixin):
         base_url = f"/{segment}"
         method = http_method
 
-        if (http_method == "GET" and not many) or http_method in ["DELETE", "PATCH"]:
+        if not many and http_method in ["GET", "DELETE", "PATCH"]:
             pk_url = get_url_pk(model)  # GET operates on a single item, so include the primary key in the URL
             base_url = f"{base_url}/{pk_url}"
 
@@ -1346,7 +1409,8 @@ class RouteCreator(AttributeInitialiserMixin):
             "url": base_url,
             "name": route_name,
             "url_segment": segment,
-            "output_schema": output_schema_class,
+            # Collection writes return affected-row counts rather than model payloads
+            "output_schema": None if many and http_method != "GET" else output_schema_class,
             "session": session,
             "input_schema": (input_schema_class if http_method in ["POST", "PATCH"] else None),
             # Attach roles for schema_constructor if configured
@@ -1367,8 +1431,8 @@ class RouteCreator(AttributeInitialiserMixin):
 
         child_model = relation_data["model"]
         parent_model = relation_data["parent"]
-        input_schema_class, output_schema_class = get_input_output_from_model_or_make(child_model)
-        pinput_schema_class, poutput_schema_class = get_input_output_from_model_or_make(parent_model)
+        input_schema_class, output_schema_class = self._model_schemas(child_model)
+        pinput_schema_class, poutput_schema_class = self._model_schemas(parent_model)
 
         key = get_primary_key_info(parent_model)
 
@@ -1425,6 +1489,9 @@ class RouteCreator(AttributeInitialiserMixin):
             # Ensure internal route name uniqueness by including relation key (idempotent)
             "name": self._compose_relation_route_name(child_model, parent_model, relation_key),
             "join_key": relation_data["right_column"],
+            # Relationship attribute the collection query joins on, resolved
+            # once here rather than rediscovered from the mappers per request
+            "relation_join": getattr(parent_model, relation_key, None) if relation_key else None,
             "output_schema": output_schema_class,
             "session": session,
             # Attach roles for schema_constructor if configured
@@ -1471,7 +1538,7 @@ class RouteCreator(AttributeInitialiserMixin):
             mdl = r.get("model")
             if mdl is None:
                 continue
-            inp, outp = get_input_output_from_model_or_make(mdl)
+            inp, outp = self._model_schemas(mdl)
             seg = self._get_url_naming_function(mdl, inp, outp)
             segments.add(seg)
         return list(segments).count(child_endpoint) > 1
@@ -1484,8 +1551,22 @@ class RouteCreator(AttributeInitialiserMixin):
         """
         kwargs["group_tag"] = get_tag_group(kwargs)
         model = kwargs.get("model", kwargs.get("child_model"))
-        service = CrudService(model=model, session=kwargs["session"])
+        lazy = kwargs.get("input_schema") is _LAZY_SCHEMA or kwargs.get("output_schema") is _LAZY_SCHEMA
+        view = self._lazy_route_view(kwargs) if lazy else self._build_route_view(kwargs)
+
+        # Register the route with Flask
+        self._add_route_to_flask(kwargs["url"], kwargs["method"], view)
+        if not kwargs.get("join_key") and not kwargs.get("url_segment"):
+            self._add_self_url_function_to_model(model)
+        self._add_to_created_routes(**kwargs)
+
+    def _build_route_view(self, kwargs: dict[str, Any]) -> Callable:
+        """Build the service, route function and decorated view for a route."""
+        model = kwargs.get("model", kwargs.get("child_model"))
         http_method = kwargs.get("method", "GET")
+        # Reads may be routed to replicas by ``API_SESSION_ROUTER``.
+        kind = "relation" if kwargs.get("relation_name") else ("collection" if kwargs.get("many") else "single")
+        service = CrudService(model=model, session=route_session(self.architect.app, model, http_method, kind, kwargs["session"]))
 
         # Ensure the route is not blocked
         # if self._is_route_blocked(http_method, model):
@@ -1499,6 +1580,7 @@ class RouteCreator(AttributeInitialiserMixin):
             get_field=kwargs.get("join_key"),
             output_schema=kwargs.get("output_schema"),
             plugins=self.architect.plugins,
+            relation_join=kwargs.get("relation_join"),
         )
 
         unique_route_function = self._create_unique_route_function(
@@ -1514,16 +1596,79 @@ class RouteCreator(AttributeInitialiserMixin):
             unique_route_function = self.architect.cache.cached(timeout=timeout)(unique_route_function)
 
         kwargs["function"] = unique_route_function
-
-        # Register the route with Flask
-        self._add_route_to_flask(
-            kwargs["url"],
-            kwargs["method"],
-            self.architect.schema_constructor(**kwargs)(unique_route_function),
+        kwargs["route_config_key"] = unique_route_function.__name__
+        self.architect.route_configs[unique_route_function.__name__] = resolve_route_config(
+            unique_route_function.__name__,
+            model,
+            http_method,
+            app=self.architect.app,
+            memo=self._route_config_memo,
         )
-        if not kwargs.get("join_key") and not kwargs.get("url_segment"):
-            self._add_self_url_function_to_model(model)
-        self._add_to_created_routes(**kwargs)
+
+        return self.architect.schema_constructor(**kwargs)(unique_route_function)
+
+    def _lazy_route_view(self, kwargs: dict[str, Any]) -> Callable:
+        """Return a view that builds the real one on its first request.
+
+        The placeholder takes the endpoint name of the real view, so URL
+        rules, ``url_for`` and spec lookups resolve the same way.
+        """
+        name = self._unique_route_name(kwargs["url"], kwargs["method"], kwargs.get("many", False), relation_name=kwargs.get("relation_name"))
+        self._pending_routes[name] = kwargs
+        views = self._route_views
+
+        def view(*args: Any, **view_kwargs: Any) -> Any:
+            return (views.get(name) or self.materialise_route(name))(*args, **view_kwargs)
+
+        view.__name__ = view.__qualname__ = name
+        return view
+
+    def materialise_route(self, name: str) -> Callable:
+        """Build the schemas, service and view of a lazily registered route.
+
+        Args:
+            name: Endpoint name of the route, without the blueprint prefix.
+
+        Returns:
+            Callable: The real view, also used for later requests.
+        """
+        with self._materialise_lock:
+            view = self._route_views.get(name)
+            if view is not None:
+                return view
+
+            kwargs = self._pending_routes.pop(name)
+            model = kwargs.get("model", kwargs.get("child_model"))
+            if model not in self._lazy_schemas:
+                with model_stage(self.architect, model, "schemas"):
+                    self._lazy_schemas[model] = get_input_output_from_model_or_make(model)
+            input_schema, output_schema = self._lazy_schemas[model]
+            if kwargs.get("input_schema") is _LAZY_SCHEMA:
+                kwargs["input_schema"] = input_schema
+            if kwargs.get("output_schema") is _LAZY_SCHEMA:
+                kwargs["output_schema"] = output_schema
+
+            route_spec = self.architect.route_spec
+            registered = len(route_spec)
+            view = self._build_route_view(kwargs)
+            self._add_to_created_routes(**kwargs)
+            if self.architect.api_spec is not None:
+                from flarchitect.specs.generator import register_routes_with_spec
+
+                register_routes_with_spec(self.architect, route_spec[registered:])
+            self._route_views[name] = view
+            return view
+
+    def materialise_routes(self) -> int:
+        """Build every route still pending under ``API_LAZY_SCHEMAS``.
+
+        Returns:
+            int: Number of routes built by this call.
+        """
+        pending = list(self._pending_routes)
+        for name in pending:
+            self.materialise_route(name)
+        return len(pending)
 
     def _is_route_blocked(self, http_method: str, model: Callable) -> bool:
         """Check if the route is blocked based on the configuration.
@@ -1538,7 +1683,7 @@ class RouteCreator(AttributeInitialiserMixin):
         blocked_methods = get_config_or_model_meta("API_BLOCK_METHODS", model=model, default=[], allow_join=True)
         read_only = get_config_or_model_meta("API_READ_ONLY", model=model, default=False)
         if read_only:
-            blocked_methods.extend(["POST", "PATCH", "DELETE"])
+            blocked_methods = [*blocked_methods, "POST", "PATCH", "DELETE"]
 
         return http_method in [x.upper() for x in blocked_methods]
 
@@ -1561,20 +1706,22 @@ class RouteCreator(AttributeInitialiserMixin):
         Returns:
             Callable: The unique route function.
         """
-        # Ensure the function name is unique by differentiating between collection and single item routes
-        base = f"route_wrapper_{http_method}_{'collection' if is_many else 'single'}_{url.replace('/', '_')}"
-        if relation_name and not base.endswith(f"_{relation_name}"):
-            base = f"{base}_{relation_name}"
-        unique_function_name = base
-
         return FunctionType(
             route_function.__code__,
             globals(),
-            unique_function_name,
+            self._unique_route_name(url, http_method, is_many, relation_name=relation_name),
             route_function.__defaults__,
             route_function.__closure__,
         )
 
+    @staticmethod
+    def _unique_route_name(url: str, http_method: str, is_many: bool = False, *, relation_name: str | None = None) -> str:
+        # Ensure the function name is unique by differentiating between collection and single item routes
+        base = f"route_wrapper_{http_method}_{'collection' if is_many else 'single'}_{url.replace('/', '_')}"
+        if relation_name and not base.endswith(f"_{relation_name}"):
+            base = f"{base}_{relation_name}"
+        return base
+
     def _add_route_to_flask(self, url: str, method: str, function: Callable):
         """Add a route to Flask.
 
@@ -1675,8 +1822,9 @@ class RouteCreator(AttributeInitialiserMixin):
             "name": route_key,
             "method": kwargs["method"],
             "url": kwargs["url"],
-            "input_schema": kwargs.get("input_schema"),
-            "output_schema": kwargs.get("output_schema"),
+            # Lazily built schemas are filled in when the route is materialised
+            "input_schema": None if kwargs.get("input_schema") is _LAZY_SCHEMA else kwargs.get("input_schema"),
+            "output_schema": None if kwargs.get("output_schema") is _LAZY_SCHEMA else kwargs.get("output_schema"),
         }
 
     def _get_url_naming_function(self, model: Callable, input_schema: Callable, output_schema: Callable) -> str:
@@ -1690,4 +1838,6 @@ class RouteCreator(AttributeInitialiserMixin):
         Returns:
             str: The URL naming string.
         """
+        if input_schema is _LAZY_SCHEMA:
+            input_schema = output_schema = None
         return get_config_or_model_meta("API_ENDPOINT_NAMER", model, default=endpoint_namer)(model, input_schema, output_schema)
@@ -0,0 +1,97 @@
+"""Pre-fork warmup for generated routes.
+
+:meth:`Architect.warmup <flarchitect.Architect.warmup>` runs the work that
+workers would otherwise repeat after ``fork``: mapper configuration, route
+materialisation (``API_LAZY_SCHEMAS``), schema field generation, SQL
+compilation and the OpenAPI spec. The results are kept in module and engine
+caches that forked workers inherit as shared pages.
+
+Statements are compiled by running each model's default collection read
+(count and first page) through :class:`~flarchitect.database.operations.CrudService`.
+Reads that fail, for example because an access policy requires a user, are
+skipped. Connections opened here are released afterwards with
+``Engine.dispose()``, so workers never share a socket inherited from the
+parent. Pools that own the database itself (``StaticPool`` and
+``SingletonThreadPool``, used for in-memory SQLite) are left as they are.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+
+from flarchitect.database.operations import CrudService
+from flarchitect.logging import logger
+from flarchitect.utils.session import get_session
+from flarchitect.utils.startup_profile import model_stage
+
+if TYPE_CHECKING:  # pragma: no cover - import for typing only
+    from flarchitect.core.architect import Architect
+
+__all__ = ["warm_models"]
+
+
+def _model_output_schemas(architect: Architect) -> dict[type, type]:
+    """Return one output schema class per model with generated routes."""
+
+    routes = architect.api.created_routes if architect.api is not None else {}
+    schemas: dict[type, type] = {}
+    for info in routes.values():
+        schema = info.get("output_schema")
+        if info.get("model") is not None and schema is not None:
+            schemas.setdefault(info["model"], type(schema))
+    return schemas
+
+
+def _warm_model(architect: Architect, model: type, schema_class: type, engines: set[Any]) -> bool:
+    """Generate ``model``'s schema fields and run its default collection read.
+
+    Returns:
+        bool: Whether the read ran and was serialised.
+    """
+
+    with model_stage(architect, model, "schemas"):
+        schema_class()
+        many_schema = schema_class(many=True)
+
+    with get_session(model) as session:
+        try:
+            result = CrudService(model=model, session=session).get_query({}, many=True, http_method="GET")
+            many_schema.dump(result.get("query") or [])
+            return True
+        except Exception as exc:
+            logger.debug(4, f"Warmup skipped the collection read of --{model.__name__}--: {exc}")
+            return False
+        finally:
+            session.rollback()
+            engines.add(session.get_bind())
+
+
+def _release_connections(engines: set[Any]) -> None:
+    for bind in engines:
+        engine = getattr(bind, "engine", bind)
+        if not isinstance(engine.pool, StaticPool | SingletonThreadPool):
+            engine.dispose()
+
+
+def warm_models(architect: Architect) -> dict[str, int]:
+    """Configure mappers and warm schema and statement caches for every model.
+
+    Args:
+        architect: The initialised :class:`~flarchitect.Architect`.
+
+    Returns:
+        dict[str, int]: ``schemas`` warmed and collection ``statements`` run.
+    """
+
+    configure_mappers()
+    schemas = _model_output_schemas(architect)
+    statements = 0
+    engines: set[Any] = set()
+    with architect.app.test_request_context():
+        for model, schema_class in schemas.items():
+            statements += _warm_model(architect, model, schema_class, engines)
+    _release_connections(engines)
+    return {"schemas": len(schemas), "statements": statements}
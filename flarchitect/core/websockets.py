@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import importlib
-import json
 import threading
 import time
 from collections import defaultdict
@@ -9,7 +8,13 @@ from dataclasses import dataclass
 from queue import Empty, Queue
 from typing import Any
 
+from sqlalchemy import inspect as sa_inspect
+
 from flarchitect.logging import logger
+from flarchitect.utils.json_encoding import json_default, json_dumps
+
+#: HTTP methods whose routes broadcast change events. Reads never publish.
+MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
 
 
 @dataclass
@@ -22,7 +27,8 @@ class _EventBus:
     """Very small in-memory pub/sub used for WebSocket broadcasting.
 
     - Topics are free-form strings (e.g. "all", "author", "book").
-    - Subscribers receive JSON-serialisable dict messages.
+    - Subscribers receive whatever was published; ``broadcast_change``
+      publishes one pre-encoded JSON string shared by every subscriber.
     - This is process-local and non-durable; intended for development and
       single-process deployments. For production, prefer a real broker
       (Redis, NATS, etc.) and swap out publish/subscribe implementations.
@@ -48,9 +54,18 @@ class _EventBus:
                     self._subs.pop(sub.topic, None)
         logger.debug(5, f"Unsubscribed queue from topic '{sub.topic}'")
 
-    def publish(self, topic: str, message: dict[str, Any]) -> None:
+    def has_subscribers(self, topic: str) -> bool:
+        """Return whether ``publish(topic, ...)`` would reach anyone.
+
+        Lock-free: a subscriber joining concurrently may miss this event,
+        which is no different from joining just after it.
+        """
+
+        return bool(self._subs.get(topic) or self._subs.get("all"))
+
+    def publish(self, topic: str, message: Any) -> None:
         with self._lock:
-            # deliver to explicit topic and to 'all'
+            # deliver to explicit topic and to 'all', once per subscriber
             targets = set(self._subs.get(topic, set())) | set(self._subs.get("all", set()))
         import contextlib
         for q in targets:
@@ -61,28 +76,53 @@ class _EventBus:
 _BUS = _EventBus()
 
 
-def broadcast_change(*, model: Any | None, method: str, payload: Any, id: Any | None = None, many: bool = False) -> None:
+def _event_payload(payload: Any, schema: Any | None) -> Any:
+    """Return ``payload`` with model instances dumped through ``schema``.
+
+    Routes broadcast the CRUD result before the response is serialised, so
+    the objects are dumped here with the route's output schema.
+    """
+
+    if isinstance(payload, tuple):
+        payload = payload[0]
+    data = payload.get("query", payload) if isinstance(payload, dict) else payload
+    many = isinstance(data, (list, tuple))
+    sample = data[0] if many and data else data
+    if schema is None or sa_inspect(sample, raiseerr=False) is None:
+        return payload
+    if isinstance(schema, type):
+        schema = schema()
+    return schema.dump(data, many=many)
+
+
+def broadcast_change(*, model: Any | None, method: str, payload: Any, id: Any | None = None, many: bool = False, schema: Any | None = None) -> None:
     """Publish a change event to WebSocket subscribers.
 
+    Returns before building the message when nobody is subscribed to the
+    model's topic or to ``all``. The message is encoded once and the same
+    string is handed to every subscriber.
+
     Args:
         model: SQLAlchemy model class the change applies to.
-        method: The HTTP method that triggered the change (GET/POST/PATCH/DELETE).
-        payload: Marshmallow-serialised output returned to the client.
+        method: The HTTP method that triggered the change (POST/PATCH/DELETE).
+        payload: Result of the CRUD action.
         id: Optional primary key for single-object operations.
         many: Whether the payload contains multiple items.
+        schema: Output schema used to dump model instances in ``payload``.
     """
     try:
         model_name = model.__name__.lower() if model is not None else "unknown"
+        if not _BUS.has_subscribers(model_name):
+            return
         message = {
             "ts": int(time.time() * 1000),
             "model": model_name,
             "method": method.upper(),
             "id": id,
             "many": bool(many),
-            "payload": payload,
+            "payload": _event_payload(payload, schema),
         }
-        _BUS.publish(model_name, message)
-        _BUS.publish("all", message)
+        _BUS.publish(model_name, json_dumps(message, default=json_default))
         logger.debug(5, f"Broadcasted WS message for '{model_name}' {method}")
     except Exception as exc:  # pragma: no cover - best effort only
         logger.debug(4, f"WebSocket broadcast skipped: {exc}")
@@ -122,7 +162,7 @@ def init_websockets(architect: Any, path: str = "/ws") -> None:  # pragma: no co
                         # keep connection alive; allow client pings to be handled
                         continue
                     try:
-                        sock.send(json.dumps(msg))
+                        sock.send(msg if isinstance(msg, str) else json_dumps(msg))
                     except Exception:
                         break
             finally:
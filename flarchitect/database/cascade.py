@@ -0,0 +1,239 @@
+"""Set-based cascade deletes planned from the mapper relationship graph.
+
+:func:`~flarchitect.database.operations.recursive_delete`, the default engine
+behind ``?cascade_delete=1``, walks relationships object by object, lazily
+loading every related collection and issuing one ``session.delete`` per row.
+For large graphs that is an N+1 per level. Setting
+``API_CASCADE_DELETE_MODE = "planned"`` (globally or as
+``Meta.cascade_delete_mode``) switches to the planner below.
+
+:func:`plan_cascade` instead derives, once per model, which tables depend on
+it: one-to-many relationships become child steps and many-to-many
+relationships delete their association rows. :func:`cascade_delete` executes
+the plan bottom-up with one ``DELETE ... WHERE fk IN (SELECT ...)`` statement
+per step, so the number of statements depends on the shape of the schema
+rather than the number of rows.
+
+Cycles are detected on the model graph: a relationship leading back to a
+model already on the current path is not followed, except for
+self-referential one-to-many relationships (trees such as categories or
+threaded comments). Their rows are collected level by level until no
+descendants are left and deleted deepest level first, one statement per
+level. Many-to-one relationships are never followed, so parents are
+preserved.
+
+The planner deliberately differs from ``recursive_delete``:
+
+* many-to-many relationships only lose their association rows; the related
+  records are kept, where ``recursive_delete`` deletes them too;
+* rows are removed with bulk ``DELETE`` statements, so ORM ``before_delete``
+  and ``after_delete`` events do not fire and dependent models' soft-delete
+  settings are not applied;
+* the route returns the rows deleted per table instead of ``None``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from sqlalchemy import ColumnElement, Table, delete, inspect, select, tuple_
+from sqlalchemy.orm import DeclarativeBase, RelationshipProperty, Session
+from sqlalchemy.orm.interfaces import MANYTOMANY, ONETOMANY
+
+from flarchitect.logging import logger
+from flarchitect.utils.config_helpers import get_config_or_model_meta
+
+__all__ = ["CascadePlan", "cascade_delete", "is_planned_cascade", "plan_cascade"]
+
+
+@dataclass(frozen=True)
+class CascadePlan:
+    """Delete plan rooted at ``model``.
+
+    Attributes:
+        model: Mapped class whose rows are deleted by this step.
+        via: Relationship from the parent step that selects this step's rows,
+            or ``None`` for the root.
+        children: Dependent steps, deleted before this one.
+        association_tables: Many-to-many relationships whose association rows
+            are deleted before this step.
+        self_references: Self-referential one-to-many relationships whose
+            descendants are deleted along with this step's rows.
+    """
+
+    model: type[DeclarativeBase]
+    via: RelationshipProperty | None
+    children: tuple[CascadePlan, ...]
+    association_tables: tuple[RelationshipProperty, ...]
+    self_references: tuple[RelationshipProperty, ...] = ()
+
+    def tables(self) -> list[str]:
+        """Return table names in execution order (dependents first)."""
+
+        names: list[str] = []
+        for child in self.children:
+            names.extend(child.tables())
+        names.extend(rel.secondary.name for rel in self.association_tables)
+        names.append(self.model.__table__.name)
+        return names
+
+
+def _build_plan(model: type[DeclarativeBase], via: RelationshipProperty | None, path: frozenset[type]) -> CascadePlan:
+    children: list[CascadePlan] = []
+    association_tables: list[RelationshipProperty] = []
+    self_references: list[RelationshipProperty] = []
+    seen_secondaries: set[Table] = set()
+
+    for rel in inspect(model).relationships:
+        if rel.viewonly:
+            continue
+        target = rel.mapper.class_
+        if rel.direction is MANYTOMANY and isinstance(rel.secondary, Table):
+            if rel.secondary not in seen_secondaries:
+                seen_secondaries.add(rel.secondary)
+                association_tables.append(rel)
+            continue
+        if rel.direction is not ONETOMANY:
+            continue
+        if target is model:
+            self_references.append(rel)
+            continue
+        if target in path:
+            logger.debug(4, f"Cascade plan for {model.__name__} skips cyclic relationship `{rel.key}` to {target.__name__}.")
+            continue
+        children.append(_build_plan(target, rel, path | {target}))
+
+    return CascadePlan(
+        model=model,
+        via=via,
+        children=tuple(children),
+        association_tables=tuple(association_tables),
+        self_references=tuple(self_references),
+    )
+
+
+def is_planned_cascade(model: type[DeclarativeBase] | None = None) -> bool:
+    """Return ``True`` when ``API_CASCADE_DELETE_MODE`` selects the planner.
+
+    Args:
+        model: Optional model whose ``Meta`` may override the global setting.
+
+    Returns:
+        bool: Whether ``?cascade_delete=1`` uses :func:`cascade_delete`.
+    """
+
+    mode = get_config_or_model_meta("API_CASCADE_DELETE_MODE", model=model, default="recursive")
+    return str(mode or "recursive").lower() == "planned"
+
+
+@cache
+def plan_cascade(model: type[DeclarativeBase]) -> CascadePlan:
+    """Return the (cached) cascade plan for ``model``.
+
+    Args:
+        model: Mapped class whose rows will be deleted.
+
+    Returns:
+        CascadePlan: Root step of the plan.
+    """
+
+    return _build_plan(model, None, frozenset({model}))
+
+
+def _in_parent(columns: list[ColumnElement], parent_columns: list[ColumnElement], parent_where: ColumnElement) -> ColumnElement:
+    """Build ``columns IN (SELECT parent_columns WHERE parent_where)``."""
+
+    subquery = select(*parent_columns).where(parent_where)
+    if len(columns) == 1:
+        return columns[0].in_(subquery)
+    return tuple_(*columns).in_(subquery)
+
+
+def _step_where(step: CascadePlan, parent_where: ColumnElement) -> ColumnElement:
+    """Return the predicate selecting ``step`` rows below a parent predicate."""
+
+    pairs = step.via.local_remote_pairs
+    return _in_parent([remote for _local, remote in pairs], [local for local, _remote in pairs], parent_where)
+
+
+def _pk_in(model: type[DeclarativeBase], keys: list[tuple[Any, ...]]) -> ColumnElement:
+    pk_columns = list(inspect(model).primary_key)
+    if len(pk_columns) == 1:
+        return pk_columns[0].in_([key[0] for key in keys])
+    return tuple_(*pk_columns).in_(keys)
+
+
+def _self_referential_levels(session: Session, step: CascadePlan, where: ColumnElement) -> list[ColumnElement]:
+    """Return predicates for ``step``'s rows and their descendants, one per level.
+
+    Primary keys are collected breadth first through the self-referential
+    relationships until a level adds no new rows, so cyclic data terminates.
+    """
+
+    pk_columns = list(inspect(step.model).primary_key)
+    frontier = [tuple(row) for row in session.execute(select(*pk_columns).where(where))]
+    seen = set(frontier)
+    levels: list[ColumnElement] = []
+    while frontier:
+        level_where = _pk_in(step.model, frontier)
+        levels.append(level_where)
+        found: list[tuple[Any, ...]] = []
+        for rel in step.self_references:
+            pairs = rel.local_remote_pairs
+            children_where = _in_parent([remote for _local, remote in pairs], [local for local, _remote in pairs], level_where)
+            found.extend(tuple(row) for row in session.execute(select(*pk_columns).where(children_where)))
+        frontier = list(dict.fromkeys(key for key in found if key not in seen))
+        seen.update(frontier)
+    return levels
+
+
+def _delete_rows(session: Session, step: CascadePlan, where: ColumnElement, counts: dict[str, int]) -> None:
+    for child in step.children:
+        _execute_plan(session, child, _step_where(child, where), counts)
+
+    for rel in step.association_tables:
+        pairs = rel.synchronize_pairs
+        assoc_where = _in_parent([assoc for _local, assoc in pairs], [local for local, _assoc in pairs], where)
+        result = session.execute(delete(rel.secondary).where(assoc_where))
+        counts[rel.secondary.name] = counts.get(rel.secondary.name, 0) + (result.rowcount or 0)
+
+    table_name = step.model.__table__.name
+    result = session.execute(delete(step.model).where(where).execution_options(synchronize_session=False))
+    counts[table_name] = counts.get(table_name, 0) + (result.rowcount or 0)
+    logger.debug(4, f"Cascade deleted {result.rowcount} row(s) from `{table_name}`.")
+
+
+def _execute_plan(session: Session, step: CascadePlan, where: ColumnElement, counts: dict[str, int]) -> None:
+    if not step.self_references:
+        _delete_rows(session, step, where, counts)
+        return
+    for level_where in reversed(_self_referential_levels(session, step, where)):
+        _delete_rows(session, step, level_where, counts)
+
+
+def cascade_delete(session: Session, obj: Any) -> dict[str, int]:
+    """Delete ``obj`` and everything that depends on it with set-based statements.
+
+    The statements run in the caller's transaction; committing (or rolling
+    back on error) is left to the caller.
+
+    Args:
+        session: Session bound to ``obj``.
+        obj: Persistent model instance to delete.
+
+    Returns:
+        dict[str, int]: Rows deleted per table name.
+    """
+
+    model = obj.__class__
+    mapper = inspect(model)
+    pk_columns = list(mapper.primary_key)
+    root_where = tuple_(*pk_columns).in_([tuple(mapper.primary_key_from_instance(obj))]) if len(pk_columns) > 1 else (
+        pk_columns[0] == mapper.primary_key_from_instance(obj)[0]
+    )
+
+    counts: dict[str, int] = {}
+    _execute_plan(session, plan_cascade(model), root_where, counts)
+    return counts
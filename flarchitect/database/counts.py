@@ -0,0 +1,216 @@
+"""Total-count strategies for paginated collections.
+
+``total_count`` has historically been computed with ``query.count()``, which
+wraps the filtered query in ``SELECT count(*) FROM (...)``. On large filtered
+joins that costs more than fetching the page itself, so
+``API_TOTAL_COUNT_MODE`` lets applications choose a cheaper strategy:
+
+``exact``
+    Run ``query.count()`` on every request (the default).
+``none``
+    Skip the count entirely; pagination links are derived from fetching one
+    row beyond the page.
+``estimated``
+    Ask the database planner for its row estimate via
+    ``API_TOTAL_COUNT_ESTIMATOR`` (PostgreSQL is supported out of the box)
+    and fall back to an exact count when no estimate is available.
+``cached``
+    Cache exact counts for ``API_TOTAL_COUNT_CACHE_TTL`` seconds keyed by the
+    model and the compiled filter signature.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+
+from flask import current_app, has_app_context
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, Query
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from flarchitect.logging import logger
+from flarchitect.utils.config_helpers import get_config_or_model_meta
+
+__all__ = [
+    "COUNT_MODES",
+    "TotalCountCache",
+    "estimate_query_count",
+    "resolve_count_mode",
+    "resolve_total_count",
+]
+
+COUNT_MODES = ("exact", "none", "estimated", "cached")
+_CACHE_EXTENSION_KEY = "flarchitect.total_count_cache"
+
+
+class TotalCountCache:
+    """Bounded, thread-safe TTL store for exact collection counts."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, int]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> int | None:
+        """Return the cached count for ``key`` if it has not expired."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, count = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return count
+
+    def set(self, key: Hashable, count: int, ttl: float) -> None:
+        """Store ``count`` for ``ttl`` seconds, evicting the oldest entries."""
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, count)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached count."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _count_cache() -> TotalCountCache:
+    """Return the count cache bound to the current application."""
+
+    return current_app.extensions.setdefault(_CACHE_EXTENSION_KEY, TotalCountCache())
+
+
+def resolve_count_mode(model: type[DeclarativeBase] | None = None) -> str:
+    """Return the configured ``API_TOTAL_COUNT_MODE`` for ``model``.
+
+    Unknown values fall back to ``"exact"`` so a typo never silently drops
+    counts from responses.
+    """
+
+    mode = str(get_config_or_model_meta("API_TOTAL_COUNT_MODE", model=model, default="exact") or "exact").lower()
+    if mode not in COUNT_MODES:
+        logger.debug(1, f"Unknown API_TOTAL_COUNT_MODE `{mode}`; using exact counts.")
+        return "exact"
+    return mode
+
+
+def _filter_signature(query: Query) -> tuple[str, str]:
+    """Normalise ``query`` into its SQL text and bound parameter values.
+
+    The compiled statement already reflects every filter, join, policy scope
+    and soft-delete clause applied to the query, so two requests only share a
+    signature when they would count the same rows.
+    """
+
+    compiled = query.statement.compile(dialect=query.session.get_bind().dialect)
+    params = json.dumps(compiled.params, sort_keys=True, default=repr)
+    return str(compiled), params
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` wrapped around a statement.
+
+    The wrapped statement is compiled with bound parameters, so filter values
+    reach the driver as parameters rather than as SQL text.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: Executable):
+        self.statement = statement
+
+
+@compiles(_ExplainJSON, "postgresql")
+def _compile_explain_json(element: _ExplainJSON, compiler, **kwargs) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}"
+
+
+def estimate_query_count(query: Query, model: type[DeclarativeBase] | None = None) -> int | None:
+    """Return the planner's row estimate for ``query`` when the dialect exposes one.
+
+    Args:
+        query: Filtered query about to be paginated.
+        model: Model being listed (unused by the default implementation).
+
+    Returns:
+        int | None: Estimated row count, or ``None`` when unsupported.
+    """
+
+    bind = query.session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+
+    plan = query.session.execute(_ExplainJSON(query.statement)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _estimated_count(query: Query, model: type[DeclarativeBase] | None) -> int | None:
+    estimator: Callable[..., int | None] = get_config_or_model_meta(
+        "API_TOTAL_COUNT_ESTIMATOR",
+        model=model,
+        default=estimate_query_count,
+    )
+    try:
+        return estimator(query, model)
+    except Exception as exc:  # pragma: no cover - estimator failures fall back to exact
+        logger.debug(1, f"Total count estimator failed ({exc}); using exact count.")
+        return None
+
+
+def _cached_count(query: Query, model: type[DeclarativeBase] | None) -> int:
+    if not has_app_context():
+        return query.count()
+
+    key = (getattr(model, "__name__", None), *_filter_signature(query))
+    cache = _count_cache()
+    count = cache.get(key)
+    if count is None:
+        count = query.count()
+        ttl = float(get_config_or_model_meta("API_TOTAL_COUNT_CACHE_TTL", model=model, default=60) or 0)
+        if ttl > 0:
+            cache.set(key, count, ttl)
+    return count
+
+
+def resolve_total_count(query: Query, model: type[DeclarativeBase] | None, mode: str) -> tuple[int | None, bool]:
+    """Compute ``total_count`` for ``query`` according to ``mode``.
+
+    Args:
+        query: Filtered query about to be paginated.
+        model: Model used for ``Meta`` overrides and cache keys.
+        mode: One of :data:`COUNT_MODES`.
+
+    Returns:
+        tuple[int | None, bool]: The count (``None`` when skipped) and whether
+        it is an estimate.
+    """
+
+    if mode == "none":
+        return None, False
+    if mode == "estimated":
+        estimate = _estimated_count(query, model)
+        if estimate is not None:
+            return estimate, True
+    if mode == "cached":
+        return _cached_count(query, model), False
+    return query.count(), False
@@ -0,0 +1,330 @@
+"""Keyset (cursor) pagination helpers.
+
+``LIMIT``/``OFFSET`` pagination forces the database to walk and discard every
+row before the requested page, so deep pages get linearly slower. Keyset
+pagination instead remembers the sort key of the last row served and asks for
+rows strictly after it, which an index on the ordering columns can answer
+directly regardless of how far into the collection the client is.
+
+Cursors are opaque, URL-safe tokens. They encode the ordering values of the
+boundary row, the paging direction and a signature of the requested ordering
+so a cursor cannot silently be replayed against a different ``order_by``.
+
+``NULL`` sorts after every other value of a nullable ordering column (last
+when ascending, first when descending) on every backend, so rows with a
+``NULL`` sort key are neither skipped nor repeated. Only the paginated
+model's own columns can be used as sort keys.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import and_, case, false, inspect, or_
+from sqlalchemy.orm import DeclarativeBase, Query
+
+from flarchitect.database.utils import create_pagination_defaults, get_table_and_column
+from flarchitect.exceptions import CustomHTTPException
+from flarchitect.utils.config_helpers import get_config_or_model_meta
+from flarchitect.utils.core_utils import convert_case
+
+__all__ = [
+    "CursorPage",
+    "decode_cursor",
+    "encode_cursor",
+    "is_cursor_pagination",
+    "keyset_paginate",
+    "resolve_keyset_order",
+]
+
+_NEXT = "n"
+_PREV = "p"
+
+
+@dataclass(frozen=True)
+class KeysetColumn:
+    """A single ordering column used to build keyset predicates."""
+
+    name: str
+    attribute: Any
+    descending: bool = False
+    nullable: bool = True
+
+
+@dataclass
+class CursorPage:
+    """Result of a keyset paginated query.
+
+    Attributes:
+        items: Rows for the requested page in display order.
+        limit: Effective page size.
+        next_cursor: Token for the following page, if any.
+        prev_cursor: Token for the preceding page, if any.
+    """
+
+    items: list[Any]
+    limit: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+def is_cursor_pagination(model: type[DeclarativeBase] | None = None) -> bool:
+    """Return ``True`` when ``API_PAGINATION_MODE`` selects keyset pagination.
+
+    Args:
+        model: Optional model whose ``Meta`` may override the global setting.
+
+    Returns:
+        bool: Whether cursor pagination is enabled for ``model``.
+    """
+
+    mode = get_config_or_model_meta("API_PAGINATION_MODE", model=model, default="page")
+    return str(mode or "page").lower() == "cursor"
+
+
+def _encode_value(value: Any) -> Any:
+    """Tag non-JSON scalars so they round-trip through the cursor."""
+
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    if isinstance(value, time):
+        return {"$t": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    if isinstance(value, uuid.UUID):
+        return {"$uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if not isinstance(value, dict) or len(value) != 1:
+        return value
+    tag, raw = next(iter(value.items()))
+    decoders = {
+        "$dt": datetime.fromisoformat,
+        "$d": date.fromisoformat,
+        "$t": time.fromisoformat,
+        "$dec": Decimal,
+        "$uuid": uuid.UUID,
+    }
+    decoder = decoders.get(tag)
+    return decoder(raw) if decoder else value
+
+
+def encode_cursor(values: Sequence[Any], direction: str, signature: str) -> str:
+    """Serialise boundary ``values`` into an opaque cursor token.
+
+    Args:
+        values: Ordering values of the boundary row.
+        direction: ``"n"`` to page forwards, ``"p"`` to page backwards.
+        signature: Ordering signature the cursor was produced for.
+
+    Returns:
+        str: URL-safe base64 token without padding.
+    """
+
+    payload = {"v": [_encode_value(value) for value in values], "d": direction, "o": signature}
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, signature: str, width: int) -> tuple[list[Any], str]:
+    """Decode a cursor token produced by :func:`encode_cursor`.
+
+    Args:
+        token: Cursor supplied by the client.
+        signature: Ordering signature of the current request.
+        width: Number of ordering columns expected in the cursor.
+
+    Returns:
+        tuple[list[Any], str]: Boundary values and paging direction.
+
+    Raises:
+        CustomHTTPException: If the token is malformed or was issued for a
+            different ordering.
+    """
+
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = [_decode_value(value) for value in payload["v"]]
+        direction = payload["d"]
+    except (binascii.Error, ValueError, TypeError, KeyError, AttributeError) as exc:
+        raise CustomHTTPException(400, "Invalid pagination cursor.") from exc
+
+    if direction not in {_NEXT, _PREV} or len(values) != width:
+        raise CustomHTTPException(400, "Invalid pagination cursor.")
+    if payload.get("o") != signature:
+        raise CustomHTTPException(400, "Pagination cursor does not match the requested ordering.")
+    return values, direction
+
+
+def resolve_keyset_order(args_dict: dict[str, Any], model: type[DeclarativeBase]) -> list[KeysetColumn]:
+    """Resolve the effective ordering columns for ``model``.
+
+    The ``order_by`` parameter is honoured (when ordering is allowed) and the
+    primary key columns are appended as a tie-breaker so the ordering is total;
+    keyset pagination would otherwise skip or repeat rows sharing a sort key.
+
+    Args:
+        args_dict: Flattened request arguments.
+        model: Model whose rows are being paginated.
+
+    Returns:
+        list[KeysetColumn]: Ordering columns in priority order.
+    """
+
+    columns: list[KeysetColumn] = []
+    order_by = args_dict.get("order_by") or args_dict.get("orderby")
+    if order_by and get_config_or_model_meta("API_ALLOW_ORDER_BY", model=model, default=True):
+        keys = order_by.split(",") if isinstance(order_by, str) else order_by
+        for order_key in keys:
+            descending = order_key.startswith("-")
+            table_name, column_name = get_table_and_column(order_key.lstrip("-"), model)
+            if table_name not in _own_table_names(model):
+                raise CustomHTTPException(400, f"Cursor pagination cannot order by `{order_key.lstrip('-')}`; only columns of {model.__name__} are supported.")
+            attribute = getattr(model, column_name, None)
+            if attribute is None:
+                raise CustomHTTPException(400, f"Invalid order_by column: {column_name}")
+            if all(col.name != column_name for col in columns):
+                columns.append(KeysetColumn(column_name, attribute, descending, _is_nullable(attribute)))
+
+    mapper = inspect(model)
+    for pk_column in mapper.primary_key:
+        pk_name = mapper.get_property_by_column(pk_column).key
+        if all(col.name != pk_name for col in columns):
+            columns.append(KeysetColumn(pk_name, getattr(model, pk_name), nullable=False))
+    return columns
+
+
+def _own_table_names(model: type[DeclarativeBase]) -> set[str]:
+    """Names a client may use to qualify one of ``model``'s own columns."""
+
+    schema_case = get_config_or_model_meta("API_SCHEMA_CASE", model=model, default="camel")
+    names = {model.__name__, model.__name__.lower(), convert_case(model.__name__, schema_case)}
+    table_name = getattr(model, "__tablename__", None)
+    if table_name:
+        names.add(table_name)
+    return names
+
+
+def _is_nullable(attribute: Any) -> bool:
+    """Return ``False`` only for attributes known to map non-nullable columns."""
+
+    columns = getattr(getattr(attribute, "property", None), "columns", None)
+    if not columns:
+        return True
+    return any(getattr(column, "nullable", True) for column in columns)
+
+
+def _order_signature(columns: Sequence[KeysetColumn]) -> str:
+    return ",".join(f"-{col.name}" if col.descending else col.name for col in columns)
+
+
+def _keyset_condition(columns: Sequence[KeysetColumn], values: Sequence[Any], direction: str):
+    """Build ``(a, b) > (x, y)`` as an ``OR`` chain honouring mixed directions.
+
+    ``NULL`` is treated as the largest value of a nullable column, matching
+    :func:`_keyset_ordering`.
+    """
+
+    clauses = []
+    for index, column in enumerate(columns):
+        after = column.descending if direction == _PREV else not column.descending
+        comparison = _beyond(column, values[index], after)
+        equals = [_equal(prior, values[pos]) for pos, prior in enumerate(columns[:index])]
+        clauses.append(and_(*equals, comparison) if equals else comparison)
+    return or_(*clauses)
+
+
+def _beyond(column: KeysetColumn, value: Any, greater: bool):
+    attribute = column.attribute
+    if not column.nullable:
+        return attribute > value if greater else attribute < value
+    if greater:
+        return false() if value is None else or_(attribute > value, attribute.is_(None))
+    return attribute.is_not(None) if value is None else attribute < value
+
+
+def _equal(column: KeysetColumn, value: Any):
+    return column.attribute.is_(None) if value is None else column.attribute == value
+
+
+def _keyset_ordering(columns: Sequence[KeysetColumn], direction: str) -> list[Any]:
+    ordering = []
+    for column in columns:
+        descending = not column.descending if direction == _PREV else column.descending
+        if column.nullable:
+            # Portable NULLS LAST (ascending) / NULLS FIRST (descending).
+            nulls = case((column.attribute.is_(None), 1), else_=0)
+            ordering.append(nulls.desc() if descending else nulls.asc())
+        ordering.append(column.attribute.desc() if descending else column.attribute.asc())
+    return ordering
+
+
+def _resolve_limit(limit: Any) -> int:
+    defaults, maximums = create_pagination_defaults()
+    if limit is None or limit == "":
+        return int(defaults["limit"])
+    if not str(limit).isnumeric():
+        raise CustomHTTPException(400, "Items per page must be an integer.")
+    limit = int(limit)
+    if limit > maximums["limit"]:
+        raise CustomHTTPException(400, f"Limit exceeds maximum value of {maximums['limit']}")
+    return limit
+
+
+def keyset_paginate(query: Query, model: type[DeclarativeBase], args_dict: dict[str, Any]) -> CursorPage:
+    """Fetch a single keyset page from ``query``.
+
+    Args:
+        query: Filtered query selecting ``model`` entities.
+        model: Model whose columns define the ordering.
+        args_dict: Flattened request arguments holding ``cursor``, ``limit``
+            and ``order_by``.
+
+    Returns:
+        CursorPage: Page items together with neighbouring cursors.
+    """
+
+    limit = _resolve_limit(args_dict.get("limit"))
+    columns = resolve_keyset_order(args_dict, model)
+    signature = _order_signature(columns)
+
+    token = args_dict.get("cursor")
+    values, direction = decode_cursor(token, signature, len(columns)) if token else (None, _NEXT)
+
+    query = query.order_by(None)
+    if values is not None:
+        query = query.filter(_keyset_condition(columns, values, direction))
+    rows = query.order_by(*_keyset_ordering(columns, direction)).limit(limit + 1).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if direction == _PREV:
+        rows.reverse()
+
+    page = CursorPage(items=rows, limit=limit)
+    if not rows:
+        return page
+
+    def boundary(row: Any, towards: str) -> str:
+        return encode_cursor([getattr(row, col.name) for col in columns], towards, signature)
+
+    if direction == _NEXT:
+        page.next_cursor = boundary(rows[-1], _NEXT) if has_more else None
+        page.prev_cursor = boundary(rows[0], _PREV) if values is not None else None
+    else:
+        page.prev_cursor = boundary(rows[0], _PREV) if has_more else None
+        page.next_cursor = boundary(rows[-1], _NEXT)
+    return page
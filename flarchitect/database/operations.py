@@ -2,10 +2,10 @@ from collections.abc import Callable, Mapping
 from typing import Any
 
 from flask import request
-from sqlalchemy import and_, inspect
+from sqlalchemy import and_, insert, inspect, or_
 from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import DeclarativeBase, Query, Session, object_session
+from sqlalchemy.orm import DeclarativeBase, Query, Session, object_session, scoped_session
 from sqlalchemy.orm.exc import UnmappedInstanceError
 
 from flarchitect.authentication.user import get_current_user
@@ -18,9 +18,11 @@ from flarchitect.core.utils import get_primary_key_info
 from flarchitect.database import utils as _db_utils
 from flarchitect.database.inspections import get_model_columns, get_model_relationships
 from flarchitect.exceptions import CustomHTTPException
+from flarchitect.logging import logger
 from flarchitect.utils.config_helpers import get_config_or_model_meta
-from flarchitect.utils.core_utils import convert_case
+from flarchitect.utils.core_utils import convert_case, resolve_awaitable
 from flarchitect.utils.decorators import add_dict_to_query, add_page_totals_and_urls
+from flarchitect.utils.timing import stage
 
 AGGREGATE_FUNCS = _db_utils.AGGREGATE_FUNCS
 create_aggregate_conditions = _db_utils.create_aggregate_conditions
@@ -118,6 +120,15 @@ class AccessPolicyWrapper:
         result = func(data=data, **kwargs)
         return True if result is None else bool(result)
 
+    def can_create_many(self, items, **kwargs) -> bool:
+        """Authorise a bulk create, falling back to ``can_create`` per item."""
+
+        func = self._lookup_callable("can_create_many", action=kwargs.get("action"))
+        if func:
+            result = func(items=items, **kwargs)
+            return True if result is None else bool(result)
+        return all(self.can_create(item, **kwargs) for item in items)
+
     def can_update(self, obj, data, **kwargs) -> bool:
         func = self._lookup_callable("can_update", action=kwargs.get("action"))
         if not func:
@@ -163,6 +174,7 @@ __all__ = [
     "get_model_columns",
     "get_model_relationships",
     "paginate_query",
+    "paginate_query_lookahead",
 ]
 
 
@@ -208,6 +220,12 @@ def paginate_query(
     validate_pagination_params(page, items_per_page)
 
     pagination_args = {"page": int(page), "per_page": int(items_per_page), "error_out": False}
+    if not hasattr(sql_query, "paginate"):
+        # Plain SQLAlchemy queries, e.g. from replica sessions chosen by
+        # ``API_SESSION_ROUTER``.
+        from flask_sqlalchemy.pagination import QueryPagination
+
+        return QueryPagination(query=sql_query, max_per_page=None, count=count, **pagination_args), default_pagination_size
     try:
         paginated = sql_query.paginate(**pagination_args, count=count)
     except TypeError:
@@ -216,6 +234,38 @@ def paginate_query(
     return paginated, default_pagination_size
 
 
+def paginate_query_lookahead(
+    sql_query: Query,
+    page: int = 1,
+    items_per_page: int | None = None,
+) -> tuple[list[Any], bool, int]:
+    """Fetch a page plus one extra row instead of counting the full result.
+
+    Args:
+        sql_query (Query): SQLAlchemy query to paginate.
+        page (int): Page number.
+        items_per_page (int): Number of items per page.
+
+    Returns:
+        tuple[list[Any], bool, int]:
+            The page items, whether a further page exists and the default
+            pagination size.
+    """
+    default_pagination_size = get_config_or_model_meta("API_PAGINATION_SIZE_DEFAULT", default=20)
+
+    if items_per_page is None:
+        items_per_page = default_pagination_size
+    if not str(page).isnumeric():
+        raise CustomHTTPException(400, "Page number must be an integer.")
+    if not str(items_per_page).isnumeric():
+        raise CustomHTTPException(400, "Items per page must be an integer.")
+
+    page = max(int(page), 1)
+    per_page = int(items_per_page) or int(default_pagination_size)
+    rows = sql_query.limit(per_page + 1).offset((page - 1) * per_page).all()
+    return rows[:per_page], len(rows) > per_page, default_pagination_size
+
+
 def apply_sorting_to_query(args_dict: dict[str, str | int], query: Query, base_model: Callable) -> Query:
     """Applies order_by conditions to a query.
 
@@ -345,6 +395,25 @@ class CrudService:
         if allowed is False:
             raise CustomHTTPException(403, "Forbidden")
 
+    def _ensure_can_create_many(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        policy: AccessPolicyWrapper | None,
+        action: str,
+    ) -> None:
+        if not policy:
+            return
+        allowed = policy.can_create_many(
+            items,
+            action=action,
+            user=get_current_user(),
+            request=request,
+            model=self.model,
+        )
+        if allowed is False:
+            raise CustomHTTPException(403, "Forbidden")
+
     def _ensure_can_update(
         self,
         obj,
@@ -425,6 +494,15 @@ class CrudService:
         Raises:
             CustomHTTPException: If the field does not represent a relationship.
         """
+        info = _db_utils.model_info(self.model)
+        if info is not None:
+            related = info.relationships.get(field_name)
+            if related is not None:
+                return related.mapper.class_
+            related_model = info.relation_aliases.get((field_name or "").strip().lower())
+            if related_model is not None:
+                return related_model
+
         relationships = inspect(self.model).relationships
         # Try direct relationship key match first
         related = relationships.get(field_name)
@@ -516,28 +594,20 @@ class CrudService:
                 query = query.join(model)
         return query
 
-    def filter_query_from_args(self, args_dict: dict[str, Any], query=None) -> Query:
-        """Build a query applying joins, filters, grouping and aggregation.
-
-        Args:
-            args_dict: Dictionary containing query parameters.
-            query: Optional existing SQLAlchemy query to build upon.
+    def _build_query_plan(self, args_dict: dict[str, Any], flat_args: dict[str, Any]) -> Any:
+        """Resolve joins, columns, projections and filter predicates for ``args_dict``."""
 
-        Returns:
-            Query with all requested transformations applied.
-        """
+        from flarchitect.database.plans import QueryPlan
 
         allow_join = get_config_or_model_meta("API_ALLOW_JOIN", model=self.model, default=False)
         join_models = get_models_for_join(args_dict, self.fetch_related_model_by_name) if allow_join else {}
-        # Use flattened args for all non-join processing
-        flat_args = _flatten_request_args(args_dict)
 
-        all_columns, all_models = get_all_columns_and_hybrids(self.model, join_models)
+        all_columns, _all_models = get_all_columns_and_hybrids(self.model, join_models)
 
         schema_case = get_config_or_model_meta("API_SCHEMA_CASE", model=self.model, default="camel")
         alias_to_model = self._query_aliases(join_models, schema_case)
 
-        conditions = [condition for condition in generate_conditions_from_args(flat_args, self.model, all_columns, all_models, join_models) if condition is not None]
+        filters = _db_utils.compile_filter_conditions(flat_args, self.model, all_columns)
 
         allow_select = get_config_or_model_meta("API_ALLOW_SELECT_FIELDS", model=self.model, default=True)
         select_fields = get_select_fields(flat_args, self.model, all_columns) if allow_select else []
@@ -547,9 +617,55 @@ class CrudService:
 
         agg_fields = self._aggregate_fields(flat_args, all_columns, alias_to_model)
 
+        return QueryPlan(
+            join_models=join_models,
+            select_fields=tuple(select_fields),
+            group_by_fields=tuple(group_by_fields),
+            agg_fields=tuple(agg_fields),
+            filters=tuple(filters),
+        )
+
+    def _query_plan(self, args_dict: dict[str, Any], flat_args: dict[str, Any]) -> Any:
+        """Return the (possibly cached) query plan for this request shape."""
+
+        from flarchitect.database.plans import get_query_plan_cache, query_plan_key
+
+        cache = get_query_plan_cache()
+        if cache is None:
+            return self._build_query_plan(args_dict, flat_args)
+        return cache.get_or_build(
+            query_plan_key(self.model, args_dict),
+            lambda: self._build_query_plan(args_dict, flat_args),
+        )
+
+    def filter_query_from_args(self, args_dict: dict[str, Any], query=None) -> Query:
+        """Build a query applying joins, filters, grouping and aggregation.
+
+        The value-independent parts (join resolution, column lookup, operator
+        parsing, projections) come from the query-plan cache; only the filter
+        values are bound per request.
+
+        Args:
+            args_dict: Dictionary containing query parameters.
+            query: Optional existing SQLAlchemy query to build upon.
+
+        Returns:
+            Query with all requested transformations applied.
+        """
+
+        # Use flattened args for all non-join processing
+        flat_args = _flatten_request_args(args_dict)
+        plan = self._query_plan(args_dict, flat_args)
+        join_models = plan.join_models
+        select_fields = list(plan.select_fields)
+        group_by_fields = list(plan.group_by_fields)
+        agg_fields = list(plan.agg_fields)
+
+        conditions = [condition for condition in _db_utils.bind_filter_conditions(list(plan.filters), flat_args) if condition is not None]
+
         query = query or self.session.query(self.model)
 
-        if allow_join and join_models:
+        if join_models:
             join_type = str(flat_args.get("join_type", "inner")).lower()
             query = self._apply_join_models(query, join_models, join_type)
 
@@ -614,13 +730,28 @@ class CrudService:
 
         return query
 
-    def _eager_loading_options(self, model: Any, eager_depth: int, eager_enabled: bool) -> list[Any]:
+    def _eager_loading_options(self, model: Any, eager_depth: int, eager_enabled: bool, field_selection: Mapping[str, str] | None = None) -> list[Any]:
         if not eager_enabled:
             return []
+        if field_selection:
+            return _eager_options_for(model, eager_depth, relationships=field_selection)
         return _eager_options_for(model, eager_depth)
 
-    def _apply_eager_loading(self, query: Query, model: Any, eager_depth: int, eager_enabled: bool) -> Query:
-        opts = self._eager_loading_options(model, eager_depth, eager_enabled)
+    def _apply_eager_loading(self, query: Query, model: Any, eager_depth: int, eager_enabled: bool, field_selection: Mapping[str, str] | None = None) -> Query:
+        # Column projections (``fields``, ``groupby``, aggregates) select no
+        # entities, so there is nothing to attach loader options to.
+        if self._keyset_model(query) is None:
+            return query
+        opts = self._eager_loading_options(model, eager_depth, eager_enabled, field_selection)
+        return query.options(*opts) if opts else query
+
+    def _apply_field_projection(self, query: Query, field_selection: Mapping[str, str] | None) -> Query:
+        """Load only the columns a ``fields=`` selection dumps (plus keys) for entity queries."""
+
+        model = self._keyset_model(query) if field_selection else None
+        if model is None:
+            return query
+        opts = _db_utils.projection_load_only(model, field_selection)
         return query.options(*opts) if opts else query
 
     def _build_single_query(
@@ -685,11 +816,15 @@ class CrudService:
         policy: AccessPolicyWrapper | None,
         action_name: str,
         many: bool,
-        eager_depth: int,
-        eager_enabled: bool,
-        other_model: Any = None,
+        relationship_attr: Any = None,
     ) -> Query:
-        query = get_related_b_query(join_model, self.model, lookup_val, self.session)
+        # Parent existence is a primary-key lookup, answered from the identity
+        # map when the parent is already loaded, instead of probing the
+        # related query with ``first()`` before counting and paging it.
+        if lookup_val is None or self.session.get(join_model, lookup_val) is None:
+            raise CustomHTTPException(404, f"{join_model.__name__} not found.")
+
+        query = get_related_b_query(join_model, self.model, lookup_val, self.session, relationship_attr=relationship_attr)
         query = self._apply_policy_scope(
             query,
             policy=policy,
@@ -697,29 +832,109 @@ class CrudService:
             many=many,
             relation_name=relation_name,
         )
-        eager_model = self.model if other_model is None else other_model
-        query = self._apply_eager_loading(query, eager_model, eager_depth, eager_enabled)
-        if query.first() is None:
-            raise CustomHTTPException(404, f"{join_model.__name__} not found.")
+        # Eager loading is applied by ``get_query`` once ``fields`` projections are known.
         return self.filter_query_from_args(args_dict, query)
 
+    @staticmethod
+    def _keyset_model(query: Query) -> Any:
+        """Return the mapped class when ``query`` selects whole entities of one model."""
+
+        descriptions = getattr(query, "column_descriptions", None) or []
+        if len(descriptions) != 1:
+            return None
+        entity = descriptions[0].get("entity")
+        return entity if entity is not None and descriptions[0].get("expr") is entity else None
+
+    def _total_count(self, query: Query) -> tuple[dict[str, Any], str]:
+        """Resolve ``total_count`` using the configured ``API_TOTAL_COUNT_MODE``."""
+
+        from flarchitect.database.counts import resolve_count_mode, resolve_total_count
+
+        mode = resolve_count_mode(self.model)
+        count, estimated = resolve_total_count(query, self.model, mode)
+        payload: dict[str, Any] = {"total_count": count}
+        if mode != "exact":
+            payload["total_count_mode"] = mode
+        if estimated:
+            payload["total_count_estimated"] = True
+        return payload, mode
+
+    def _cursor_query_payload(self, query: Query, flat_args: dict[str, Any], keyset_model: Any) -> dict[str, Any]:
+        from flarchitect.database.cursors import keyset_paginate
+
+        with stage("count"):
+            count_payload, _mode = self._total_count(query)
+        filtered_query = self.apply_soft_delete_filter(query)
+        with stage("fetch"):
+            page = keyset_paginate(filtered_query, keyset_model, flat_args)
+        return {
+            "query": page.items,
+            "limit": page.limit,
+            **count_payload,
+            "next_cursor": page.next_cursor,
+            "prev_cursor": page.prev_cursor,
+        }
+
     def _paginated_query_payload(self, query: Query, flat_args: dict[str, Any]) -> dict[str, Any]:
-        count = query.count()
+        # Resolved lazily: the recursive delete tests load this module against
+        # a stubbed ``flarchitect.database`` package.
+        from flarchitect.database.cursors import is_cursor_pagination
+
+        # Keyset pagination only applies to plain entity queries; projections
+        # (``fields``/``groupby``/aggregates) keep page/offset semantics.
+        if is_cursor_pagination(self.model) and (keyset_model := self._keyset_model(query)) is not None:
+            return self._cursor_query_payload(query, flat_args, keyset_model)
+
+        with stage("count"):
+            count_payload, count_mode = self._total_count(query)
         order_query = self.order_query(flat_args, query)
         filtered_query = self.apply_soft_delete_filter(order_query)
-        paginated_query, default_pagination_size = paginate_query(
-            filtered_query,
-            flat_args.get("page", 1),
-            flat_args.get("limit"),
-            count=False,
-        )
+
+        with stage("fetch"):
+            if count_mode == "exact":
+                paginated_query, default_pagination_size = paginate_query(
+                    filtered_query,
+                    flat_args.get("page", 1),
+                    flat_args.get("limit"),
+                    count=False,
+                )
+                items, extra = _extract_paginated_items(paginated_query), {}
+            else:
+                # Without a trustworthy count, fetch one row past the page to
+                # know whether a next page exists.
+                items, has_next, default_pagination_size = paginate_query_lookahead(
+                    filtered_query,
+                    flat_args.get("page", 1),
+                    flat_args.get("limit"),
+                )
+                extra = {"has_next": has_next}
+
         return {
-            "query": _extract_paginated_items(paginated_query),
+            "query": items,
             "limit": (int(flat_args.get("limit")) if flat_args.get("limit") else default_pagination_size),
             "page": int(flat_args.get("page")) if flat_args.get("page") else 1,
-            "total_count": count,
+            **count_payload,
+            **extra,
         }
 
+    def _streamed_query_payload(self, query: Query, flat_args: dict[str, Any], stream_format: str) -> dict[str, Any]:
+        """Order ``query`` for streaming; ``page``/``limit`` apply only when given."""
+
+        from flarchitect.utils.streaming import StreamedRows
+
+        query = self.apply_soft_delete_filter(self.order_query(flat_args, query))
+        limit = flat_args.get("limit")
+        if limit is not None:
+            page = flat_args.get("page", 1)
+            if not str(page).isnumeric():
+                raise CustomHTTPException(400, "Page number must be an integer.")
+            if not str(limit).isnumeric():
+                raise CustomHTTPException(400, "Items per page must be an integer.")
+            query = query.limit(int(limit)).offset((max(int(page), 1) - 1) * int(limit))
+
+        batch_size = int(get_config_or_model_meta("API_STREAM_BATCH_SIZE", model=self.model, default=1000) or 1000)
+        return {"query": StreamedRows(query, stream_format, batch_size)}
+
     @add_page_totals_and_urls
     @add_dict_to_query
     def get_query(
@@ -739,12 +954,19 @@ class CrudService:
             alt_field (Optional[str]): Alternate field name to lookup a single result.
             many (bool): Whether to return multiple results.
             other_model (Callable): Other model for join operations.
+            **kwargs: Route context. ``field_selection`` (set by the ``fields``
+                decorator) maps selected attributes to their dump kind; entity
+                queries then load only those columns, primary and foreign keys,
+                and eager-load only selected relationships. ``stream`` (set
+                for streamed collection reads) returns the whole filtered and
+                ordered result lazily as ``StreamedRows`` instead of a page.
 
         Returns:
             Dict[str, Any]: Dictionary with the query result and metadata.
         """
         base_model = self.model if other_model is None else other_model
         relation_name = kwargs.get("relation_name")
+        field_selection = kwargs.get("field_selection")
         policy = self._get_access_policy()
         http_method = kwargs.get("http_method", request.method)
         action_name = self._determine_action(http_method, many=many, relation_name=relation_name)
@@ -769,31 +991,33 @@ class CrudService:
                 many=False,
                 relation_name=relation_name,
             )
-            query = self._apply_eager_loading(query, base_model, eager_depth, eager_enabled)
+            query = self._apply_eager_loading(query, base_model, eager_depth, eager_enabled, field_selection)
+            query = self._apply_field_projection(query, field_selection)
             query = self._apply_single_soft_delete_filter(query, base_model)
-            return self._single_query_result(
-                query,
-                policy=policy,
-                action=action_name,
-                relation_name=relation_name,
-            )
+            with stage("fetch"):
+                return self._single_query_result(
+                    query,
+                    policy=policy,
+                    action=action_name,
+                    relation_name=relation_name,
+                )
 
         if kwargs.get("join_model"):
             join_model = kwargs.get("join_model")
-            query = self._relation_collection_query(
-                args_dict,
-                kwargs.get(get_primary_key_info(join_model)[0]),
-                join_model,
-                relation_name,
-                policy,
-                action_name,
-                many=many,
-                eager_depth=eager_depth,
-                eager_enabled=eager_enabled,
-                other_model=other_model,
-            )
+            with stage("filter"):
+                query = self._relation_collection_query(
+                    args_dict,
+                    kwargs.get(get_primary_key_info(join_model)[0]),
+                    join_model,
+                    relation_name,
+                    policy,
+                    action_name,
+                    many=many,
+                    relationship_attr=kwargs.get("relation_join"),
+                )
         else:
-            query = self.filter_query_from_args(args_dict)
+            with stage("filter"):
+                query = self.filter_query_from_args(args_dict)
             query = self._apply_policy_scope(
                 query,
                 policy=policy,
@@ -804,28 +1028,35 @@ class CrudService:
 
         # Apply eager options for general collection queries
         if hasattr(query, "options"):
-            query = self._apply_eager_loading(query, base_model, eager_depth, eager_enabled)
+            query = self._apply_eager_loading(query, base_model, eager_depth, eager_enabled, field_selection)
+            query = self._apply_field_projection(query, field_selection)
 
         callback = get_config_or_model_meta("API_FILTER_CALLBACK", model=base_model, default=None)
         if callback:
             query = callback(query, self.model, args_dict)
 
         flat_args = _flatten_request_args(args_dict)
+        if many and kwargs.get("stream"):
+            return self._streamed_query_payload(query, flat_args, kwargs["stream"])
         return self._paginated_query_payload(query, flat_args)
 
-    def add_object(self, data_dict: dict[str, Any], *args, **kwargs) -> Callable:
+    def add_object(self, data_dict: dict[str, Any] | list[dict[str, Any]], *args, **kwargs) -> Callable:
         """Adds a new object to the database.
 
         Args:
-            data_dict (Dict[str, Any]): Data to create the new object.
+            data_dict (Dict[str, Any] | list[Dict[str, Any]]): Data to create
+                the new object, or a list of items for a bulk create.
 
         Returns:
-            Callable: The created object.
+            Callable: The created object (a list of objects for bulk creates).
 
         Raises:
             IntegrityError: If there is a uniqueness constraint violation.
             DataError: If there is a data type error.
         """
+        if isinstance(data_dict, list):
+            return self.add_objects(data_dict, **kwargs)
+
         try:
             allow_nested = get_config_or_model_meta("ALLOW_NESTED_WRITES", model=self.model, default=False)
             payload = self._process_nested_relationships(self.model, data_dict.copy()) if allow_nested else data_dict
@@ -836,7 +1067,7 @@ class CrudService:
 
             callback = get_config_or_model_meta("API_ADD_CALLBACK", model=self.model, default=None)
             if callback:
-                obj = callback(obj, self.model)
+                obj = resolve_awaitable(callback(obj, self.model))
 
             self.session.add(obj)
             self.session.commit()
@@ -845,6 +1076,116 @@ class CrudService:
             self.session.rollback()
             raise CustomHTTPException(422, str(e.orig)) from e
 
+    def add_objects(self, items: list[dict[str, Any]], *args, **kwargs) -> list[Any]:
+        """Create many objects in one transaction.
+
+        Items are written in chunks of ``API_BULK_CHUNK_SIZE``. Plain column
+        payloads use ``insert().returning()`` when the dialect supports
+        ``RETURNING`` for executemany; nested writes, add callbacks and other
+        dialects go through ``session.add_all``. Authorisation uses the access
+        policy's ``can_create_many`` (falling back to ``can_create`` per item)
+        and ``API_BULK_ADD_CALLBACK`` (falling back to ``API_ADD_CALLBACK`` per
+        object).
+
+        Args:
+            items (list[Dict[str, Any]]): Deserialised items to create.
+
+        Returns:
+            list[Any]: The created objects, in request order.
+
+        Raises:
+            CustomHTTPException: ``422`` when the batch violates a constraint;
+                nothing from the batch is committed.
+        """
+        allow_nested = get_config_or_model_meta("ALLOW_NESTED_WRITES", model=self.model, default=False)
+        payloads = [self._process_nested_relationships(self.model, item.copy()) for item in items] if allow_nested else items
+        policy = self._get_access_policy()
+        action = self._determine_action(kwargs.get("http_method", request.method), many=False, relation_name=None)
+        self._ensure_can_create_many(payloads, policy=policy, action=action)
+
+        bulk_callback = get_config_or_model_meta("API_BULK_ADD_CALLBACK", model=self.model, default=None)
+        callback = get_config_or_model_meta("API_ADD_CALLBACK", model=self.model, default=None)
+        chunk_size = max(int(get_config_or_model_meta("API_BULK_CHUNK_SIZE", model=self.model, default=500) or 1), 1)
+
+        try:
+            if not (allow_nested or bulk_callback or callback) and self._supports_bulk_returning(payloads):
+                created = self._insert_returning(payloads, chunk_size)
+                # ``RETURNING`` already loaded every column; keep the instances
+                # populated so serialising them does not reload each row.
+                self._commit_without_expiring()
+                return created
+
+            objs = [self.model(**payload) for payload in payloads]
+            if bulk_callback:
+                objs = list(resolve_awaitable(bulk_callback(objs, self.model)))
+            elif callback:
+                objs = [resolve_awaitable(callback(obj, self.model)) for obj in objs]
+            for start in range(0, len(objs), chunk_size):
+                self.session.add_all(objs[start : start + chunk_size])
+                self.session.flush()
+            self.session.commit()
+            return objs
+        except (IntegrityError, DataError) as e:
+            self.session.rollback()
+            raise CustomHTTPException(422, str(e.orig)) from e
+
+    def _supports_bulk_returning(self, payloads: list[dict[str, Any]]) -> bool:
+        info = _db_utils.model_info(self.model)
+        writable_keys = info.writable_keys if info is not None else {column.key for column in inspect(self.model).columns}
+        if any(not writable_keys.issuperset(payload) for payload in payloads):
+            return False
+        dialect = self.session.get_bind().dialect
+        return bool(getattr(dialect, "insert_executemany_returning", False))
+
+    def _insert_returning(self, payloads: list[dict[str, Any]], chunk_size: int) -> list[Any]:
+        created: list[Any] = []
+        sort_key = self._parameter_order_key(payloads)
+        for start in range(0, len(payloads), chunk_size):
+            chunk = payloads[start : start + chunk_size]
+            if sort_key is None:
+                stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+                created.extend(self.session.scalars(stmt, chunk).all())
+            else:
+                rows = self.session.scalars(insert(self.model).returning(self.model), chunk).all()
+                created.extend(sorted(rows, key=sort_key))
+        return created
+
+    def _parameter_order_key(self, payloads: list[dict[str, Any]]) -> Callable[[Any], Any] | None:
+        """Return a key restoring request order for batched SQLite inserts.
+
+        SQLAlchemy only honours ``sort_by_parameter_order`` on SQLite by sending
+        one ``INSERT`` per row. SQLite assigns an integer primary key in
+        ``VALUES`` order within a statement, so a single generated integer key
+        restores the order of a batched insert instead, unless the client
+        supplies the keys itself.
+        """
+
+        if self.session.get_bind().dialect.name != "sqlite":
+            return None
+        primary_key = inspect(self.model).primary_key
+        if len(primary_key) != 1:
+            return None
+        column = primary_key[0]
+        try:
+            is_integer = column.type.python_type is int
+        except NotImplementedError:
+            return None
+        if not is_integer or column.autoincrement not in (True, "auto"):
+            return None
+        key = inspect(self.model).get_property_by_column(column).key
+        if any(key in payload for payload in payloads):
+            return None
+        return lambda obj: getattr(obj, key)
+
+    def _commit_without_expiring(self) -> None:
+        session = self.session() if isinstance(self.session, scoped_session) else self.session
+        expire_on_commit = session.expire_on_commit
+        session.expire_on_commit = False
+        try:
+            session.commit()
+        finally:
+            session.expire_on_commit = expire_on_commit
+
     def update_object(self, lookup_val: int | str, data_dict: dict[str, Any], *args, **kwargs) -> Callable:
         """Updates an existing object in the database.
 
@@ -873,8 +1214,8 @@ class CrudService:
 
             self._ensure_can_update(obj, update_payload, policy=policy, action=action)
 
-            mapper = inspect(self.model)
-            writable_keys = {column.key for column in mapper.columns}
+            info = _db_utils.model_info(self.model)
+            writable_keys = info.writable_keys if info is not None else {column.key for column in inspect(self.model).columns}
 
             for key, value in update_payload.items():
                 if key not in writable_keys:
@@ -883,7 +1224,7 @@ class CrudService:
 
             callback = get_config_or_model_meta("API_UPDATE_CALLBACK", model=self.model, default=None)
             if callback:
-                obj = callback(obj, self.model)
+                obj = resolve_awaitable(callback(obj, self.model))
 
             self.session.commit()
             return obj
@@ -915,7 +1256,7 @@ class CrudService:
 
         callback = get_config_or_model_meta("API_REMOVE_CALLBACK", model=self.model, default=None)
         if callback:
-            obj = callback(obj, self.model)
+            obj = resolve_awaitable(callback(obj, self.model))
 
         # Handle soft deletes when configured.
         if get_config_or_model_meta("API_SOFT_DELETE", model=self.model, default=False) and not cascade_delete:
@@ -929,15 +1270,28 @@ class CrudService:
             self.session.commit()
             return None, 200
 
+        # Resolved lazily: the recursive delete tests load this module against
+        # a stubbed ``flarchitect.database`` package.
+        from flarchitect.database.cascade import cascade_delete as _cascade_delete
+        from flarchitect.database.cascade import is_planned_cascade
+
         with self.session.no_autoflush:
-            self.session.delete(obj)
             try:
                 if not get_config_or_model_meta("API_ALLOW_CASCADE_DELETE", model=self.model, default=True) or request.args.get("cascade_delete") != "1":
+                    self.session.delete(obj)
                     self.session.commit()
                     return None, 200
 
-                # Perform recursive delete based on cascade_delete flag
+                if is_planned_cascade(self.model):
+                    # Dependents are removed table by table with set-based
+                    # statements planned from the relationship graph.
+                    counts = _cascade_delete(self.session, obj)
+                    self.session.commit()
+                    logger.debug(4, f"Cascade delete of {self.model.__name__} removed rows per table: {counts}")
+                    return {"deleted": counts}, 200
 
+                # Perform recursive delete based on cascade_delete flag
+                self.session.delete(obj)
                 recursive_delete(obj, cascade_delete)
                 self.session.commit()
 
@@ -952,6 +1306,128 @@ class CrudService:
 
         return None, 200
 
+    def _bulk_write_query(self, flat_args: dict[str, Any], *, policy: AccessPolicyWrapper | None, action: str) -> Query:
+        """Compile the request filters into the target set of a collection write.
+
+        Only plain filters on the model's own columns are accepted; joins,
+        projections and pagination arguments are ignored. At least one filter is
+        required so a bare ``PATCH``/``DELETE`` can never touch every row, and
+        any other argument that does not compile and bind to a condition is
+        rejected rather than dropped, which would widen the target set.
+        """
+
+        all_columns, _all_models = get_all_columns_and_hybrids(self.model, {})
+        plan = _db_utils.compile_filter_conditions(flat_args, self.model, all_columns)
+        compiled_keys = {key for key, _is_or, _steps in plan}
+        unsupported = [key for key in flat_args if key not in compiled_keys and key not in _db_utils._RESERVED_JOIN_KEYS]
+        if unsupported:
+            raise CustomHTTPException(400, f"Unsupported filter for a collection write: {', '.join(unsupported)}")
+
+        conditions = []
+        for key, is_or, steps in plan:
+            values = _db_utils.parse_or_condition_keys_and_values(key, flat_args[key])[1] if is_or else [flat_args[key]]
+            bound = [_db_utils.bind_condition(step, value) for step, value in zip(steps, values, strict=False)]
+            if len(bound) != len(steps) or any(condition is None for condition in bound):
+                raise CustomHTTPException(400, f"Invalid filter for a collection write: {key}")
+            conditions.append(or_(*bound) if is_or else bound[0])
+        if not conditions:
+            raise CustomHTTPException(400, "Collection writes require at least one filter.")
+
+        query = self.session.query(self.model).filter(*conditions)
+        query = self._apply_policy_scope(query, policy=policy, action=action, many=True, relation_name=None)
+
+        if get_config_or_model_meta("API_SOFT_DELETE", model=self.model, default=False) and not flat_args.get("include_deleted"):
+            deleted_attr = get_config_or_model_meta("API_SOFT_DELETE_ATTRIBUTE", model=self.model, default=None)
+            soft_delete_values = get_config_or_model_meta("API_SOFT_DELETE_VALUES", model=self.model, default=None)
+            if deleted_attr and soft_delete_values:
+                query = query.filter(getattr(self.model, deleted_attr) == soft_delete_values[0])
+        return query
+
+    @staticmethod
+    def _is_dry_run(flat_args: dict[str, Any]) -> bool:
+        return str(flat_args.get("dry_run", "")).strip().lower() in {"1", "true", "yes"}
+
+    def update_objects(self, args_dict: dict[str, Any], data_dict: dict[str, Any] | None = None, *args, **kwargs) -> dict[str, Any]:
+        """Apply ``data_dict`` to every row matching the request filters.
+
+        The filters are compiled with
+        :func:`~flarchitect.database.utils.generate_conditions_from_args` and
+        the access policy's ``scope_query`` into a single ``UPDATE ... WHERE``
+        statement. Per-object hooks (``can_update``, ``API_UPDATE_CALLBACK``)
+        are not invoked.
+
+        Args:
+            args_dict (Dict[str, Any]): Request arguments holding the filters
+                and an optional ``dry_run`` flag.
+            data_dict (Dict[str, Any] | None): Validated column values to set.
+
+        Returns:
+            Dict[str, Any]: ``affected`` row count and the ``dry_run`` flag.
+
+        Raises:
+            CustomHTTPException: ``400`` without filters or writable values,
+                ``422`` on constraint violations.
+        """
+        flat_args = _flatten_request_args(args_dict)
+        policy = self._get_access_policy()
+        action = self._determine_action(kwargs.get("http_method", request.method), many=True, relation_name=None)
+
+        info = _db_utils.model_info(self.model)
+        writable_keys = info.writable_keys if info is not None else {column.key for column in inspect(self.model).columns}
+        values = {key: value for key, value in (data_dict or {}).items() if key in writable_keys}
+        if not values:
+            raise CustomHTTPException(400, "No writable fields supplied.")
+
+        query = self._bulk_write_query(flat_args, policy=policy, action=action)
+        if self._is_dry_run(flat_args):
+            return {"affected": query.count(), "dry_run": True}
+
+        try:
+            affected = query.update(values, synchronize_session=False)
+            self.session.commit()
+        except (IntegrityError, DataError) as e:
+            self.session.rollback()
+            raise CustomHTTPException(422, str(e.orig)) from e
+        return {"affected": affected, "dry_run": False}
+
+    def delete_objects(self, args_dict: dict[str, Any], *args, **kwargs) -> dict[str, Any]:
+        """Delete every row matching the request filters in one statement.
+
+        Soft-delete models receive a bulk ``UPDATE`` of
+        ``API_SOFT_DELETE_ATTRIBUTE`` instead. ORM cascades, ``can_delete`` and
+        ``API_REMOVE_CALLBACK`` are not applied; rows that are still referenced
+        make the request fail with ``409``.
+
+        Args:
+            args_dict (Dict[str, Any]): Request arguments holding the filters
+                and an optional ``dry_run`` flag.
+
+        Returns:
+            Dict[str, Any]: ``affected`` row count and the ``dry_run`` flag.
+        """
+        flat_args = _flatten_request_args(args_dict)
+        policy = self._get_access_policy()
+        action = self._determine_action(kwargs.get("http_method", request.method), many=True, relation_name=None)
+
+        query = self._bulk_write_query(flat_args, policy=policy, action=action)
+        if self._is_dry_run(flat_args):
+            return {"affected": query.count(), "dry_run": True}
+
+        try:
+            if get_config_or_model_meta("API_SOFT_DELETE", model=self.model, default=False):
+                deleted_attr = get_config_or_model_meta("API_SOFT_DELETE_ATTRIBUTE", model=self.model, default=None)
+                soft_delete_values = get_config_or_model_meta("API_SOFT_DELETE_VALUES", model=self.model, default=None)
+                if not deleted_attr or not soft_delete_values:
+                    raise CustomHTTPException(500, "Soft delete misconfigured")
+                affected = query.update({deleted_attr: soft_delete_values[1]}, synchronize_session=False)
+            else:
+                affected = query.delete(synchronize_session=False)
+            self.session.commit()
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            raise CustomHTTPException(409, "Error deleting objects") from e
+        return {"affected": affected, "dry_run": False}
+
 
 def _mapped_object_id(obj: Any) -> tuple[type[Any], tuple[Any, ...]]:
     mapper = inspect(obj.__class__)
@@ -975,7 +1451,7 @@ def _related_delete_candidates(obj: Any, parent: Any, visited: set[tuple[type[An
             continue
 
         if relationship.direction.name == "MANYTOONE":
-            print(f"Skipping deletion of parent object {related_objects.__class__.__name__}")
+            logger.debug(4, f"Skipping deletion of parent object {related_objects.__class__.__name__}")
             continue
 
         if _mapped_object_id(related_objects) not in visited:
@@ -987,8 +1463,11 @@ def recursive_delete(obj, cascade_delete=True, visited=None, objects_touched=Non
 
     Why/How:
         Traverses relationships to remove dependent records when permitted.
-        Tracks visited instances to avoid cycles and redundant operations,
-        reducing database round-trips on complex graphs.
+        Tracks visited instances to avoid cycles and redundant operations.
+        Every related collection is loaded and each row deleted through the
+        session, so ORM events fire. This is the default
+        ``?cascade_delete=1`` engine; ``API_CASCADE_DELETE_MODE = "planned"``
+        switches to :func:`flarchitect.database.cascade.cascade_delete`.
 
     Args:
         obj: The SQLAlchemy model instance to delete.
@@ -1020,13 +1499,13 @@ def recursive_delete(obj, cascade_delete=True, visited=None, objects_touched=Non
 
     # Log the source object when it's first called and add it to the touched list
     objects_touched.append((obj.__class__.__name__, obj_identifier[1]))
-    print(f"Processing deletion for object: {obj.__class__.__name__} with ID: {obj_identifier[1]}")
+    logger.debug(4, f"Processing deletion for object: {obj.__class__.__name__} with ID: {obj_identifier[1]}")
 
     for related_obj in _related_delete_candidates(obj, parent, visited):
         recursive_delete(related_obj, cascade_delete, visited, objects_touched, obj)
 
     # Log the actual deletion of the source object
-    print(f"Deleting object: {obj.__class__.__name__} with ID: {obj_identifier[1]}")
+    logger.debug(4, f"Deleting object: {obj.__class__.__name__} with ID: {obj_identifier[1]}")
     session.delete(obj)
 
     return objects_touched
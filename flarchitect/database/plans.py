@@ -0,0 +1,162 @@
+"""Query-plan cache for the filter/sort/join grammar.
+
+Every collection request used to re-resolve join tokens, gather column maps,
+parse each filter key against :data:`~flarchitect.database.constants.OPERATORS`
+and rebuild select/group/aggregate expressions. Real traffic is dominated by a
+small number of query *shapes* that only differ in literal values, so the
+resolved pieces are cached per application, keyed by the model, the shape of
+the request arguments and the configuration that influences resolution. A
+cache hit only has to bind the request values.
+
+Values are always bound as SQL parameters, so SQLAlchemy's own compiled
+statement cache takes care of reusing the rendered SQL for repeated shapes.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from flask import current_app, has_app_context
+from sqlalchemy.orm import DeclarativeBase
+
+from flarchitect.database.utils import _ensure_string_list, parse_or_condition_keys_and_values
+from flarchitect.utils.config_helpers import get_config_or_model_meta
+
+__all__ = [
+    "QueryPlan",
+    "QueryPlanCache",
+    "get_query_plan_cache",
+    "query_plan_key",
+]
+
+_CACHE_EXTENSION_KEY = "flarchitect.query_plan_cache"
+# Keys whose *values* change how the query is built (not just bound literals).
+_STRUCTURAL_VALUE_KEYS = frozenset({"join", "join_models", "join_type", "fields", "groupby"})
+# Settings consulted while resolving a plan; part of the key so ``Meta`` or
+# config changes never serve a stale plan.
+_PLAN_CONFIG_KEYS = (
+    "API_ALLOW_JOIN",
+    "API_ALLOW_FILTERS",
+    "API_ALLOW_SELECT_FIELDS",
+    "API_ALLOW_GROUPBY",
+    "API_ALLOW_AGGREGATION",
+    "API_SCHEMA_CASE",
+    "API_FIELD_CASE",
+    "API_ENDPOINT_CASE",
+    "API_IGNORE_UNDERSCORE_ATTRIBUTES",
+)
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """Resolved, value-free parts of a collection query.
+
+    Attributes:
+        join_models: Join tokens mapped to model classes.
+        select_fields: Columns for ``fields=`` projections.
+        group_by_fields: Columns for ``groupby=``.
+        agg_fields: Labelled aggregate expressions.
+        filters: Output of
+            :func:`~flarchitect.database.utils.compile_filter_conditions`.
+    """
+
+    join_models: dict[str, type[DeclarativeBase]]
+    select_fields: tuple[Any, ...]
+    group_by_fields: tuple[Any, ...]
+    agg_fields: tuple[Any, ...]
+    filters: tuple[Any, ...]
+
+
+class QueryPlanCache:
+    """Bounded, thread-safe LRU of :class:`QueryPlan` objects with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._plans: OrderedDict[Hashable, QueryPlan] = OrderedDict()
+        self._lock = Lock()
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], QueryPlan]) -> QueryPlan:
+        """Return the cached plan for ``key`` or build and store it.
+
+        Builders that raise (e.g. invalid column names) are not cached, so the
+        error is raised again for every offending request.
+        """
+
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+
+        plan = builder()
+        if self.maxsize > 0:
+            with self._lock:
+                self._plans[key] = plan
+                self._plans.move_to_end(key)
+                while len(self._plans) > self.maxsize:
+                    self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        """Drop all plans and reset the counters."""
+
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return ``hits``, ``misses``, ``size`` and ``maxsize``."""
+
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._plans), "maxsize": self.maxsize}
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+def get_query_plan_cache() -> QueryPlanCache | None:
+    """Return the query-plan cache for the current application.
+
+    The cache is created on first use with ``API_QUERY_PLAN_CACHE_SIZE``
+    entries. ``None`` is returned outside an application context.
+    """
+
+    if not has_app_context():
+        return None
+    cache = current_app.extensions.get(_CACHE_EXTENSION_KEY)
+    if cache is None:
+        size = int(get_config_or_model_meta("API_QUERY_PLAN_CACHE_SIZE", default=256) or 0)
+        cache = current_app.extensions.setdefault(_CACHE_EXTENSION_KEY, QueryPlanCache(size))
+    return cache
+
+
+def _shape_of(key: str, value: Any) -> Any:
+    if key in _STRUCTURAL_VALUE_KEYS:
+        return tuple(_ensure_string_list(value))
+    if key.startswith("or["):
+        first = value[0] if isinstance(value, (list, tuple)) else value
+        or_keys, _or_vals = parse_or_condition_keys_and_values(key, first)
+        return tuple(or_keys)
+    return None
+
+
+def query_plan_key(model: type[DeclarativeBase], args_dict: dict[str, Any]) -> Hashable:
+    """Build the cache key for ``args_dict`` against ``model``.
+
+    Filter values are dropped; only argument names, the values of structural
+    arguments (``join``, ``fields``, ``groupby`` ...), the condition keys inside
+    ``or[...]`` groups and the relevant configuration contribute.
+    """
+
+    shape = tuple((key, _shape_of(key, args_dict[key])) for key in sorted(args_dict))
+    config = tuple(get_config_or_model_meta(name, model=model, default=None) for name in _PLAN_CONFIG_KEYS)
+    return model, shape, config
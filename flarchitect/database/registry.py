@@ -0,0 +1,168 @@
+"""Immutable per-model metadata built once at route setup.
+
+List endpoints used to re-inspect SQLAlchemy mappers on every request to find
+columns, hybrids, relationships and primary keys. :class:`ModelRegistry`
+captures that metadata once in :meth:`RouteCreator.setup_models
+<flarchitect.core.routes.RouteCreator.setup_models>` and the hot-path helpers
+read from it through :func:`model_info`.
+
+Models that are not part of the registry (ad-hoc models in tests, models
+outside ``API_BASE_MODEL``) make :func:`model_info` return ``None`` and callers
+fall back to inspecting the mapper, so helpers behave the same with or without
+a registry.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from flask import current_app, has_app_context
+from sqlalchemy import inspect
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import DeclarativeBase, InstrumentedAttribute, RelationshipProperty
+
+from flarchitect.utils.config_helpers import get_config_or_model_meta
+from flarchitect.utils.core_utils import convert_case
+
+__all__ = ["ModelInfo", "ModelRegistry", "describe_model", "model_info"]
+
+
+@dataclass(frozen=True)
+class ModelInfo:
+    """Introspected metadata for a single mapped class.
+
+    Attributes:
+        model: The mapped class.
+        columns: Column attributes and hybrids keyed by attribute name.
+        public_columns: ``columns`` without ``_``-prefixed attributes.
+        hybrids: Names of hybrid properties.
+        primary_key_names: Primary-key column names in mapper order.
+        relationships: Relationship properties keyed by relationship name.
+        relation_aliases: Lower-cased relationship keys, endpoint names and
+            endpoint-cased keys mapped to the related class.
+        relation_keys_by_target: Related class name mapped to the first
+            relationship key pointing at it.
+        writable_keys: Column keys that may be assigned on update.
+    """
+
+    model: type[DeclarativeBase]
+    columns: Mapping[str, hybrid_property | InstrumentedAttribute]
+    public_columns: Mapping[str, hybrid_property | InstrumentedAttribute]
+    hybrids: frozenset[str]
+    primary_key_names: tuple[str, ...]
+    relationships: Mapping[str, RelationshipProperty]
+    relation_aliases: Mapping[str, type[DeclarativeBase]]
+    relation_keys_by_target: Mapping[str, str]
+    writable_keys: frozenset[str]
+
+    def primary_key_values(self, obj: Any) -> tuple[Any, ...]:
+        """Return the primary-key values of ``obj``."""
+
+        return tuple(getattr(obj, name) for name in self.primary_key_names)
+
+
+def _relation_aliases(relationships: Iterable[RelationshipProperty]) -> dict[str, type[DeclarativeBase]]:
+    # Imported lazily: ``specs.utils`` pulls in the schema layer.
+    from flarchitect.specs.utils import endpoint_namer
+
+    endpoint_case = get_config_or_model_meta("API_ENDPOINT_CASE", default="kebab") or "kebab"
+    aliases: dict[str, type[DeclarativeBase]] = {}
+    for rel in relationships:
+        model_cls = rel.mapper.class_
+        for alias in (endpoint_namer(model_cls).lower(), convert_case(rel.key, endpoint_case).lower(), rel.key.lower()):
+            aliases.setdefault(alias, model_cls)
+    return aliases
+
+
+def describe_model(model: type[DeclarativeBase]) -> ModelInfo:
+    """Introspect ``model`` into a :class:`ModelInfo`.
+
+    Args:
+        model: Mapped SQLAlchemy class.
+
+    Returns:
+        ModelInfo: Frozen metadata for ``model``.
+    """
+
+    mapper = inspect(model)
+    columns = {attr: column for attr, column in model.__dict__.items() if isinstance(column, hybrid_property | InstrumentedAttribute)}
+    relationships = dict(mapper.relationships.items())
+
+    relation_keys_by_target: dict[str, str] = {}
+    for rel in mapper.relationships:
+        relation_keys_by_target.setdefault(rel.mapper.class_.__name__, rel.key)
+
+    return ModelInfo(
+        model=model,
+        columns=MappingProxyType(columns),
+        public_columns=MappingProxyType({attr: column for attr, column in columns.items() if not attr.startswith("_")}),
+        hybrids=frozenset(attr for attr, column in columns.items() if isinstance(column, hybrid_property)),
+        primary_key_names=tuple(column.name for column in mapper.primary_key),
+        relationships=MappingProxyType(relationships),
+        relation_aliases=MappingProxyType(_relation_aliases(mapper.relationships)),
+        relation_keys_by_target=MappingProxyType(relation_keys_by_target),
+        writable_keys=frozenset(column.key for column in mapper.columns),
+    )
+
+
+class ModelRegistry:
+    """Read-only mapping of mapped classes to their :class:`ModelInfo`."""
+
+    __slots__ = ("_infos",)
+
+    def __init__(self, infos: Mapping[type[DeclarativeBase], ModelInfo] | None = None):
+        self._infos: Mapping[type[DeclarativeBase], ModelInfo] = MappingProxyType(dict(infos or {}))
+
+    @classmethod
+    def from_bases(cls, bases: Iterable[Any]) -> ModelRegistry:
+        """Describe every class mapped under the given declarative bases.
+
+        Uses the SQLAlchemy registry when available so related models that are
+        not direct subclasses (and therefore may appear as join targets) are
+        included too.
+        """
+
+        models: dict[type[DeclarativeBase], None] = {}
+        for base in bases:
+            sa_registry = getattr(base, "registry", None)
+            mappers = getattr(sa_registry, "mappers", None)
+            if mappers:
+                models.update(dict.fromkeys(mapper.class_ for mapper in mappers))
+            else:
+                models.update(dict.fromkeys(sub for sub in base.__subclasses__() if hasattr(sub, "__table__")))
+        return cls({model: describe_model(model) for model in models})
+
+    def get(self, model: type[DeclarativeBase]) -> ModelInfo | None:
+        """Return metadata for ``model`` or ``None`` if it is not registered."""
+
+        return self._infos.get(model)
+
+    def __contains__(self, model: object) -> bool:
+        return model in self._infos
+
+    def __iter__(self):
+        return iter(self._infos)
+
+    def __len__(self) -> int:
+        return len(self._infos)
+
+
+def _active_registry() -> ModelRegistry | None:
+    if not has_app_context():
+        return None
+    architect = current_app.extensions.get("flarchitect")
+    return getattr(architect, "model_registry", None)
+
+
+def model_info(model: type[DeclarativeBase]) -> ModelInfo | None:
+    """Return registry metadata for ``model`` in the current application.
+
+    Returns ``None`` outside an application context or when ``model`` was not
+    registered; callers then fall back to inspecting the mapper directly.
+    """
+
+    registry = _active_registry()
+    return registry.get(model) if registry is not None else None
@@ -0,0 +1,200 @@
+"""Per-route session routing for read replicas (``API_SESSION_ROUTER``).
+
+Routes normally share the one session found by
+:func:`~flarchitect.utils.session.get_session`, so read-heavy traffic lands on
+the primary database. ``API_SESSION_ROUTER`` maps route kinds to session
+factories; generated routes then receive a proxy that opens the routed
+session lazily, once per request, and closes it on teardown.
+
+Keys are looked up from most to least specific:
+
+``"<METHOD>:relation"``
+    Relation routes such as ``GET /authors/1/books``.
+``"<METHOD>:collection"`` / ``"<METHOD>:single"``
+    Collection or single-object routes.
+``"<METHOD>"``
+    Any route for the HTTP method, e.g. ``"GET"``.
+``"read"`` / ``"write"``
+    ``GET`` routes versus ``POST``, ``PATCH`` and ``DELETE`` routes.
+``"default"``
+    Everything else.
+
+Values are callables returning a :class:`~sqlalchemy.orm.Session` (for example
+a ``sessionmaker``), or ``None`` to use the regular session. Keys without a
+match also use the regular session, so only replicas need declaring. A model's
+``Meta.session_router`` is merged over the global mapping.
+
+With ``API_SESSION_STICKY_SECONDS`` set, a client that just performed a write
+has its reads routed to the regular session for that many seconds
+(read-your-writes). Clients are identified by the authenticated user, then by
+their ``Authorization``/``X-API-Key`` header, then by remote address.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from flask import Flask, g, has_request_context, request
+from sqlalchemy.orm import DeclarativeBase, Session
+from werkzeug.local import LocalProxy
+
+from flarchitect.authentication.user import get_current_user
+from flarchitect.utils.config_helpers import get_config_or_model_meta
+
+__all__ = ["SessionRouter", "route_session", "session_router_config"]
+
+_EXTENSION_KEY = "flarchitect.session_router"
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Expired read-your-writes entries are pruned once the table grows past this.
+_STICKY_PRUNE_SIZE = 1024
+
+
+def session_router_config(model: type[DeclarativeBase] | None = None) -> dict[str, Any]:
+    """Return the effective router mapping for ``model`` (global merged with ``Meta``)."""
+
+    global_routes = get_config_or_model_meta("API_SESSION_ROUTER", default=None) or {}
+    model_routes = (get_config_or_model_meta("API_SESSION_ROUTER", model=model, default=None) or {}) if model is not None else {}
+    return {**global_routes, **model_routes}
+
+
+def _route_keys(method: str, kind: str) -> tuple[str, ...]:
+    method = method.upper()
+    access = "read" if method in _READ_METHODS else "write"
+    return (f"{method}:{kind}", method, access, "default")
+
+
+def _resolve_factory(routes: Mapping[str, Any], method: str, kind: str) -> Callable[[], Session] | None:
+    for key in _route_keys(method, kind):
+        if key in routes:
+            return routes[key]
+    return None
+
+
+def _client_key() -> str:
+    user = get_current_user()
+    if user is not None:
+        from flarchitect.database.registry import model_info
+
+        info = model_info(type(user))
+        pk = info.primary_key_values(user) if info is not None else getattr(user, "id", None)
+        return f"user:{type(user).__name__}:{pk}"
+
+    token = request.headers.get("Authorization") or request.headers.get("X-API-Key")
+    if token:
+        return "token:" + hashlib.sha256(token.encode()).hexdigest()
+    return f"addr:{request.remote_addr}"
+
+
+class SessionRouter:
+    """Per-application state for routed sessions.
+
+    Holds the read-your-writes table and closes the sessions opened for a
+    request on teardown. Installed once per app by :meth:`install`.
+    """
+
+    def __init__(self, sticky_seconds: float = 0):
+        self.sticky_seconds = float(sticky_seconds or 0)
+        self._sticky_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def install(cls, app: Flask) -> SessionRouter:
+        """Attach a router to ``app`` (idempotent) and register its teardown."""
+
+        router = app.extensions.get(_EXTENSION_KEY)
+        if router is None:
+            router = cls(app.config.get("API_SESSION_STICKY_SECONDS", 0))
+            app.extensions[_EXTENSION_KEY] = router
+            app.teardown_request(cls._close_sessions)
+        return router
+
+    @staticmethod
+    def _close_sessions(exception: BaseException | None = None) -> None:
+        # ``g`` can outlive the request when an app context was pushed
+        # beforehand, so per-request routing state is cleared explicitly.
+        g.pop("_flarch_session_choices", None)
+        g.pop("_flarch_write_recorded", None)
+        for session in g.pop("_flarch_routed_sessions", {}).values():
+            session.close()
+
+    def record_write(self, client: str) -> None:
+        """Pin ``client`` to the regular session for the sticky window."""
+
+        if self.sticky_seconds <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if len(self._sticky_until) >= _STICKY_PRUNE_SIZE:
+                self._sticky_until = {key: until for key, until in self._sticky_until.items() if until > now}
+            self._sticky_until[client] = now + self.sticky_seconds
+
+    def is_sticky(self, client: str) -> bool:
+        """Return whether ``client`` wrote within the sticky window."""
+
+        until = self._sticky_until.get(client)
+        return until is not None and until > time.monotonic()
+
+    def session_for(self, model: type[DeclarativeBase], method: str, kind: str, default: Session) -> Session:
+        """Return the session serving the current request for this route.
+
+        Args:
+            model: Model served by the route.
+            method: HTTP method of the route.
+            kind: ``"single"``, ``"collection"`` or ``"relation"``.
+            default: Session used when no factory applies.
+
+        Returns:
+            Session: The routed session, opened at most once per request and
+            factory.
+        """
+
+        choices: dict[tuple[Any, str, str], Session] = g.setdefault("_flarch_session_choices", {})
+        key = (model, method, kind)
+        if key not in choices:
+            choices[key] = self._choose(model, method, kind, default)
+        return choices[key]
+
+    def _choose(self, model: type[DeclarativeBase], method: str, kind: str, default: Session) -> Session:
+        is_read = method.upper() in _READ_METHODS
+        client = _client_key() if self.sticky_seconds > 0 and has_request_context() else None
+        if client is not None and not is_read and not g.get("_flarch_write_recorded"):
+            g._flarch_write_recorded = True
+            self.record_write(client)
+
+        factory = _resolve_factory(session_router_config(model), method, kind)
+        if factory is None or (is_read and client is not None and self.is_sticky(client)):
+            return default
+
+        opened: dict[int, Session] = g.setdefault("_flarch_routed_sessions", {})
+        session = opened.get(id(factory))
+        if session is None:
+            session = opened[id(factory)] = factory()
+        return session
+
+
+def route_session(app: Flask, model: type[DeclarativeBase], method: str, kind: str, default: Session) -> Session:
+    """Return the session a generated route should hand to its ``CrudService``.
+
+    Without a router mapping for ``model`` this is ``default`` itself;
+    otherwise a proxy resolving :meth:`SessionRouter.session_for` per request.
+
+    Args:
+        app: Application the route is registered on.
+        model: Model served by the route.
+        method: HTTP method of the route.
+        kind: ``"single"``, ``"collection"`` or ``"relation"``.
+        default: Session resolved for the model at setup.
+
+    Returns:
+        Session: ``default`` or a per-request session proxy.
+    """
+
+    if not session_router_config(model):
+        return default
+
+    router = SessionRouter.install(app)
+    return LocalProxy(lambda: router.session_for(model, method, kind, default))  # type: ignore[return-value]
@@ -1,5 +1,6 @@
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from contextlib import suppress
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -13,11 +14,13 @@ from sqlalchemy.orm import (
     RelationshipProperty,
     class_mapper,
     joinedload,
+    load_only,
     selectinload,
 )
 
 from flarchitect.database import inspections as db_inspections
 from flarchitect.database.constants import AGGREGATE_FUNCS, OPERATORS, OTHER_FUNCTIONS
+from flarchitect.database.registry import model_info
 from flarchitect.exceptions import CustomHTTPException
 from flarchitect.utils.config_helpers import get_config_or_model_meta
 from flarchitect.utils.core_utils import (
@@ -54,7 +57,12 @@ def fetch_related_classes_and_attributes(model: object) -> list[tuple[str, str]]
     return [(relation.key, relation.mapper.class_.__name__) for relation in class_mapper(model).relationships]
 
 
-def _eager_options_for(model_cls: type[DeclarativeBase], depth: int = 1, _visited: frozenset[type[DeclarativeBase]] | None = None) -> list:
+def _eager_options_for(
+    model_cls: type[DeclarativeBase],
+    depth: int = 1,
+    _visited: frozenset[type[DeclarativeBase]] | None = None,
+    relationships: Mapping[str, str] | None = None,
+) -> list:
     """Compose SQLAlchemy loader options to eager-load relationships up to ``depth``.
 
     Prefers ``selectinload`` for collections to avoid row explosion, and
@@ -65,6 +73,11 @@ def _eager_options_for(model_cls: type[DeclarativeBase], depth: int = 1, _visite
         model_cls: SQLAlchemy declarative model class to inspect.
         depth: Maximum relationship traversal depth (>=1 to include first level).
         _visited: Guard set to avoid infinite recursion on cyclic graphs.
+        relationships: Optional ``fields=`` selection (attribute name to dump
+            kind). When given, only selected first-level relationships are
+            loaded; those dumped as URLs load just the related primary key,
+            and URL collections are skipped because their link is built from
+            the parent's key.
 
     Returns:
         list[LoaderOption]: Loader options suitable for passing to ``Query.options``.
@@ -91,6 +104,15 @@ def _eager_options_for(model_cls: type[DeclarativeBase], depth: int = 1, _visite
         except Exception:
             continue
 
+        if relationships is not None:
+            kind = relationships.get(rel.key)
+            if kind is None or (kind == "url" and rel.uselist):
+                continue
+            if kind == "url":
+                related_pk = [getattr(rel.mapper.class_, rel.mapper.get_property_by_column(col).key) for col in rel.mapper.primary_key]
+                opts.append(joinedload(attr).load_only(*related_pk))
+                continue
+
         # Prefer selectinload for collections to avoid row multiplication
         loader = selectinload(attr) if rel.uselist else joinedload(attr)
 
@@ -104,11 +126,45 @@ def _eager_options_for(model_cls: type[DeclarativeBase], depth: int = 1, _visite
     return opts
 
 
+def projection_load_only(model_cls: type[DeclarativeBase], selection: Mapping[str, str]) -> list:
+    """Return a ``load_only`` option limiting ``model_cls`` to a ``fields=`` selection.
+
+    Primary and foreign key columns are always kept: ``to_url`` and relation
+    URLs are built from them.
+
+    Args:
+        model_cls: Entity selected by the query.
+        selection: Selected attribute names mapped to their dump kind.
+
+    Returns:
+        list[LoaderOption]: A single ``load_only`` option, or an empty list when
+        every column is needed or the selection names attributes other than
+        columns and relationships (hybrids may read any column).
+    """
+
+    mapper = sa_inspect(model_cls)
+    columns = {prop.key: prop for prop in mapper.column_attrs}
+    if any(name not in columns and name not in mapper.relationships for name in selection):
+        return []
+
+    keep = [
+        key
+        for key, prop in columns.items()
+        if key in selection or any(getattr(col, "primary_key", False) or getattr(col, "foreign_keys", None) for col in prop.columns)
+    ]
+    if len(keep) == len(columns):
+        return []
+    return [load_only(*(getattr(model_cls, key) for key in keep))]
+
+
 def _model_columns_and_hybrids(
     model: type[DeclarativeBase],
     *,
     ignore_underscore: bool,
-) -> dict[str, hybrid_property | InstrumentedAttribute]:
+) -> Mapping[str, hybrid_property | InstrumentedAttribute]:
+    info = model_info(model)
+    if info is not None:
+        return info.public_columns if ignore_underscore else info.columns
     return {
         attr: column
         for attr, column in model.__dict__.items()
@@ -275,10 +331,13 @@ _RESERVED_JOIN_KEYS = {
     "order_by",
     "page",
     "limit",
+    "cursor",
     "dump",
     "format",
     "include_deleted",
     "cascade_delete",
+    "dry_run",
+    "stream",
 }
 
 
@@ -491,54 +550,92 @@ def parse_or_condition_keys_and_values(key: str, val: str) -> tuple[list[str], l
     return keys, values
 
 
-def generate_conditions_from_args(
+@dataclass(frozen=True)
+class FilterStep:
+    """A resolved filter predicate awaiting its request value.
+
+    Attributes:
+        target: Column or hybrid expression the operator is applied to.
+        column_type: Type used to coerce incoming string values.
+        operator: Operator name from :data:`OPERATORS`.
+    """
+
+    target: Any
+    column_type: Any
+    operator: str
+
+
+def compile_filter_conditions(
     args_dict: dict[str, str],
     base_model: DeclarativeBase,
     all_columns: dict[str, dict[str, Column]],
-    all_models: list[DeclarativeBase],
-    join_models: dict[str, DeclarativeBase],
-) -> list[Callable]:
-    """
-    Create filter conditions based on request arguments and model's columns.
+) -> list[tuple[str, bool, tuple[FilterStep, ...]]]:
+    """Resolve filter keys to :class:`FilterStep` objects without binding values.
+
+    The result only depends on the argument *keys* (and the condition keys
+    embedded in ``or[...]`` groups), so it can be reused for every request with
+    the same query shape.
 
     Args:
         args_dict (Dict[str, str]): Dictionary of request arguments.
         base_model (DeclarativeBase): The base SQLAlchemy model.
         all_columns (Dict[str, Dict[str, Any]]): Nested dictionary of table names and their columns.
-        all_models (List[DeclarativeBase]): List of all models.
-        join_models (Dict[str, DeclarativeBase]): Dictionary of join models.
 
     Returns:
-        List[Callable]: List of conditions to apply in the query.
+        list[tuple[str, bool, tuple[FilterStep, ...]]]: ``(key, is_or, steps)``
+        entries in request order.
 
     Raises:
         CustomHTTPException: If an invalid or ambiguous column name is provided.
     """
-    conditions = []
-    or_conditions = []
+    compiled = []
 
     PAGINATION_DEFAULTS, _PAGINATION_MAX = create_pagination_defaults()
 
     for key, _value in args_dict.items():
+        # Control flags such as ``include_deleted`` contain operator names as substrings.
+        if key in _RESERVED_JOIN_KEYS:
+            continue
         if any(op in key for op in OPERATORS) and not any(func in key for func in [*PAGINATION_DEFAULTS, *OTHER_FUNCTIONS]):
             if key.startswith("or["):
-                or_keys, or_vals = parse_or_condition_keys_and_values(key, _value)
-                or_conditions.extend(
-                    create_condition(
-                        *get_table_column(or_key, all_columns),
-                        or_val,
-                        all_columns,
-                        base_model,
-                    )
-                    for or_key, or_val in zip(or_keys, or_vals, strict=False)
-                )
+                or_keys, _or_vals = parse_or_condition_keys_and_values(key, _value)
+                steps = tuple(resolve_condition(*get_table_column(or_key, all_columns), all_columns, base_model) for or_key in or_keys)
+                compiled.append((key, True, steps))
                 continue
 
             table, column, operator = get_table_column(key, all_columns)
             if operator:
-                condition = create_condition(table, column, operator, _value, all_columns, base_model)
-                if condition is not None:
-                    conditions.append(condition)
+                compiled.append((key, False, (resolve_condition(table, column, operator, all_columns, base_model),)))
+
+    return compiled
+
+
+def bind_filter_conditions(
+    compiled: list[tuple[str, bool, tuple[FilterStep, ...]]],
+    args_dict: dict[str, str],
+) -> list[Callable]:
+    """Bind request values to conditions produced by :func:`compile_filter_conditions`.
+
+    Args:
+        compiled: Output of :func:`compile_filter_conditions`.
+        args_dict (Dict[str, str]): Dictionary of request arguments.
+
+    Returns:
+        List[Callable]: List of conditions to apply in the query.
+    """
+    conditions = []
+    or_conditions = []
+
+    for key, is_or, steps in compiled:
+        _value = args_dict[key]
+        if is_or:
+            _or_keys, or_vals = parse_or_condition_keys_and_values(key, _value)
+            or_conditions.extend(bind_condition(step, or_val) for step, or_val in zip(steps, or_vals, strict=False))
+            continue
+
+        condition = bind_condition(steps[0], _value)
+        if condition is not None:
+            conditions.append(condition)
 
     if or_conditions:
         conditions.append(or_(*or_conditions))
@@ -546,6 +643,32 @@ def generate_conditions_from_args(
     return conditions
 
 
+def generate_conditions_from_args(
+    args_dict: dict[str, str],
+    base_model: DeclarativeBase,
+    all_columns: dict[str, dict[str, Column]],
+    all_models: list[DeclarativeBase],
+    join_models: dict[str, DeclarativeBase],
+) -> list[Callable]:
+    """
+    Create filter conditions based on request arguments and model's columns.
+
+    Args:
+        args_dict (Dict[str, str]): Dictionary of request arguments.
+        base_model (DeclarativeBase): The base SQLAlchemy model.
+        all_columns (Dict[str, Dict[str, Any]]): Nested dictionary of table names and their columns.
+        all_models (List[DeclarativeBase]): List of all models.
+        join_models (Dict[str, DeclarativeBase]): Dictionary of join models.
+
+    Returns:
+        List[Callable]: List of conditions to apply in the query.
+
+    Raises:
+        CustomHTTPException: If an invalid or ambiguous column name is provided.
+    """
+    return bind_filter_conditions(compile_filter_conditions(args_dict, base_model, all_columns), args_dict)
+
+
 def parse_key_and_label(key: str) -> tuple[str, str | None]:
     """
         Get the key and label from the key
@@ -665,31 +788,46 @@ def validate_table_and_column(table_name: str, column_name: str, all_columns: di
     return model_column, column_name
 
 
-def create_condition(
+def resolve_condition(
     table_name: str,
     column_name: str,
     operator: str,
-    value: str,
     all_columns: dict[str, dict[str, Column]],
     model: DeclarativeBase,
-) -> Callable | None:
+) -> FilterStep:
     """
-    Converts a key-value pair from request arguments to a condition.
+    Resolve the column, type and operator for a filter key.
 
     Args:
         table_name (str): The table name.
         column_name (str): The column name.
         operator (str): The operator.
-        value (str): The value associated with the key.
         all_columns (Dict[str, Column]): Dictionary of columns in the base model.
         model (DeclarativeBase): The model instance.
 
     Returns:
-        Optional[Callable]: A condition function or None if invalid operator.
+        FilterStep: The resolved predicate, ready for :func:`bind_condition`.
     """
     model_column, _ = validate_table_and_column(table_name, column_name, all_columns)
 
-    column_type = get_type_hint_from_hybrid(model_column) if isinstance(model_column, hybrid_property) else model_column.type
+    if isinstance(model_column, hybrid_property):
+        # Hybrids are evaluated against ``model``; a missing attribute yields no condition.
+        return FilterStep(getattr(model, column_name, None), get_type_hint_from_hybrid(model_column), operator)
+    return FilterStep(model_column, model_column.type, operator)
+
+
+def bind_condition(step: FilterStep, value: str) -> Callable | None:
+    """
+    Apply a request value to a resolved :class:`FilterStep`.
+
+    Args:
+        step (FilterStep): The resolved predicate.
+        value (str): The value associated with the key.
+
+    Returns:
+        Optional[Callable]: A condition function or None if invalid operator.
+    """
+    operator = step.operator
 
     if "in" in operator:
         value = value.strip("()").split(",")
@@ -698,20 +836,43 @@ def create_condition(
         value = f"%{value}%"
 
     with suppress(ValueError):
-        value = convert_value_to_type(value, column_type)
+        value = convert_value_to_type(value, step.column_type)
 
     operator_func = OPERATORS.get(operator)
-    if operator_func is None:
+    if operator_func is None or step.target is None:
         return None
 
     try:
-        if is_hybrid_property(model_column):
-            return operator_func(getattr(model, column_name), value)
-        return operator_func(model_column, value)
+        return operator_func(step.target, value)
     except (Exception, StatementError):
         return None
 
 
+def create_condition(
+    table_name: str,
+    column_name: str,
+    operator: str,
+    value: str,
+    all_columns: dict[str, dict[str, Column]],
+    model: DeclarativeBase,
+) -> Callable | None:
+    """
+    Converts a key-value pair from request arguments to a condition.
+
+    Args:
+        table_name (str): The table name.
+        column_name (str): The column name.
+        operator (str): The operator.
+        value (str): The value associated with the key.
+        all_columns (Dict[str, Column]): Dictionary of columns in the base model.
+        model (DeclarativeBase): The model instance.
+
+    Returns:
+        Optional[Callable]: A condition function or None if invalid operator.
+    """
+    return bind_condition(resolve_condition(table_name, column_name, operator, all_columns, model), value)
+
+
 def is_hybrid_property(prop: Any) -> bool:
     """
     Check if a property of a model is a hybrid_property.
@@ -867,16 +1028,16 @@ def get_primary_key_filters(base_model, lookup_val):
     Returns:
         Dict[str, Any]: A dictionary with primary key column(s) and the provided lookup value.
     """
-    mapper = inspect(base_model)
-    pks = mapper.primary_key
+    info = model_info(base_model)
+    pks = info.primary_key_names if info is not None else tuple(pk.name for pk in inspect(base_model).primary_key)
 
     # If there's only one primary key column, return a simple dictionary
     if len(pks) == 1:
-        return {pks[0].name: lookup_val}
+        return {pks[0]: lookup_val}
 
     # If there are multiple primary key columns, split the lookup_val and map accordingly
     if isinstance(lookup_val, tuple | list):
-        return {pk.name: val for pk, val in zip(pks, lookup_val, strict=False)}
+        return dict(zip(pks, lookup_val, strict=False))
 
     raise ValueError(f"Multiple primary keys found in {base_model.__name__}, but lookup_val is not a tuple or list.")
 
@@ -910,7 +1071,7 @@ def _extract_model_attributes(model: type[DeclarativeBase]) -> tuple[set, set]:
     return extract_model_attributes(model)
 
 
-def get_related_b_query(model_a, model_b, a_pk_value, session):
+def get_related_b_query(model_a, model_b, a_pk_value, session, relationship_attr=None):
     """
     Return a SQLAlchemy query that retrieves all instances of model_b related to model_a.
 
@@ -919,6 +1080,9 @@ def get_related_b_query(model_a, model_b, a_pk_value, session):
         model_b: The related SQLAlchemy model class.
         a_pk_value: The primary key value of model_a.
         session: The SQLAlchemy session instance.
+        relationship_attr: Relationship attribute to join on, typically resolved
+            once when the relation route is generated. When omitted the
+            relationship is discovered from the mappers.
 
     Returns:
         A SQLAlchemy query object that retrieves all related model_b instances.
@@ -926,6 +1090,19 @@ def get_related_b_query(model_a, model_b, a_pk_value, session):
     Raises:
         Exception: If no relationship is found between model_a and model_b.
     """
+    info_a, info_b = model_info(model_a), model_info(model_b)
+    if relationship_attr is not None:
+        pk_name_a = info_a.primary_key_names[0] if info_a is not None else inspect(model_a).primary_key[0].name
+        return session.query(model_b).join(relationship_attr).filter(getattr(model_a, pk_name_a) == a_pk_value)
+
+    if info_a is not None and info_b is not None:
+        pk_attr_a = getattr(model_a, info_a.primary_key_names[0])
+        if relationship_name := info_a.relation_keys_by_target.get(model_b.__name__):
+            return session.query(model_b).join(getattr(model_a, relationship_name)).filter(pk_attr_a == a_pk_value)
+        if relationship_name := info_b.relation_keys_by_target.get(model_a.__name__):
+            return session.query(model_b).join(getattr(model_b, relationship_name)).filter(pk_attr_a == a_pk_value)
+        raise Exception(f"No relationship found between {model_a.__name__} and {model_b.__name__}")
+
     # Get the mappers for both models
     mapper_a = inspect(model_a)
     mapper_b = inspect(model_b)
@@ -9,6 +9,7 @@ from __future__ import annotations
 import json
 import re
 import time
+from collections.abc import Callable
 from contextlib import suppress
 from typing import Any
 
@@ -64,12 +65,14 @@ class CustomLogger:
     def __init__(self, verbosity_level: int = 0) -> None:
         self.verbosity_level = verbosity_level
         self.json_mode: bool = False
+        # ``API_JSON_ENCODER`` backend, set by ``Architect``; stdlib when unset.
+        self.json_encoder: Callable[[Any], str] | None = None
 
     def _emit_text(self, text: str) -> None:
         print(color_text_with_multiple_patterns(text))
 
     def _emit_json(self, payload: dict[str, Any]) -> None:
-        print(json.dumps(payload, separators=(",", ":")))
+        print(self.json_encoder(payload) if self.json_encoder else json.dumps(payload, separators=(",", ":")))
 
     def _context(self) -> dict[str, Any]:
         if has_request_context():  # pragma: no cover - integration behaviour
@@ -83,6 +86,10 @@ class CustomLogger:
                 start = getattr(g, "_flarch_req_start", None)
                 if start is not None:
                     ctx["latency_ms"] = int((time.perf_counter() - start) * 1000)
+                # Per-stage timings when API_SERVER_TIMING/API_METRICS_SINK is on
+                timer = g.get("_flarch_stage_timer")
+                if timer is not None:
+                    ctx["stages_ms"] = timer.as_ms()
             return ctx
         return {}
 
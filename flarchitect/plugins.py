@@ -1,11 +1,29 @@
 from __future__ import annotations
 
 import contextlib
+import inspect
+import threading
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from flask import Request, Response
 
+from flarchitect.logging import logger
+from flarchitect.utils.core_utils import require_async_support, resolve_awaitable
+
+HOOK_NAMES: tuple[str, ...] = (
+    "request_started",
+    "request_finished",
+    "after_response",
+    "before_authenticate",
+    "after_authenticate",
+    "before_model_op",
+    "after_model_op",
+    "spec_build_started",
+    "spec_build_completed",
+)
+
 
 class PluginBase:
     """Base class for flarchitect plugins.
@@ -16,6 +34,7 @@ class PluginBase:
     Stable hook signatures (kwargs may grow but not change meaning):
     - request_started(request: Request) -> None
     - request_finished(request: Request, response: Response) -> Response | None
+    - after_response(info: dict[str, Any]) -> None  (runs off the request thread)
     - before_authenticate(context: dict[str, Any]) -> dict[str, Any] | None
     - after_authenticate(context: dict[str, Any], success: bool, user: Any | None) -> None
     - before_model_op(context: dict[str, Any]) -> dict[str, Any] | None
@@ -30,6 +49,9 @@ class PluginBase:
     def request_finished(self, request: Request, response: Response) -> Response | None:  # pragma: no cover - default no-op
         return None
 
+    def after_response(self, info: dict[str, Any]) -> None:  # pragma: no cover - default no-op
+        return None
+
     def before_authenticate(self, context: dict[str, Any]) -> dict[str, Any] | None:  # pragma: no cover - default no-op
         return None
 
@@ -49,11 +71,40 @@ class PluginBase:
         return None
 
 
+def _overrides(plugin: PluginBase, name: str) -> bool:
+    """Return whether ``plugin`` replaces the ``PluginBase`` no-op for ``name``."""
+
+    if name in getattr(plugin, "__dict__", {}):
+        return True
+    return getattr(type(plugin), name, None) is not getattr(PluginBase, name)
+
+
 class PluginManager:
-    """Manage registration and invocation of flarchitect plugins."""
+    """Manage registration and invocation of flarchitect plugins.
+
+    The plugins overriding each hook are resolved once, so hooks nobody
+    implements cost a dictionary lookup. ``after_response`` hooks run on a
+    bounded thread pool created on first use; when ``after_response_queue``
+    calls are already pending, further calls are dropped rather than queued.
 
-    def __init__(self, plugins: list[PluginBase] | None = None) -> None:
+    Args:
+        plugins: Plugins in dispatch order.
+        after_response_workers: Threads serving ``after_response`` hooks.
+        after_response_queue: Maximum pending ``after_response`` calls.
+    """
+
+    def __init__(self, plugins: list[PluginBase] | None = None, *, after_response_workers: int = 2, after_response_queue: int = 1000) -> None:
         self._plugins: list[PluginBase] = plugins or []
+        self._hooks: dict[str, tuple[PluginBase, ...]] = {name: tuple(p for p in self._plugins if _overrides(p, name)) for name in HOOK_NAMES}
+        self._after_response_workers = max(1, int(after_response_workers))
+        self._after_response_slots = threading.BoundedSemaphore(max(1, int(after_response_queue)))
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def has_hook(self, name: str) -> bool:
+        """Return whether any registered plugin overrides hook ``name``."""
+
+        return bool(self._hooks.get(name))
 
     @staticmethod
     def _coerce(entry: Any) -> PluginBase:
@@ -70,7 +121,7 @@ class PluginManager:
         raise TypeError("Invalid plugin entry; expected PluginBase or factory")
 
     @classmethod
-    def from_config(cls, config_val: Any) -> PluginManager:
+    def from_config(cls, config_val: Any, **options: Any) -> PluginManager:
         plugins: list[PluginBase] = []
         if isinstance(config_val, list):
             for entry in config_val:
@@ -80,7 +131,7 @@ class PluginManager:
         elif config_val:
             with contextlib.suppress(Exception):
                 plugins.append(cls._coerce(config_val))
-        return cls(plugins)
+        return cls(plugins, **options)
 
     @classmethod
     def _coerce_optional(cls, entry: Any) -> PluginBase | None:
@@ -93,30 +144,30 @@ class PluginManager:
             return None
 
     # Dispatch helpers
-    def _for_each(self, func: Callable[[PluginBase], Any]) -> None:
-        for plugin in self._plugins:
+    def _for_each(self, name: str, func: Callable[[PluginBase], Any]) -> None:
+        for plugin in self._hooks[name]:
             self._safe_call(func, plugin)
 
-    def _first_non_none(self, func: Callable[[PluginBase], Any]) -> Any:
-        for p in self._plugins:
+    def _first_non_none(self, name: str, func: Callable[[PluginBase], Any]) -> Any:
+        for p in self._hooks[name]:
             result = self._safe_call(func, p)
             if result is not None:
                 return result
         return None
 
-    def _merge_context_updates(self, context: dict[str, Any], func: Callable[[PluginBase], Any]) -> dict[str, Any] | None:
+    def _merge_context_updates(self, name: str, context: dict[str, Any], func: Callable[[PluginBase], Any]) -> dict[str, Any] | None:
         updated = False
-        for plugin in self._plugins:
+        for plugin in self._hooks[name]:
             result = self._safe_call(func, plugin)
             if isinstance(result, dict):
                 context.update(result)
                 updated = True
         return context if updated else None
 
-    def _chain_first_arg(self, initial: Any, func: Callable[[PluginBase, Any], Any], *, require_dict: bool = False) -> Any | None:
+    def _chain_first_arg(self, name: str, initial: Any, func: Callable[[PluginBase, Any], Any], *, require_dict: bool = False) -> Any | None:
         value = initial
         changed = False
-        for plugin in self._plugins:
+        for plugin in self._hooks[name]:
             result = self._safe_call(func, plugin, value)
             if result is None:
                 continue
@@ -127,32 +178,84 @@ class PluginManager:
         return value if changed else None
 
     def request_started(self, request: Request) -> None:
-        self._for_each(lambda p: p.request_started(request))
+        self._for_each("request_started", lambda p: p.request_started(request))
 
     def request_finished(self, request: Request, response: Response) -> Response | None:
-        return self._first_non_none(lambda p: p.request_finished(request, response))
+        return self._first_non_none("request_finished", lambda p: p.request_finished(request, response))
+
+    def after_response(self, info: dict[str, Any]) -> None:
+        """Submit ``after_response`` hooks to the background pool.
+
+        ``info`` must be a plain snapshot; the request and response objects
+        are gone by the time the hooks run.
+        """
+
+        plugins = self._hooks["after_response"]
+        if not plugins:
+            return
+        if not self._after_response_slots.acquire(blocking=False):
+            logger.debug(1, "after_response queue is full; dropping plugin call.")
+            return
+        try:
+            self._get_executor().submit(self._run_after_response, plugins, info)
+        except RuntimeError:
+            # Executor shut down (interpreter exit).
+            self._after_response_slots.release()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self._after_response_workers, thread_name_prefix="flarchitect-after-response")
+        return self._executor
+
+    def _run_after_response(self, plugins: tuple[PluginBase, ...], info: dict[str, Any]) -> None:
+        try:
+            for plugin in plugins:
+                try:
+                    self._safe_call(lambda p: p.after_response(info), plugin)
+                except RuntimeError as exc:
+                    logger.error(1, f"after_response hook of {type(plugin).__name__} failed: {exc}")
+        finally:
+            self._after_response_slots.release()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the ``after_response`` pool, waiting for pending calls by default."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
 
     def before_authenticate(self, context: dict[str, Any]) -> dict[str, Any] | None:
-        return self._merge_context_updates(context, lambda p: p.before_authenticate(context))
+        return self._merge_context_updates("before_authenticate", context, lambda p: p.before_authenticate(context))
 
     def after_authenticate(self, context: dict[str, Any], success: bool, user: Any | None) -> None:
-        self._for_each(lambda p: p.after_authenticate(context, success, user))
+        self._for_each("after_authenticate", lambda p: p.after_authenticate(context, success, user))
 
     def before_model_op(self, context: dict[str, Any]) -> dict[str, Any] | None:
-        return self._merge_context_updates(context, lambda p: p.before_model_op(context))
+        return self._merge_context_updates("before_model_op", context, lambda p: p.before_model_op(context))
 
     def after_model_op(self, context: dict[str, Any], output: Any) -> Any | None:
-        return self._chain_first_arg(output, lambda p, out: p.after_model_op(context, out))
+        return self._chain_first_arg("after_model_op", output, lambda p, out: p.after_model_op(context, out))
 
     def spec_build_started(self, spec: Any) -> None:
-        self._for_each(lambda p: p.spec_build_started(spec))
+        self._for_each("spec_build_started", lambda p: p.spec_build_started(spec))
 
     def spec_build_completed(self, spec_dict: dict[str, Any]) -> dict[str, Any] | None:
-        return self._chain_first_arg(spec_dict, lambda p, out: p.spec_build_completed(out), require_dict=True)
+        return self._chain_first_arg("spec_build_completed", spec_dict, lambda p, out: p.spec_build_completed(out), require_dict=True)
 
     @staticmethod
     def _safe_call(fn: Callable, *args: Any, **kwargs: Any) -> Any:
         try:
-            return fn(*args, **kwargs)
+            result = fn(*args, **kwargs)
+        except Exception:
+            return None
+        if not inspect.isawaitable(result):
+            return result
+        # A coroutine plugin without Flask's async support is a setup error,
+        # not a plugin failure, so it must not be silently ignored.
+        require_async_support(result)
+        try:
+            return resolve_awaitable(result)
         except Exception:
             return None
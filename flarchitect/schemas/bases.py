@@ -10,7 +10,7 @@ from typing import Any, get_args, get_origin, get_type_hints
 
 import sqlalchemy_utils
 from flask import request
-from marshmallow import Schema, ValidationError, fields, post_dump, pre_dump
+from marshmallow import Schema, ValidationError, fields, missing, post_dump, pre_dump
 from marshmallow.validate import Length, Range
 from sqlalchemy import (
     TIMESTAMP,
@@ -152,8 +152,14 @@ _FIELD_CACHE_CONFIG_KEYS = (
     "API_SERIALIZATION_TYPE",
     "ALLOW_NESTED_WRITES",
 )
-_SchemaFieldCacheKey = tuple[type["AutoSchema"], bool, int, int, tuple[str, ...] | None, tuple[tuple[str, str], ...]]
+# The request shape is the effective relationship dump type, whether
+# ``dump_relationships`` was switched off and the relationship join tokens that
+# select optional relationships. Other query arguments (filters, paging,
+# sorting) never change the generated fields.
+_FieldCacheRequestShape = tuple[str, bool, tuple[str, ...]]
+_SchemaFieldCacheKey = tuple[type["AutoSchema"], bool, int, int, tuple[str, ...] | None, tuple[tuple[str, str], ...], _FieldCacheRequestShape]
 _SCHEMA_FIELD_CACHE: dict[_SchemaFieldCacheKey, "_SchemaFieldCacheEntry"] = {}
+_SCHEMA_FIELD_CACHE_COUNTERS = {"hits": 0, "misses": 0}
 _HYBRID_FIELD_CACHE: dict[tuple[type[Any], str], tuple[type[fields.Field], dict[str, Any]]] = {}
 _AUTO_SCHEMA_REGISTRY: dict[tuple[type[Any], bool | None], list[type["AutoSchema"]]] = {}
 _SCHEMA_SUBCLASS_CACHE: dict[tuple[type[Any], bool | None], Callable[..., Any] | None] = {}
@@ -169,10 +175,13 @@ _RESERVED_JOIN_QUERY_KEYS = {
     "order_by",
     "page",
     "limit",
+    "cursor",
     "dump",
     "format",
     "include_deleted",
     "cascade_delete",
+    "dry_run",
+    "stream",
 }
 _DIRECT_FORMAT_VALIDATORS = {
     "ipv4": "ipv4",
@@ -365,6 +374,23 @@ def _request_join_tokens() -> set[str]:
         return set()
 
 
+def schema_field_cache_stats() -> dict[str, int]:
+    """Return ``hits``, ``misses`` and ``size`` of the schema field cache.
+
+    A hit means an :class:`AutoSchema` instance copied its fields from a
+    previously generated schema instead of walking the model mapper.
+    """
+
+    return {**_SCHEMA_FIELD_CACHE_COUNTERS, "size": len(_SCHEMA_FIELD_CACHE)}
+
+
+def clear_schema_field_cache() -> None:
+    """Drop all cached schema fields and reset the counters."""
+
+    _SCHEMA_FIELD_CACHE.clear()
+    _SCHEMA_FIELD_CACHE_COUNTERS.update(hits=0, misses=0)
+
+
 def _relationship_join_candidates(original_attribute: str, related_model: type[Any]) -> set[str]:
     endpoint_case = get_config_or_model_meta("API_ENDPOINT_CASE", default="kebab") or "kebab"
     endpoint_name = get_config_or_model_meta("API_ENDPOINT_NAMER", related_model, default=endpoint_namer)(related_model)
@@ -545,6 +571,37 @@ class AutoSchema(Base):
             for key in _FIELD_CACHE_CONFIG_KEYS
         )
 
+    def _field_cache_request_shape(self) -> _FieldCacheRequestShape:
+        """Return the parts of the active request that change generated fields.
+
+        Join tokens only matter when they can add relationships: in ``dynamic``
+        dump mode, or when ``API_ADD_RELATIONS`` is off and joins are allowed.
+        They are narrowed to this model's relationship names so unrelated
+        query arguments still share a cache entry.
+        """
+
+        dump_type = self._relationship_dump_type()
+        try:
+            skip_relations = request.args.get("dump_relationships") in ["false", "False", "0"]
+        except RuntimeError:
+            skip_relations = False
+
+        tokens: tuple[str, ...] = ()
+        if self.render_nested and not skip_relations:
+            add_relations = get_config_or_model_meta("API_ADD_RELATIONS", model=self.model, default=True)
+            allow_join = get_config_or_model_meta("API_ALLOW_JOIN", model=self.model, default=False)
+            if dump_type == "dynamic" or (not add_relations and allow_join):
+                requested = _request_join_tokens()
+                if requested:
+                    tokens = tuple(
+                        sorted(
+                            prop.key
+                            for prop in class_mapper(self.model).relationships
+                            if not requested.isdisjoint(_relationship_join_candidates(prop.key, prop.mapper.class_))
+                        )
+                    )
+        return dump_type, skip_relations, tokens
+
     def _build_field_cache_key(self) -> _SchemaFieldCacheKey:
         return (
             self.__class__,
@@ -553,19 +610,18 @@ class AutoSchema(Base):
             int(self.context.get("current_depth", 0) or 0),
             self._cache_only_key,
             self._field_cache_config_fingerprint(),
+            self._field_cache_request_shape(),
         )
 
     def _can_use_field_cache(self) -> bool:
-        """Field generation is request-sensitive when dump/join args are present."""
+        """Return whether generated fields may be shared through the cache.
 
-        try:
-            if request.args:
-                return False
-        except RuntimeError:
-            pass
+        Every request input that shapes the fields is part of
+        :meth:`_build_field_cache_key`, so the cache is always usable.
+        Subclasses generating fields from other request state can opt out.
+        """
 
-        raw_dump = get_config_or_model_meta("API_SERIALIZATION_TYPE", self.model, default="url")
-        return str(raw_dump or "url").strip().lower() != "dynamic"
+        return True
 
     @pre_dump
     def pre_dump(self, data, **kwargs):
@@ -585,11 +641,14 @@ class AutoSchema(Base):
 
     def _apply_only(self, only_fields: list):
         """Filter fields to include only those specified."""
+        # Keep the field/plan cache key in step when narrowing after __init__.
+        self._cache_only_key = self._normalise_only(only_fields)
         self.fields = {key: self.fields[key] for key in only_fields}
         # todo Add a check to see if ok to dump or not
 
-        self.dump_fields = {key: self.dump_fields[key] for key in only_fields}
-        self.load_fields = {key: self.load_fields[key] for key in only_fields}
+        # Relationship URL fields are dump-only, so not every key is loadable.
+        self.dump_fields = {key: self.dump_fields[key] for key in only_fields if key in self.dump_fields}
+        self.load_fields = {key: self.load_fields[key] for key in only_fields if key in self.load_fields}
 
     def _generate_field_for_descriptor(self, original_attribute: str, mapper_property: Any) -> None:
         if self._should_skip_attribute(original_attribute):
@@ -616,9 +675,11 @@ class AutoSchema(Base):
         if use_field_cache:
             cached_entry = _SCHEMA_FIELD_CACHE.get(cache_key)
             if cached_entry is not None:
+                _SCHEMA_FIELD_CACHE_COUNTERS["hits"] += 1
                 cached_entry.instantiate(self)
                 _rebind_cached_fields(self)
                 return
+            _SCHEMA_FIELD_CACHE_COUNTERS["misses"] += 1
 
         mapper = class_mapper(self.model)
         for attribute, mapper_property in mapper.all_orm_descriptors.items():
@@ -1335,8 +1396,16 @@ class AutoSchema(Base):
             field_meta.update(openapi_meta_data)
 
     def dump(self, obj, *args, **kwargs):
-        # print("Data before super().dump:", obj)
-        return super().dump(obj, *args, **kwargs) if self.fields else self.__class__(context=self.context).dump(obj, *args, **kwargs)
+        if not self.fields:
+            return self.__class__(context=self.context).dump(obj, *args, **kwargs)
+        if not args and get_config_or_model_meta("API_COMPILED_SERIALIZER", model=self.model, default=False):
+            from flarchitect.schemas.compiled import compiled_dump
+
+            many = self.many if kwargs.get("many") is None else bool(kwargs["many"])
+            result = compiled_dump(self, obj, many)
+            if result is not missing:
+                return result
+        return super().dump(obj, *args, **kwargs)
 
 
 def _rebind_cached_fields(schema: "AutoSchema") -> None:
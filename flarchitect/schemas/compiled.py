@@ -0,0 +1,348 @@
+"""Compiled dump functions for :class:`~flarchitect.schemas.bases.AutoSchema`.
+
+Marshmallow serialises every field of every row through ``Field.serialize``,
+the schema accessor and the field's ``_serialize``; ``AutoSchema`` adds a
+config lookup per field (``API_SERIALIZATION_IGNORE_DETACHED``) and per row
+(``API_DUMP_CALLBACK``). With ``API_COMPILED_SERIALIZER = True`` each schema is
+instead dumped by a specialised row function built from its resolved
+``dump_fields``:
+
+* a plan (one step per field: output key, attribute and converter kind) is
+  compiled once per schema class, ``only`` set, depth and field-shaping config
+  and cached in :data:`_DUMP_PLAN_CACHE`;
+* per dump call the plan is bound to the schema instance, resolving the
+  detached-instance policy, the dump callback and relationship endpoint names
+  once for the whole payload, including nested schemas;
+* each row then runs a flat loop of prebound converters for ints, strings,
+  floats, booleans, dates, ``NumericNumber``, ``EnumField``, UUIDs and
+  relationship URLs. Other fields fall back to ``Field.serialize``.
+
+Output is identical to :meth:`marshmallow.Schema.dump`, key order included.
+Schemas customising dump hooks, attribute access or relationship URLs keep
+using Marshmallow.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from marshmallow import Schema, fields, missing, utils
+from sqlalchemy.orm import exc as orm_exc
+
+from flarchitect.specs.utils import endpoint_namer
+from flarchitect.utils.config_helpers import get_config_or_model_meta
+
+if TYPE_CHECKING:
+    from flarchitect.schemas.bases import AutoSchema
+
+__all__ = ["compiled_dump", "is_compilable"]
+
+RowFunction = Callable[[Any], dict[str, Any]]
+
+
+class _Step(NamedTuple):
+    """One field of a compiled plan."""
+
+    name: str
+    key: str
+    attribute: str
+    kind: str
+
+
+class _Binding:
+    """Per dump call state shared by a schema and its nested schemas."""
+
+    __slots__ = ("ignore_detached", "rows")
+
+    def __init__(self) -> None:
+        self.ignore_detached = bool(get_config_or_model_meta("API_SERIALIZATION_IGNORE_DETACHED", default=True))
+        # Nested schemas recurring in one payload are bound once.
+        self.rows: dict[tuple[int, bool], RowFunction] = {}
+
+
+_DUMP_PLAN_CACHE: dict[tuple[Any, ...], tuple[_Step, ...]] = {}
+
+
+def is_compilable(schema: AutoSchema) -> bool:
+    """Return whether ``schema`` dumps exactly like the compiled path.
+
+    Subclasses adding ``pre_dump``/``post_dump`` hooks or overriding attribute
+    access, URL resolution or ``_serialize`` are left to Marshmallow.
+    """
+
+    from flarchitect.schemas.bases import AutoSchema, Base
+
+    cls = type(schema)
+    return (
+        {hook for hooks in cls._hooks.values() for hook, *_ in hooks} <= {"pre_dump", "post_dump"}
+        and cls.dump is AutoSchema.dump
+        and cls.pre_dump is AutoSchema.pre_dump
+        and cls.post_dump is AutoSchema.post_dump
+        and cls.get_attribute is Base.get_attribute
+        and cls.get_url is AutoSchema.get_url
+        and cls.get_many_url is AutoSchema.get_many_url
+        and cls._serialize is Schema._serialize
+        and cls.dict_class is dict
+    )
+
+
+def _step_kind(field: fields.Field) -> str:
+    from flarchitect.schemas.bases import EnumField, NumericNumber
+
+    relationship = (field.metadata or {}).get("_fa_relationship") or {}
+    if isinstance(field, fields.Function):
+        if relationship.get("kind") == "url" and relationship.get("related_model") is not None:
+            return "url_many" if relationship.get("url_kind") == "many" else "url_one"
+        return "field"
+    if type(field) is fields.Nested:
+        return "nested"
+    if type(field) is fields.List and type(field.inner) is fields.Nested:
+        return "nested_list"
+    if isinstance(field, fields.Number) and field.as_string:
+        return "field"
+
+    return {
+        fields.Raw: "raw",
+        fields.String: "str",
+        fields.Email: "str",
+        fields.Integer: "int",
+        fields.Float: "float",
+        NumericNumber: "numeric",
+        fields.Boolean: "bool",
+        fields.DateTime: "temporal",
+        fields.Date: "temporal",
+        fields.Time: "temporal",
+        fields.UUID: "uuid",
+        EnumField: "enum",
+    }.get(type(field), "field")
+
+
+def _compile_plan(schema: AutoSchema) -> tuple[_Step, ...]:
+    return tuple(
+        _Step(
+            name=name,
+            key=field.data_key if field.data_key is not None else name,
+            attribute=field.attribute if field.attribute is not None else name,
+            kind=_step_kind(field),
+        )
+        for name, field in schema.dump_fields.items()
+    )
+
+
+def _plan_for(schema: AutoSchema) -> tuple[_Step, ...]:
+    if not schema._can_use_field_cache():
+        return _compile_plan(schema)
+    key = schema._build_field_cache_key()
+    plan = _DUMP_PLAN_CACHE.get(key)
+    if plan is None:
+        plan = _DUMP_PLAN_CACHE[key] = _compile_plan(schema)
+    return plan
+
+
+def _value_converter(field: fields.Field, kind: str) -> Callable[[Any], Any]:
+    if kind == "raw":
+        return lambda value: value
+    if kind == "str":
+        return utils.ensure_text_type
+    if kind == "int":
+        return int
+    if kind == "float":
+        return float
+    if kind == "uuid":
+        return str
+    if kind == "numeric":
+        format_num = field._format_num
+        return lambda value: float(format_num(value))
+    if kind == "bool":
+        serialize = field._serialize
+        return lambda value: value if value is True or value is False else serialize(value, None, None)
+    if kind == "temporal":
+        data_format = field.format or field.DEFAULT_FORMAT
+        format_func = field.SERIALIZATION_FUNCS.get(data_format)
+        return format_func or (lambda value: value.strftime(data_format))
+    # ``enum``: type errors raise exactly as ``EnumField._serialize`` does.
+    serialize = field._serialize
+    enum_cls = field.enum
+    if field.by_value:
+        return lambda value: value.value if type(value) is enum_cls else serialize(value, None, None)
+    return lambda value: value.name if type(value) is enum_cls else serialize(value, None, None)
+
+
+def _reader(step: _Step, field: fields.Field, binding: _Binding) -> Callable[[Any], Any]:
+    """Return ``obj -> value`` mirroring ``Field.get_value`` and ``Base.get_attribute``."""
+
+    attribute = step.attribute
+    default = field.dump_default
+    ignore_detached = binding.ignore_detached
+    dotted = "." in attribute
+
+    def read(obj: Any) -> Any:
+        try:
+            value = utils.get_value(obj, attribute, missing) if dotted or hasattr(obj, "__getitem__") else getattr(obj, attribute, missing)
+        except orm_exc.DetachedInstanceError:
+            if ignore_detached:
+                return None
+            raise
+        if value is missing:
+            return default() if callable(default) else default
+        return value
+
+    return read
+
+
+def _url_extractor(step: _Step, field: fields.Field, binding: _Binding) -> Callable[[Any], Any]:
+    """Inline :meth:`AutoSchema.get_url` / :meth:`AutoSchema.get_many_url`."""
+
+    relationship = field.metadata["_fa_relationship"]
+    attribute = relationship.get("attribute") or step.name
+    ignore_detached = binding.ignore_detached
+
+    if step.kind == "url_many":
+        related_model = relationship["related_model"]
+        namer = get_config_or_model_meta("API_ENDPOINT_NAMER", related_model, default=endpoint_namer)
+        method_name = namer(related_model).replace("-", "_") + "_to_url"
+
+        def many_urls(obj: Any) -> Any:
+            try:
+                return getattr(obj, method_name)()
+            except orm_exc.DetachedInstanceError:
+                if ignore_detached:
+                    return []
+                raise
+
+        return many_urls
+
+    def one_url(obj: Any) -> Any:
+        try:
+            related = getattr(obj, attribute)
+        except orm_exc.DetachedInstanceError:
+            if ignore_detached:
+                return None
+            raise
+        if isinstance(related, list):
+            try:
+                return [item.to_url() for item in related]
+            except orm_exc.DetachedInstanceError:
+                if ignore_detached:
+                    return []
+                raise
+        if related:
+            try:
+                return related.to_url()
+            except orm_exc.DetachedInstanceError:
+                if ignore_detached:
+                    return None
+                raise
+        return None
+
+    return one_url
+
+
+def _nested_extractor(read: Callable[[Any], Any], nested: fields.Nested, binding: _Binding, *, as_list: bool) -> Callable[[Any], Any] | None:
+    schema = nested.schema
+    many = bool(schema.many or nested.many)
+    row = _bind(schema, binding, many)
+    if row is None:
+        return None
+
+    if as_list:
+        # ``List(Nested)`` dumps each item on its own, exactly like ``List._serialize``.
+        def dump_item(item: Any) -> Any:
+            if item is None:
+                return None
+            return [row(each) for each in item] if many else row(item)
+
+        def extract_list(obj: Any) -> Any:
+            value = read(obj)
+            if value is missing or value is None:
+                return value
+            return [dump_item(each) for each in value]
+
+        return extract_list
+
+    def extract(obj: Any) -> Any:
+        value = read(obj)
+        if value is missing or value is None:
+            return value
+        return [row(each) for each in value] if many else row(value)
+
+    return extract
+
+
+def _extractor(schema: AutoSchema, step: _Step, binding: _Binding) -> Callable[[Any], Any]:
+    field = schema.dump_fields[step.name]
+    kind = step.kind
+    if kind in {"url_one", "url_many"}:
+        return _url_extractor(step, field, binding)
+
+    read = _reader(step, field, binding)
+    if kind == "nested":
+        extract = _nested_extractor(read, field, binding, as_list=False)
+    elif kind == "nested_list":
+        extract = _nested_extractor(read, field.inner, binding, as_list=True)
+    elif kind == "field":
+        extract = None
+    else:
+        convert = _value_converter(field, kind)
+
+        def extract(obj: Any) -> Any:
+            value = read(obj)
+            if value is missing or value is None:
+                return value
+            return convert(value)
+
+    if extract is None:
+        name = step.name
+        accessor = schema.get_attribute
+        return lambda obj: field.serialize(name, obj, accessor=accessor)
+    return extract
+
+
+def _bind(schema: Schema, binding: _Binding, many: bool) -> RowFunction | None:
+    from flarchitect.schemas.bases import AutoSchema
+
+    if not isinstance(schema, AutoSchema) or not schema.fields or not is_compilable(schema):
+        return None
+
+    cache_key = (id(schema), many)
+    row = binding.rows.get(cache_key)
+    if row is not None:
+        return row
+
+    from flask import request
+
+    callback = get_config_or_model_meta("API_DUMP_CALLBACK", model=schema.get_model(), method=request.method, default=None)
+    steps = tuple((step.key, _extractor(schema, step, binding)) for step in _plan_for(schema))
+
+    def row(obj: Any) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        for key, extract in steps:
+            value = extract(obj)
+            if value is not missing:
+                data[key] = value
+        return callback(data, many=many) if callback else data
+
+    binding.rows[cache_key] = row
+    return row
+
+
+def compiled_dump(schema: AutoSchema, obj: Any, many: bool) -> Any:
+    """Dump ``obj`` with the compiled row function for ``schema``.
+
+    Args:
+        schema: Schema instance whose ``dump_fields`` define the output.
+        obj: Object, or iterable of objects when ``many`` is true.
+        many: Whether ``obj`` is a collection.
+
+    Returns:
+        Any: The same data :meth:`marshmallow.Schema.dump` returns, or
+        :data:`marshmallow.missing` when the schema cannot be compiled.
+    """
+
+    row = _bind(schema, _Binding(), many)
+    if row is None:
+        return missing
+    if many:
+        return [row(item) for item in obj] if obj is not None else row(obj)
+    return row(obj)
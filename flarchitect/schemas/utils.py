@@ -34,14 +34,47 @@ def get_input_output_from_model_or_make(model: Callable, **kwargs) -> tuple[Call
     return _schema_bases.get_input_output_from_model_or_make(model, **kwargs)
 
 
-def deserialise_data(input_schema: type[Schema], response: Response) -> dict[str, Any] | tuple[dict[str, Any], int]:
+def _clean_input_item(source_data: dict[str, Any], field_items: dict[str, fields.Field]) -> dict[str, Any]:
+    """Drop unknown keys and URL placeholders for nested fields from one input item."""
+
+    cleaned: dict[str, Any] = {}
+    for key, value in source_data.items():
+        field_obj = field_items.get(key)
+        if not field_obj:
+            continue
+        # ``fields.Nested`` expects a dict (or list for many). When a URL string
+        # from a previous GET request is supplied, the field should be ignored
+        # to allow partial updates without manual payload pruning.
+        if isinstance(field_obj, fields.Nested) and not isinstance(value, (dict | list)):
+            continue
+        if isinstance(field_obj, fields.List) and isinstance(field_obj.inner, fields.Nested) and not isinstance(value, list):
+            continue
+        cleaned[key] = value
+    return cleaned
+
+
+def _check_bulk_size(input_schema: Schema, items: list[Any]) -> None:
+    """Reject bulk payloads larger than ``API_BULK_MAX_ITEMS``."""
+
+    from flarchitect.exceptions import CustomHTTPException
+
+    model = getattr(getattr(input_schema, "Meta", None), "model", None)
+    max_items = int(get_config_or_model_meta("API_BULK_MAX_ITEMS", model=model, default=1000) or 0)
+    if max_items <= 0:
+        raise CustomHTTPException(400, "Bulk create is disabled for this resource.")
+    if len(items) > max_items:
+        raise CustomHTTPException(413, f"Bulk create accepts at most {max_items} items; received {len(items)}.")
+
+
+def deserialise_data(input_schema: type[Schema], response: Response) -> dict[str, Any] | list[dict[str, Any]] | tuple[dict[str, Any], int]:
     """Deserialise request data using a Marshmallow schema.
 
     Why/How:
         Normalises inbound JSON (or XML) against ``input_schema`` and ignores
         relationship fields that arrive as plain strings (for example URLs) so
         PATCH operations can submit previous GET payloads without manual
-        sanitisation.
+        sanitisation. A JSON array sent with ``POST`` is validated with
+        ``many=True`` for bulk creation; its errors are keyed by item index.
 
     Args:
         input_schema: Marshmallow schema (class or instance) to validate and
@@ -49,8 +82,8 @@ def deserialise_data(input_schema: type[Schema], response: Response) -> dict[str
         response: Flask response proxy providing the request data.
 
     Returns:
-        The deserialised data on success, or ``(errors, 400)`` on validation
-        failure.
+        The deserialised data (a list for bulk payloads) on success, or
+        ``(errors, 400)`` on validation failure.
     """
     try:
         data = request.data.decode() if is_xml() else response.json
@@ -66,22 +99,17 @@ def deserialise_data(input_schema: type[Schema], response: Response) -> dict[str
         else:
             field_items = {k: v for k, v in input_schema._declared_fields.items() if not v.dump_only}
 
-        cleaned: dict[str, Any] = {}
-        source_data = data.get("deserialized_data", data)
-        for key, value in source_data.items():
-            field_obj = field_items.get(key)
-            if not field_obj:
-                continue
-            # ``fields.Nested`` expects a dict (or list for many). When a URL string
-            # from a previous GET request is supplied, the field should be ignored
-            # to allow partial updates without manual payload pruning.
-            if isinstance(field_obj, fields.Nested) and not isinstance(value, (dict | list)):
-                continue
-            if isinstance(field_obj, fields.List) and isinstance(field_obj.inner, fields.Nested) and not isinstance(value, list):
-                continue
-            cleaned[key] = value
-
-        data = cleaned
+        if isinstance(data, list) and request.method == "POST":
+            _check_bulk_size(input_schema, data)
+            if not data or not all(isinstance(item, dict) for item in data):
+                return {"_schema": ["Bulk payloads must be a non-empty list of objects."]}, 400
+            items = [_clean_input_item(item, field_items) for item in data]
+            try:
+                return input_schema().load(data=items, many=True)
+            except TypeError:
+                return input_schema.load(data=items, many=True)
+
+        data = _clean_input_item(data.get("deserialized_data", data), field_items)
         if request.method == "PATCH":
             from flarchitect.specs.utils import _prepare_patch_schema
 
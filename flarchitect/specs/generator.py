@@ -39,6 +39,7 @@ from flarchitect.utils.general import (
 )
 from flarchitect.utils.response_helpers import create_response
 from flarchitect.utils.session import get_session
+from flarchitect.utils.startup_profile import model_stage
 
 if TYPE_CHECKING:  # pragma: no cover - imported only for type hints
     from flarchitect import Architect
@@ -571,7 +572,9 @@ def register_routes_with_spec(architect: Architect, route_spec: list[dict[str, A
         return
 
     for route_info in route_spec:
-        with architect.app.test_request_context():
+        model = route_info.get("model")
+        profile_stage = model_stage(architect, model, "spec") if model is not None else contextlib.nullcontext()
+        with profile_stage, architect.app.test_request_context():
             f = route_info["function"]
             rule = find_rule_by_function(architect, f)
 
@@ -209,6 +209,26 @@ def generate_delete_query_params(schema: Schema, model: DeclarativeBase) -> list
     return query_params
 
 
+def generate_bulk_write_query_params(model: DeclarativeBase) -> list[dict[str, Any]]:
+    """Helper function to generate query parameters for collection PATCH/DELETE.
+
+    Args:
+        model (DeclarativeBase): The SQLAlchemy model.
+
+    Returns:
+        List[Dict[str, Any]]: List of query parameters for collection writes.
+    """
+    return [
+        {
+            "name": "dry_run",
+            "in": "query",
+            "schema": {"type": "boolean"},
+            "description": "If true or 1, report the number of matching rows without writing. "
+            f"Rows are selected with the same filters as `GET` on {model.__name__ if model else 'the collection'}; at least one filter is required.",
+        }
+    ]
+
+
 def generate_get_query_params(schema: Schema, model: DeclarativeBase) -> list[dict[str, Any]]:
     """Helper function to generate query parameters for GET method.
 
@@ -232,22 +252,42 @@ def generate_get_query_params(schema: Schema, model: DeclarativeBase) -> list[di
                 "description": "If true, deleted items will be included in the response.",
             }
         )
-    query_params.extend(
-        [
+    query_params.append(
+        {
+            "name": "limit",
+            "in": "query",
+            "schema": {"type": "integer", "example": 20},
+            "description": f"The maximum number of items to return in the response. Default `{page_default}` Maximum `{page_max}`.",
+        }
+    )
+    if str(get_config_or_model_meta("API_PAGINATION_MODE", model=model, default="page") or "page").lower() == "cursor":
+        query_params.append(
             {
-                "name": "limit",
+                "name": "cursor",
                 "in": "query",
-                "schema": {"type": "integer", "example": 20},
-                "description": f"The maximum number of items to return in the response. Default `{page_default}` Maximum `{page_max}`.",
-            },
+                "schema": {"type": "string"},
+                "description": "Opaque pagination cursor taken from `next_cursor` or `prev_cursor` of a previous response. Omit to fetch the first page.",
+            }
+        )
+    else:
+        query_params.append(
             {
                 "name": "page",
                 "in": "query",
                 "schema": {"type": "integer", "example": 1},
                 "description": "The pagination page number. Default `1`.",
-            },
-        ]
-    )
+            }
+        )
+    if get_config_or_model_meta("API_STREAMING", model=model, default=False):
+        query_params.append(
+            {
+                "name": "stream",
+                "in": "query",
+                "schema": {"type": "string", "enum": ["1", "json", "ndjson"]},
+                "description": "Stream every matching row instead of one page: `ndjson` writes one JSON object per line, `1`/`json` the usual envelope with "
+                "`total_count` after `value`. `limit`/`page` still apply when given.",
+            }
+        )
     return query_params
 
 
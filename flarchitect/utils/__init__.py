@@ -9,6 +9,7 @@ from . import cookies as cookies  # expose cookie helpers for blueprints
 from . import response_filters as response_filters  # expose for monkeypatching
 from . import session as session  # make submodule available as attribute
 from . import sse as sse  # SSE utilities for event streams
+from .config_helpers import invalidate_config_cache, set_model_meta
 from .cookies import cookie_settings
 from .session import get_session  # re-export convenience
 from .sse import model_event, sse_message, stream_model_events, stream_sse_response
@@ -17,9 +18,11 @@ __all__ = [
     "cookie_settings",
     "cookies",
     "get_session",
+    "invalidate_config_cache",
     "model_event",
     "response_filters",
     "session",
+    "set_model_meta",
     "sse",
     "sse_message",
     "stream_model_events",
@@ -1,3 +1,4 @@
+import itertools
 from typing import Any
 
 from flask import current_app, g, has_app_context, has_request_context, request
@@ -56,19 +57,205 @@ def _flask_config_lookup(keys: list[str]) -> Any | None:
     return None
 
 
-def _request_cache_get(cache_key: tuple[Any, ...]) -> tuple[bool, Any]:
-    if not has_request_context():
-        return False, None
-    cache = getattr(g, "_flarch_cfg_cache", None)
-    if cache is None:
-        cache = {}
-        g._flarch_cfg_cache = cache
-    return (True, cache[cache_key]) if cache_key in cache else (False, None)
+_MISSING = object()
+_CACHE_EXTENSION_KEY = "flarchitect.config_cache"
+# Bound on cached lookups per application; least recently used entries go first.
+_CACHE_MAX_ENTRIES = 4096
+# Bumped by ``invalidate_config_cache`` (and so ``set_model_meta``).
+_meta_version = 0
+_generations = itertools.count(1)
+
+
+class _ConfigCache:
+    """Resolved lookups for one application at one configuration version.
+
+    A cache is never emptied in place: a config write or
+    :func:`invalidate_config_cache` replaces it, so a request keeps reading
+    the cache it started with. ``generation`` is unique per cache.
+    """
 
+    __slots__ = ("entries", "evicting", "generation", "meta_version")
+
+    def __init__(self) -> None:
+        # ``(value, source)`` pairs, so a cached miss is never ``None``.
+        self.entries: dict[tuple[Any, ...], tuple[Any, str]] = {}
+        # Entries are kept in use order once the size bound has been reached.
+        self.evicting = False
+        self.generation = next(_generations)
+        self.meta_version = _meta_version
+
+    def get(self, key: tuple[Any, ...]) -> tuple[Any, str] | None:
+        entries = self.entries
+        value = entries.get(key)
+        if self.evicting and value is not None:
+            entries[key] = entries.pop(key)
+        return value
+
+    def put(self, key: tuple[Any, ...], value: tuple[Any, str]) -> None:
+        entries = self.entries
+        if len(entries) >= _CACHE_MAX_ENTRIES:
+            del entries[next(iter(entries))]
+            self.evicting = True
+        entries[key] = value
+
+
+class _ConfigWriteHook:
+    """Mixin for ``app.config`` dropping the lookup cache when a value changes."""
+
+    __slots__ = ()
+
+    def _flarch_written(self) -> None:
+        extensions = self.__dict__.get("_flarch_extensions")
+        if extensions is not None:
+            extensions.pop(_CACHE_EXTENSION_KEY, None)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        changed = self.get(key, _MISSING) is not value
+        super().__setitem__(key, value)
+        if changed:
+            self._flarch_written()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._flarch_written()
+
+    def __ior__(self, other: Any) -> Any:
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        present = key in self
+        value = super().pop(key, *default)
+        if present:
+            self._flarch_written()
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = super().popitem()
+        self._flarch_written()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._flarch_written()
+
+
+_HOOKED_CONFIG_CLASSES: dict[type, type] = {}
+
+
+def _hook_config_writes(app: Any) -> None:
+    config = app.config
+    if not isinstance(config, _ConfigWriteHook):
+        cls = type(config)
+        hooked = _HOOKED_CONFIG_CLASSES.get(cls)
+        if hooked is None:
+            hooked = _HOOKED_CONFIG_CLASSES[cls] = type(cls.__name__, (_ConfigWriteHook, cls), {"__slots__": (), "__module__": cls.__module__})
+        config.__class__ = hooked
+    config.__dict__["_flarch_extensions"] = app.extensions
+
+
+def _app_config_cache() -> _ConfigCache | None:
+    """Return the current application's lookup cache.
+
+    The cache is replaced when ``app.config`` is written to (the first cache
+    of an application hooks its config class for this) or
+    :func:`invalidate_config_cache` has been called. Inside a request the
+    cache found by the first lookup is used for the rest of the request.
+    """
 
-def _request_cache_set(cache_key: tuple[Any, ...], value: Any) -> None:
+    if not has_app_context():
+        return None
     if has_request_context():
-        g._flarch_cfg_cache[cache_key] = value
+        # Read ``g`` through its ``__dict__``: proxied attribute access and
+        # misses cost more than the lookup being cached.
+        current = request._get_current_object()
+        request_globals = g._get_current_object().__dict__
+        cache = request_globals.get("_flarch_cfg_cache")
+        if cache is not None and cache.meta_version == _meta_version and request_globals.get("_flarch_cfg_request") is current:
+            return cache
+        request_globals["_flarch_cfg_request"] = current
+        cache = request_globals["_flarch_cfg_cache"] = _current_app_config_cache()
+        return cache
+    return _current_app_config_cache()
+
+
+def _current_app_config_cache() -> _ConfigCache:
+    app = current_app._get_current_object()
+    cache = app.extensions.get(_CACHE_EXTENSION_KEY)
+    if cache is None or cache.meta_version != _meta_version:
+        _hook_config_writes(app)
+        cache = app.extensions[_CACHE_EXTENSION_KEY] = _ConfigCache()
+    return cache
+
+
+def config_version(model: Any = None) -> int | None:
+    """Return the generation of the current application's lookup cache.
+
+    The value changes whenever ``app.config`` is written to or
+    :func:`invalidate_config_cache` is called, so it can be used to invalidate
+    values derived from configuration. ``model`` is accepted for callers
+    keying on a model; ``Meta`` changes are signalled through
+    :func:`set_model_meta` or :func:`invalidate_config_cache`. ``None``
+    outside an app context.
+    """
+
+    cache = _app_config_cache()
+    return None if cache is None else cache.generation
+
+
+def invalidate_config_cache() -> None:
+    """Discard cached ``get_config_or_model_meta`` results in every application.
+
+    Writes to ``app.config`` are detected on the next request, and generated
+    routes detect changes to their model's ``Meta``. Other ``Meta`` changes
+    are not: use :func:`set_model_meta`, or call this (or
+    ``architect.reload_config()``) after assigning ``Meta`` attributes
+    directly.
+    """
+
+    global _meta_version
+    _meta_version += 1
+
+
+def set_model_meta(model: Any, **settings: Any) -> None:
+    """Set ``Meta`` attributes on ``model`` and invalidate cached lookups.
+
+    Args:
+        model: Model or schema class whose ``Meta`` is updated. A ``Meta``
+            class is created when the model has none.
+        **settings: Lower-case ``Meta`` attributes, e.g.
+            ``pagination_size_default=50``. ``None`` removes the attribute.
+
+    Example:
+        >>> set_model_meta(Book, pagination_mode="cursor")
+    """
+
+    meta = model.__dict__.get("Meta")
+    if meta is None:
+        meta = type("Meta", (), {})
+        model.Meta = meta
+    for name, value in settings.items():
+        if value is None:
+            if name in meta.__dict__:
+                delattr(meta, name)
+        else:
+            setattr(meta, name, value)
+    invalidate_config_cache()
+
+
+def _active_route_config() -> Any | None:
+    if not has_request_context():
+        return None
+    return g._get_current_object().__dict__.get("_flarch_route_config")
 
 
 def _with_source(value: Any, source: str, return_from_config: bool) -> Any:
@@ -106,6 +293,46 @@ def get_config_or_model_meta(
         Any: The value from the config or model meta, or the default value.
     """
 
+    # Generated routes resolve their settings once into a ``RouteConfig``
+    # snapshot (see ``flarchitect.core.route_config``).
+    route_config = _active_route_config()
+    if route_config is not None and output_schema is None and input_schema is None and not allow_join and not return_from_config:
+        found, value = route_config.lookup(key, model, method)
+        if found:
+            return default if value is None else value
+
+    method_name = method.lower() if isinstance(method, str) else str(method)
+    cache_key: tuple = (
+        key,
+        model,
+        type(output_schema) if output_schema is not None else None,
+        type(input_schema) if input_schema is not None else None,
+        bool(allow_join),
+        method_name,
+    )
+    # Application-wide cache of resolved values, including misses, replaced
+    # when ``app.config`` is written to or ``invalidate_config_cache`` is called.
+    cache = _app_config_cache()
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            value, source = cached
+            return _with_source(default if source == "default" else value, source, return_from_config)
+
+    value, source = _resolve_config_or_model_meta(key, model, output_schema, input_schema, allow_join, method)
+    if cache is not None:
+        cache.put(cache_key, (value, source))
+    return _with_source(default if source == "default" else value, source, return_from_config)
+
+
+def _resolve_config_or_model_meta(
+    key: str,
+    model: DeclarativeBase | None,
+    output_schema: Schema | None,
+    input_schema: Schema | None,
+    allow_join: bool,
+    method: str,
+) -> tuple[Any, str]:
     normalized_key = _normalise_config_key(key)
     method_based_keys = _method_based_keys(normalized_key.replace("api_", ""), method)
 
@@ -114,40 +341,20 @@ def get_config_or_model_meta(
         [
             *method_based_keys,
             normalized_key,
-            _normalise_config_key(key).replace("api_", ""),
+            normalized_key.replace("api_", ""),
         ]
     )
     keys_for_config = [*method_based_keys, normalized_key]
 
-    # Request-local memoization cache (only caches positive lookups)
-    cache_key: tuple = (
-        normalized_key,
-        getattr(model, "__name__", None) if model is not None else None,
-        getattr(type(output_schema), "__name__", None) if output_schema is not None else None,
-        getattr(type(input_schema), "__name__", None) if input_schema is not None else None,
-        bool(allow_join),
-        method.lower() if isinstance(method, str) else str(method),
-        bool(return_from_config),
-    )
-
-    found, cached_value = _request_cache_get(cache_key)
-    if found:
-        return cached_value
-
-    # Perform lookups
     model_result = _source_lookup(sources, keys_for_sources, allow_join=allow_join)
     if _has_config_value(model_result):
-        out = _with_source(model_result, "model", return_from_config)
-        _request_cache_set(cache_key, out)
-        return out
+        return model_result, "model"
 
     cfg_result = _flask_config_lookup(keys_for_config)
     if _has_config_value(cfg_result):
-        out = _with_source(cfg_result, "config", return_from_config)
-        _request_cache_set(cache_key, out)
-        return out
+        return cfg_result, "config"
 
-    return _with_source(default, "default", return_from_config)
+    return None, "default"
 
 
 def is_xml() -> bool:
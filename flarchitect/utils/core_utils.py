@@ -1,9 +1,12 @@
 """Core utility helpers for data manipulation."""
 
+import importlib.util
+import inspect
 import re
 from typing import Any
 
 from dicttoxml import dicttoxml
+from flask import current_app
 
 
 def convert_case(s: str, target_case: str) -> str:
@@ -79,8 +82,57 @@ def dict_to_xml(input_dict: dict) -> str:
     return xml_bytes.decode()
 
 
-def get_count(result: dict[str, Any], value: Any) -> int:
-    """Determine the count of records in the result."""
+def get_count(result: dict[str, Any], value: Any) -> int | None:
+    """Determine the count of records in the result.
+
+    Returns ``None`` when the payload was produced with
+    ``API_TOTAL_COUNT_MODE="none"`` so the skipped count is not mistaken for
+    the page length.
+    """
+    if isinstance(result, dict) and result.get("total_count_mode") == "none":
+        return None
     if isinstance(result, dict) and result.get("total_count"):
         return result["total_count"]
     return len(value) if isinstance(value, list) else (0 if not value else 1)
+
+
+def require_async_support(awaitable: Any = None) -> None:
+    """Raise ``RuntimeError`` unless Flask's ``async`` extra is installed.
+
+    Args:
+        awaitable: Coroutine that will not be run; it is closed before
+            raising so Python does not warn that it was never awaited.
+    """
+
+    if importlib.util.find_spec("asgiref") is None:
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise RuntimeError("Coroutine hooks and plugins require asgiref. Please install flask[async].")
+
+
+def resolve_awaitable(value: Any) -> Any:
+    """Return ``value``, awaiting it first when a hook returned an awaitable.
+
+    Coroutine hooks, callbacks and plugins run to completion the way Flask
+    runs ``async def`` views: on an event loop driven by
+    :meth:`Flask.async_to_sync <flask.Flask.async_to_sync>` in the current
+    worker.
+
+    Args:
+        value: Result returned by a hook or plugin.
+
+    Returns:
+        Any: ``value`` itself, or the awaited result.
+
+    Raises:
+        RuntimeError: If ``value`` is awaitable and ``flask[async]`` is not
+            installed.
+    """
+    if not inspect.isawaitable(value):
+        return value
+    require_async_support(value)
+
+    async def _await() -> Any:
+        return await value
+
+    return current_app.async_to_sync(_await)()
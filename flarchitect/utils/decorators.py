@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import inspect
 from collections.abc import Callable
 from functools import wraps
 from typing import TYPE_CHECKING, Any
@@ -17,6 +18,8 @@ from flarchitect.utils.core_utils import convert_case
 from flarchitect.utils.general import HTTP_BAD_REQUEST, HTTP_INTERNAL_SERVER_ERROR
 from flarchitect.utils.response_helpers import create_response
 from flarchitect.utils.responses import serialise_output_with_mallow
+from flarchitect.utils.streaming import is_streamed_result, stream_collection_response, streaming_format
+from flarchitect.utils.timing import stage
 
 if TYPE_CHECKING:  # pragma: no cover - used only for type checking
     from flarchitect.schemas.bases import AutoSchema
@@ -56,7 +59,11 @@ def add_page_totals_and_urls(f: Callable) -> Callable:
     Why/How:
         Uses the current request URL and the returned ``page``, ``limit`` and
         ``total_count`` values to calculate ``next_url``, ``previous_url``,
-        ``current_page`` and ``total_pages``.
+        ``current_page`` and ``total_pages``. Payloads flagged with
+        ``has_next`` (non-exact ``API_TOTAL_COUNT_MODE``) derive the links from
+        that flag instead of the total. Cursor paginated payloads (those
+        carrying ``next_cursor``/``prev_cursor``) link to the neighbouring
+        cursors and leave the page arithmetic unset.
 
     Args:
         f: Function to decorate.
@@ -68,6 +75,22 @@ def add_page_totals_and_urls(f: Callable) -> Callable:
     @wraps(f)
     def decorated_function(*args, **kwargs):
         output = f(*args, **kwargs)
+        if isinstance(output, dict) and ("next_cursor" in output or "prev_cursor" in output):
+            parsed_url = urlparse(request.url)
+            query_params = parse_qs(parsed_url.query)
+            query_params.pop("page", None)
+            if output.get("limit"):
+                query_params["limit"] = [str(output["limit"])]
+            output.update(
+                {
+                    "next_url": _construct_cursor_url(parsed_url, query_params, output.get("next_cursor")),
+                    "previous_url": _construct_cursor_url(parsed_url, query_params, output.get("prev_cursor")),
+                    "current_page": None,
+                    "total_pages": None,
+                }
+            )
+            return output
+
         limit, page, total_count = (
             output.get("limit"),
             output.get("page"),
@@ -76,7 +99,21 @@ def add_page_totals_and_urls(f: Callable) -> Callable:
 
         next_url, previous_url, current_page, total_pages = None, None, None, None
 
-        if total_count and limit:
+        if "has_next" in output and limit:
+            # Non-exact count modes detect the next page by over-fetching one
+            # row, so links never depend on an estimated or missing total.
+            total_pages = -(-total_count // limit) if total_count else None
+            current_page = page
+
+            parsed_url = urlparse(request.url)
+            query_params = parse_qs(parsed_url.query)
+
+            query_params["limit"] = [str(limit)]
+            if output["has_next"]:
+                next_url = _page_url(parsed_url, query_params, page + 1)
+            if page > 1:
+                previous_url = _page_url(parsed_url, query_params, page - 1)
+        elif total_count and limit:
             total_pages = -(-total_count // limit)  # Ceiling division
             current_page = page
 
@@ -117,11 +154,33 @@ def _construct_url(parsed_url, query_params, page, total_count, limit):
         The constructed URL string or ``None`` if out of range.
     """
     if 0 < page <= total_count // limit:
-        query_params["page"] = [str(page)]
-        return urlunparse(parsed_url._replace(query=urlencode(query_params, doseq=True)))
+        return _page_url(parsed_url, query_params, page)
     return None
 
 
+def _page_url(parsed_url, query_params, page):
+    """Construct a pagination URL for ``page`` without bounds checks."""
+    query_params["page"] = [str(page)]
+    return urlunparse(parsed_url._replace(query=urlencode(query_params, doseq=True)))
+
+
+def _construct_cursor_url(parsed_url, query_params, cursor):
+    """Construct a pagination URL pointing at ``cursor``.
+
+    Args:
+        parsed_url: Parsed URL tuple from :func:`urllib.parse.urlparse`.
+        query_params: Mapping of query parameters to encode.
+        cursor: Opaque cursor token, or ``None`` when there is no such page.
+
+    Returns:
+        The constructed URL string or ``None`` if ``cursor`` is empty.
+    """
+    if not cursor:
+        return None
+    params = {**query_params, "cursor": [cursor]}
+    return urlunparse(parsed_url._replace(query=urlencode(params, doseq=True)))
+
+
 def handle_many(output_schema: type[AutoSchema] | None, input_schema: type[AutoSchema] | None = None) -> Callable:
     """Serialise a list response and optionally deserialise input.
 
@@ -153,6 +212,23 @@ def handle_one(output_schema: type[AutoSchema] | None, input_schema: type[AutoSc
     return _handle_decorator(output_schema, input_schema, many=False)
 
 
+def _accepted_kwargs(func: Callable) -> frozenset[str] | None:
+    """Return the keyword arguments ``func`` accepts, or ``None`` for all.
+
+    ``None`` is returned when ``func`` takes ``**kwargs`` (so decorator-injected
+    helpers such as route factories still receive ``deserialized_data`` and
+    ``model``) or when its signature cannot be inspected.
+    """
+
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    if any(param.kind == inspect.Parameter.VAR_KEYWORD for param in parameters):
+        return None
+    return frozenset(param.name for param in parameters)
+
+
 def _handle_decorator(
     output_schema: type[AutoSchema] | None,
     input_schema: type[AutoSchema] | None,
@@ -170,13 +246,17 @@ def _handle_decorator(
     """
 
     def decorator(func: Callable) -> Callable:
+        accepted = _accepted_kwargs(func)
+
         # Core logic shared by both branches (with/without fields wrapper)
         def _core(*args: Any, **kwargs: dict[str, Any]) -> dict[str, Any] | tuple:
             if input_schema:
-                data_or_error = deserialise_data(input_schema, request)
+                with stage("deserialise"):
+                    data_or_error = deserialise_data(input_schema, request)
                 if isinstance(data_or_error, tuple):  # Error occurred during deserialisation
                     case = get_config_or_model_meta("API_FIELD_CASE", default="snake")
-                    error = {convert_case(k, case): v for k, v in data_or_error[0].items()}
+                    # Bulk payload errors are keyed by item index rather than field name.
+                    error = {convert_case(k, case) if isinstance(k, str) else k: v for k, v in data_or_error[0].items()}
                     raise CustomHTTPException(HTTP_BAD_REQUEST, error)
                 kwargs["deserialized_data"] = data_or_error
                 kwargs["model"] = getattr(input_schema.Meta, "model", None)
@@ -184,20 +264,22 @@ def _handle_decorator(
             # Extract any schema injected by fields() so it isn't passed to func
             new_output_schema: type[AutoSchema] | None = kwargs.pop("schema", None)
 
-            # Filter kwargs to only those accepted by the target function. If
-            # the target accepts ``**kwargs`` forward the full mapping so
-            # decorator-injected helpers (e.g. route factories) retain access
-            # to values like ``deserialized_data`` and ``model``.
-            import inspect as _inspect
-
-            sig = _inspect.signature(func)
-            accepts_var_kwargs = any(param.kind == _inspect.Parameter.VAR_KEYWORD for param in sig.parameters.values())
-            accepted = set(sig.parameters.keys())
+            # Streamed collection reads (``API_STREAMING``) ask the service for
+            # a lazy query and write it out row batch by row batch below.
+            if many and new_output_schema is not None and request.method == "GET":
+                stream_format = streaming_format(getattr(getattr(output_schema, "Meta", None), "model", None))
+                if stream_format:
+                    kwargs["stream"] = stream_format
 
-            filtered_kwargs = dict(kwargs) if accepts_var_kwargs else {k: v for k, v in kwargs.items() if k in accepted}
+            filtered_kwargs = kwargs if accepted is None else {k: v for k, v in kwargs.items() if k in accepted}
 
             result = func(*args, **filtered_kwargs)
-            return serialise_output_with_mallow(new_output_schema, result) if new_output_schema else result
+            if new_output_schema and is_streamed_result(result):
+                return stream_collection_response(new_output_schema, result)
+            if not new_output_schema:
+                return result
+            with stage("serialise"):
+                return serialise_output_with_mallow(new_output_schema, result)
 
         # Assemble wrapper with or without the fields() decorator
         if output_schema is not None:
@@ -231,6 +313,9 @@ def _response_from_result(result: Any) -> Response:
 
 
 def _response_payload(response: Response) -> dict[str, Any]:
+    if response.is_streamed:
+        # Reading the body would consume the stream before it is sent.
+        return {}
     payload = response.get_json(silent=True) or {}
     return payload if isinstance(payload, dict) else {}
 
@@ -318,13 +403,32 @@ def standardize_response(func: Callable) -> Callable:  # pragma: no cover - shim
     return standardise_response(func)
 
 
+def _field_selection(schema: AutoSchema, names: list[str]) -> dict[str, str]:
+    """Map selected schema fields to model attributes and how they are dumped.
+
+    Returns:
+        dict[str, str]: Model attribute name to ``"url"`` or ``"nested"`` for
+        relationships and ``"field"`` for everything else. ``CrudService``
+        uses it to narrow the columns and relationships it loads.
+    """
+
+    selection: dict[str, str] = {}
+    for name in names:
+        field = schema.fields[name]
+        relationship = (field.metadata or {}).get("_fa_relationship") or {}
+        attribute = relationship.get("attribute") or field.attribute or name
+        selection[attribute] = relationship.get("kind") or "field"
+    return selection
+
+
 def fields(model_schema: type[AutoSchema] | None, many: bool = False) -> Callable:
     """Control which fields are serialised on the response.
 
     Why/How:
         Reads an optional ``fields`` query parameter and re-instantiates the
-        output schema with ``only`` to reduce payload size. Falls back to the
-        full schema when the parameter is absent.
+        output schema with ``only`` to reduce payload size. The selection is
+        also passed on as ``field_selection`` so the query can skip unused
+        columns. Falls back to the full schema when the parameter is absent.
 
     Args:
         model_schema: Marshmallow schema class for the response.
@@ -341,6 +445,21 @@ def fields(model_schema: type[AutoSchema] | None, many: bool = False) -> Callabl
 
         return _noop
 
+    schema_class = model_schema if callable(model_schema) else model_schema.__class__
+    # ``AutoSchema`` fields depend on configuration and the request, so the
+    # selection is applied to the instance built for the request. Other schemas
+    # declare a fixed set of fields, read once.
+    narrows_in_place = hasattr(schema_class, "_apply_only")
+    static_names: list[frozenset[str]] = []
+
+    def available_names() -> frozenset[str]:
+        if not static_names:
+            try:
+                static_names.append(frozenset((schema_class() if callable(model_schema) else model_schema).fields))
+            except Exception:
+                return frozenset()
+        return static_names[0]
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: dict[str, Any]) -> Any:
@@ -348,23 +467,24 @@ def fields(model_schema: type[AutoSchema] | None, many: bool = False) -> Callabl
                 return func(*args, **kwargs)
 
             select_fields = request.args.get("fields")
-            if select_fields and get_config_or_model_meta("API_ALLOW_SELECT_FIELDS", model_schema.Meta.model, default=True):
-                requested = [field.split(".")[-1] for field in select_fields.split(",")]
-                # Only pass fields that actually exist on the schema to avoid KeyErrors
-                try:
-                    available = set((model_schema().fields.keys()) if callable(model_schema) else model_schema.fields.keys())
-                except Exception:
-                    available = set()
-                filtered = [f for f in requested if f in available]
-                if callable(model_schema):
-                    kwargs["schema"] = model_schema(many=many, only=filtered) if filtered else model_schema(many=many)
-                else:
-                    kwargs["schema"] = model_schema.__class__(many=many, only=filtered) if filtered else model_schema.__class__(many=many)
+            if not (select_fields and get_config_or_model_meta("API_ALLOW_SELECT_FIELDS", model_schema.Meta.model, default=True)):
+                kwargs["schema"] = schema_class(many=many)
+                return func(*args, **kwargs)
+
+            requested = [field.split(".")[-1] for field in select_fields.split(",")]
+            # Only pass fields that actually exist on the schema to avoid KeyErrors
+            if narrows_in_place:
+                schema = schema_class(many=many)
+                filtered = [f for f in requested if f in schema.fields]
+                if filtered:
+                    schema._apply_only(filtered)
             else:
-                if callable(model_schema):
-                    kwargs["schema"] = model_schema(many=many)
-                else:
-                    kwargs["schema"] = model_schema.__class__(many=many)
+                available = available_names()
+                filtered = [f for f in requested if f in available]
+                schema = schema_class(many=many, only=filtered) if filtered else schema_class(many=many)
+            kwargs["schema"] = schema
+            if filtered:
+                kwargs["field_selection"] = _field_selection(schema, filtered)
 
             return func(*args, **kwargs)
 
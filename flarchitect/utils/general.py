@@ -1,9 +1,14 @@
+import contextlib
 import importlib.util
+import json
 import os
 import pprint
 import re
 import socket
+import threading
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 from importlib.machinery import ModuleSpec
 from pathlib import Path
@@ -195,6 +200,90 @@ def check_rate_prerequisites(
         raise ImportError("MongoDB prerequisite not available. Please install pymongo " + back_end_spec)
 
 
+_RATE_SERVICE_PORTS = {
+    "Memcached": 11211,
+    "Redis": 6379,
+    "MongoDB": 27017,
+}
+_RATE_SERVICE_SCHEMES = {
+    "Memcached": "memcached",
+    "Redis": "redis",
+    "MongoDB": "mongodb",
+}
+# Process-wide detection results keyed on the probe timeout. Pre-forked
+# workers inherit the entry detected in the master process.
+_DETECTED_RATE_SERVICES: dict[float, str | None] = {}
+_RATE_DETECTION_LOCK = threading.Lock()
+#: Outcome of the most recent rate limit backend resolution, for startup
+#: diagnostics: ``uri``, ``source`` (``config``, ``disabled``, ``probe``,
+#: ``process`` or ``file``) and ``elapsed_ms``.
+rate_service_detection: dict[str, Any] = {}
+
+
+def _probe_port(socket_factory: Callable[..., socket.socket], port: int, timeout: float) -> bool:
+    sock = socket_factory(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(("127.0.0.1", port))
+        return True
+    except PermissionError:
+        raise
+    except OSError:
+        return False
+    finally:
+        with contextlib.suppress(Exception):
+            sock.close()
+
+
+def detect_rate_service(
+    prereq_checker: Callable[[str], None] = check_rate_prerequisites,
+    socket_factory: Callable[..., socket.socket] = socket.socket,
+    timeout: float = 0.05,
+) -> str | None:
+    """Probe local Memcached, Redis and MongoDB ports in parallel.
+
+    All ports are probed at once, so detection takes at most ``timeout``
+    seconds however many services are missing. When several are listening the
+    first of Memcached, Redis and MongoDB wins, as with sequential probing.
+
+    Returns:
+        Optional[str]: URI of the detected service, or ``None`` when nothing
+        is listening or sockets are not permitted.
+    """
+
+    with ThreadPoolExecutor(max_workers=len(_RATE_SERVICE_PORTS)) as pool:
+        futures = {service: pool.submit(_probe_port, socket_factory, port, timeout) for service, port in _RATE_SERVICE_PORTS.items()}
+        try:
+            listening = [service for service, future in futures.items() if future.result()]
+        except PermissionError:
+            # Sockets disabled by the runtime (e.g. sandbox). Fall back to in-memory.
+            return None
+
+    if not listening:
+        return None
+    service = listening[0]
+    prereq_checker(service)
+    return f"{_RATE_SERVICE_SCHEMES[service]}://127.0.0.1:{_RATE_SERVICE_PORTS[service]}"
+
+
+def _read_rate_detection_file(path: str) -> tuple[bool, str | None]:
+    try:
+        payload = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return False, None
+    if not isinstance(payload, dict) or "uri" not in payload:
+        return False, None
+    return True, payload["uri"]
+
+
+def _write_rate_detection_file(path: str, uri: str | None) -> None:
+    with contextlib.suppress(OSError):
+        target = Path(path)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"uri": uri}))
+        tmp.replace(target)
+
+
 def check_rate_services(
     config_getter: Callable[[str, Any, Any], Any] = get_config_or_model_meta,
     prereq_checker: Callable[[str], None] = check_rate_prerequisites,
@@ -214,15 +303,24 @@ def check_rate_services(
     detect running local services for Memcached, Redis, or MongoDB and returns
     the appropriate URI.
 
+    Detection probes all ports in parallel with an
+    ``API_RATE_LIMIT_DETECT_TIMEOUT`` (default 50 ms) connect timeout. The
+    result is cached for the process and, when
+    ``API_RATE_LIMIT_DETECT_CACHE_FILE`` is set, in that file so pre-forked
+    workers and later boots skip probing. Injected socket factories bypass
+    both caches.
+
     Returns:
         Optional[str]: The URI of the running service, or ``None`` if no service
         is found.
     """
-    services = {
-        "Memcached": 11211,
-        "Redis": 6379,
-        "MongoDB": 27017,
-    }
+    started = time.perf_counter()
+
+    def record(uri: str | None, source: str) -> str | None:
+        rate_service_detection.clear()
+        rate_service_detection.update(uri=uri, source=source, elapsed_ms=round((time.perf_counter() - started) * 1000, 3))
+        return uri
+
     uri = config_getter("API_RATE_LIMIT_STORAGE_URI", default=None)
     if uri:
         parsed = urlparse(uri)
@@ -242,36 +340,35 @@ def check_rate_services(
         service_name = scheme_map[parsed.scheme]
         if service_name:
             prereq_checker(service_name)
-        return uri
+        return record(uri, "config")
 
     # Allow disabling auto-detection in constrained environments (e.g. sandboxes/CI)
     if config_getter("API_RATE_LIMIT_AUTODETECT", default=True) is False:
-        return None
-
-    for service, port in services.items():
-        try:
-            sock = socket_factory(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            try:
-                sock.connect(("127.0.0.1", port))
-                sock.close()
-                prereq_checker(service)
-
-                rate_type = {
-                    "Memcached": f"memcached://127.0.0.1:{port}",
-                    "Redis": f"redis://127.0.0.1:{port}",
-                    "MongoDB": f"mongodb://127.0.0.1:{port}",
-                }
-                return rate_type[service]
-
-            except OSError:
-                # Nothing listening on this port; try the next service
-                continue
-        except PermissionError:
-            # Sockets disabled by the runtime (e.g. sandbox). Fall back to in-memory.
-            return None
-
-    return None
+        return record(None, "disabled")
+
+    timeout = float(config_getter("API_RATE_LIMIT_DETECT_TIMEOUT", default=0.05) or 0.05)
+    if socket_factory is not socket.socket:
+        return record(detect_rate_service(prereq_checker, socket_factory, timeout), "probe")
+
+    with _RATE_DETECTION_LOCK:
+        if timeout in _DETECTED_RATE_SERVICES:
+            return record(_DETECTED_RATE_SERVICES[timeout], "process")
+        cache_file = config_getter("API_RATE_LIMIT_DETECT_CACHE_FILE", default=None)
+        found, detected = _read_rate_detection_file(cache_file) if cache_file else (False, None)
+        source = "file"
+        if not found:
+            detected, source = detect_rate_service(prereq_checker, socket_factory, timeout), "probe"
+            if cache_file:
+                _write_rate_detection_file(cache_file, detected)
+        _DETECTED_RATE_SERVICES[timeout] = detected
+        return record(detected, source)
+
+
+def clear_rate_service_cache() -> None:
+    """Forget detected rate limit backends so the next lookup probes again."""
+
+    with _RATE_DETECTION_LOCK:
+        _DETECTED_RATE_SERVICES.clear()
 
 
 def validate_flask_limiter_rate_limit_string(rate_limit_str: str) -> bool:
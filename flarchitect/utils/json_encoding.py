@@ -0,0 +1,207 @@
+"""Pluggable JSON encoders for responses, SSE, WebSocket messages and JSON logs.
+
+``API_JSON_ENCODER`` selects the backend used wherever flarchitect writes JSON:
+
+* ``"json"`` (default): the standard library, with responses going through
+  Flask's JSON provider exactly as before;
+* ``"orjson"`` or ``"msgspec"``: compiled encoders, when installed;
+* ``"auto"``: the first installed of ``orjson`` and ``msgspec``, else ``"json"``;
+* a callable ``obj -> str | bytes``.
+
+A named backend that is not installed falls back to the standard library with a
+warning. The compiled backends write ``datetime``/``date``/``time`` as ISO 8601,
+``Decimal`` and ``UUID`` as strings and ``Enum`` members by value, and honour
+the application's ``app.json.sort_keys``. Schema-dumped rows already hold ISO
+strings, but raw ``datetime`` and ``date`` values placed in a payload differ
+from the ``"json"`` path, where Flask's provider writes them as HTTP dates
+(``"Wed, 21 Oct 2015 07:28:00 GMT"``).
+"""
+
+from __future__ import annotations
+
+import datetime
+import importlib.util
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from flask import Response, current_app, has_app_context, jsonify
+
+from flarchitect.logging import logger
+from flarchitect.utils.config_helpers import get_config_or_model_meta
+
+_EXTENSION_KEY = "flarchitect.json_encoder"
+_COMPILED_BACKENDS = ("orjson", "msgspec")
+
+Default = Callable[[Any], Any]
+
+
+@dataclass(frozen=True)
+class JSONEncoder:
+    """Encoder resolved from ``API_JSON_ENCODER``.
+
+    Attributes:
+        name: Backend name (``"orjson"``, ``"msgspec"`` or the callable's name).
+        encode: ``(obj, default) -> bytes``; ``default`` handles types the
+            backend and :func:`json_default` do not.
+    """
+
+    name: str
+    encode: Callable[[Any, Default | None], bytes]
+
+    def dumpb(self, obj: Any, default: Default | None = None) -> bytes:
+        """Encode ``obj`` to UTF-8 bytes."""
+
+        return self.encode(obj, default)
+
+    def dumps(self, obj: Any, default: Default | None = None) -> str:
+        """Encode ``obj`` to a string."""
+
+        return self.encode(obj, default).decode()
+
+
+def json_default(value: Any) -> Any:
+    """Convert the non-JSON types flarchitect payloads commonly carry.
+
+    Raises:
+        TypeError: For any other type, like :func:`json.dumps`.
+    """
+
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _chain(default: Default | None) -> Default:
+    if default is None:
+        return json_default
+
+    def hook(value: Any) -> Any:
+        try:
+            return json_default(value)
+        except TypeError:
+            return default(value)
+
+    return hook
+
+
+def _orjson_encoder(sort_keys: bool) -> JSONEncoder:
+    import orjson
+
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+
+    def encode(obj: Any, default: Default | None) -> bytes:
+        return orjson.dumps(obj, default=_chain(default), option=option)
+
+    return JSONEncoder("orjson", encode)
+
+
+def _msgspec_encoder(sort_keys: bool) -> JSONEncoder:
+    import msgspec
+
+    order = "sorted" if sort_keys else None
+    shared = msgspec.json.Encoder(enc_hook=json_default, decimal_format="string", order=order)
+
+    def encode(obj: Any, default: Default | None) -> bytes:
+        if default is None:
+            return shared.encode(obj)
+        return msgspec.json.Encoder(enc_hook=_chain(default), decimal_format="string", order=order).encode(obj)
+
+    return JSONEncoder("msgspec", encode)
+
+
+def _callable_encoder(func: Callable[[Any], str | bytes]) -> JSONEncoder:
+    def encode(obj: Any, default: Default | None) -> bytes:
+        result = func(obj)
+        return result.encode() if isinstance(result, str) else result
+
+    return JSONEncoder(getattr(func, "__name__", "custom"), encode)
+
+
+_BACKENDS: dict[str, Callable[[bool], JSONEncoder]] = {
+    "orjson": _orjson_encoder,
+    "msgspec": _msgspec_encoder,
+}
+
+
+def resolve_json_encoder(spec: Any, *, sort_keys: bool = True) -> JSONEncoder | None:
+    """Build the encoder for an ``API_JSON_ENCODER`` value.
+
+    Args:
+        spec: Backend name or callable.
+        sort_keys: Whether compiled backends sort object keys.
+
+    Returns:
+        JSONEncoder | None: ``None`` selects the standard library.
+
+    Raises:
+        ValueError: If ``spec`` names an unknown backend.
+    """
+
+    if spec is None:
+        return None
+    if callable(spec):
+        return _callable_encoder(spec)
+
+    name = str(spec).strip().lower()
+    if name == "json":
+        return None
+    if name == "auto":
+        available = next((backend for backend in _COMPILED_BACKENDS if importlib.util.find_spec(backend) is not None), None)
+        return _BACKENDS[available](sort_keys) if available else None
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown API_JSON_ENCODER {spec!r}; expected 'json', 'orjson', 'msgspec', 'auto' or a callable.")
+    if importlib.util.find_spec(name) is None:
+        logger.error(1, f"API_JSON_ENCODER is `{name}` but it is not installed; using the standard library json module.")
+        return None
+    return _BACKENDS[name](sort_keys)
+
+
+def get_json_encoder() -> JSONEncoder | None:
+    """Return the encoder configured for the current application.
+
+    Resolved once per application and stored in ``app.extensions``. ``None``
+    (the standard library) is returned outside an application context.
+    """
+
+    if not has_app_context():
+        return None
+    extensions = current_app.extensions
+    if _EXTENSION_KEY not in extensions:
+        spec = get_config_or_model_meta("API_JSON_ENCODER", default="json")
+        extensions[_EXTENSION_KEY] = resolve_json_encoder(spec, sort_keys=bool(getattr(current_app.json, "sort_keys", True)))
+    return extensions[_EXTENSION_KEY]
+
+
+def json_dumps(obj: Any, default: Default | None = None) -> str:
+    """Encode ``obj`` with the configured encoder, or :func:`json.dumps`."""
+
+    encoder = get_json_encoder()
+    return encoder.dumps(obj, default) if encoder else json.dumps(obj, default=default)
+
+
+def json_response(data: Any, status: int = 200) -> Response:
+    """Return ``data`` as a JSON :class:`~flask.Response` using the configured encoder."""
+
+    encoder = get_json_encoder()
+    response = jsonify(data) if encoder is None else current_app.response_class(encoder.dumpb(data) + b"\n", mimetype=current_app.json.mimetype)
+    response.status_code = status
+    return response
+
+
+__all__ = [
+    "JSONEncoder",
+    "get_json_encoder",
+    "json_default",
+    "json_dumps",
+    "json_response",
+    "resolve_json_encoder",
+]
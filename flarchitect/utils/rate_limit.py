@@ -0,0 +1,76 @@
+"""Deferred rate limit backend detection.
+
+Flask-Limiter builds its storage once, in ``init_app``. Probing for a local
+Memcached, Redis or MongoDB server at that point adds the probe time to every
+application start, including short-lived CLI commands and test apps that
+never serve a rate-limited request.
+
+With ``API_RATE_LIMIT_LAZY_DETECT`` enabled, the limiter is given a
+``flarchitect-detect://`` storage URI instead. :class:`DetectingStorage`
+registers that scheme with :mod:`limits` and runs
+:func:`~flarchitect.utils.general.check_rate_services` the first time a limit
+is hit. Every later call goes to the detected backend, or to in-memory
+storage when none is found.
+
+Only the fixed-window strategy is supported. Moving-window and
+sliding-window-counter limiters need storage capabilities that are unknown
+before detection, so they always detect at startup.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from limits.storage import Storage, storage_from_string
+
+from flarchitect.utils.general import check_rate_services
+
+__all__ = ["LAZY_DETECT_URI", "DetectingStorage"]
+
+LAZY_DETECT_URI = "flarchitect-detect://"
+
+
+class DetectingStorage(Storage):
+    """Storage that detects and delegates to the real backend on first use."""
+
+    STORAGE_SCHEME = ["flarchitect-detect"]
+
+    def __init__(self, uri: str | None = None, wrap_exceptions: bool = False, **options: Any) -> None:
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self._options = options
+        self._storage: Storage | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def storage(self) -> Storage:
+        """The detected backend, resolved on first access."""
+
+        if self._storage is None:
+            with self._lock:
+                if self._storage is None:
+                    uri = check_rate_services() or "memory://"
+                    self._storage = storage_from_string(uri, wrap_exceptions=self.wrap_exceptions, **self._options)
+        return self._storage
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return self.storage.base_exceptions
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        return self.storage.incr(key, expiry, amount=amount)
+
+    def get(self, key: str) -> int:
+        return self.storage.get(key)
+
+    def get_expiry(self, key: str) -> float:
+        return self.storage.get_expiry(key)
+
+    def check(self) -> bool:
+        return self.storage.check()
+
+    def reset(self) -> int | None:
+        return self.storage.reset()
+
+    def clear(self, key: str) -> None:
+        return self.storage.clear(key)
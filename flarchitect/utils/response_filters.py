@@ -19,6 +19,7 @@ def _filter_response_data(data: dict[str, Any]) -> dict[str, Any]:
         "status_code": "API_DUMP_STATUS_CODE",
         "response_ms": "API_DUMP_RESPONSE_MS",
         "total_count": "API_DUMP_TOTAL_COUNT",
+        "total_count_estimated": "API_DUMP_TOTAL_COUNT",
     }
 
     for key, config_key in filters.items():
@@ -3,12 +3,14 @@ from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import Any
 
-from flask import Response, current_app, g, jsonify
+from flask import Response, current_app, g
 
 from flarchitect.utils.config_helpers import get_config_or_model_meta, is_xml
 from flarchitect.utils.core_utils import convert_case, dict_to_xml
 from flarchitect.utils.general import HTTP_BAD_REQUEST, handle_result
+from flarchitect.utils.json_encoding import json_response
 from flarchitect.utils.response_filters import _filter_response_data
+from flarchitect.utils.timing import stage, timed
 
 
 def _prepare_response_components(
@@ -40,6 +42,16 @@ def _prepare_response_components(
     return status, value, errors, count, next_url, previous_url
 
 
+def _pagination_components(result: Any | None) -> dict[str, Any]:
+    """Extract cursor tokens and the estimated-count marker from ``result``."""
+
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[1], int):
+        result = result[0]
+    if not isinstance(result, dict):
+        return {}
+    return {key: result[key] for key in ("next_cursor", "prev_cursor", "total_count_estimated") if key in result}
+
+
 def _ensure_response_ms(response_ms: float | None) -> float | str:
     """Return a response-time metric, falling back to ``g.start_time``.
 
@@ -65,6 +77,7 @@ def _extract_serialisable_value(value: Any | None) -> Any | None:
     return getattr(value, "value", value)
 
 
+@timed("response")
 def create_response(
     value: Any | None = None,
     status: int = 200,
@@ -92,7 +105,8 @@ def create_response(
         If the application configuration defines ``API_FINAL_CALLBACK`` it will
         be invoked with the assembled response payload prior to serialisation.
         This allows custom mutation of the outgoing data, such as injecting
-        additional metadata.
+        additional metadata. JSON bodies are encoded with the backend chosen
+        by ``API_JSON_ENCODER``.
 
     Returns:
         Response: A standardised response object.
@@ -126,6 +140,8 @@ def create_response(
         "next_url": next_url,
         "previous_url": previous_url,
     }
+    # Cursor tokens and ``total_count_estimated`` ride alongside the URLs
+    data.update(_pagination_components(result))
     # Only add when available; filtering controls visibility by config
     if request_id:
         data["request_id"] = request_id
@@ -142,11 +158,11 @@ def create_response(
     if final_callback:
         data = final_callback(data)
 
-    if is_xml():
-        type_ = "text/xml" if get_config_or_model_meta("API_XML_AS_TEXT", default=False) else "application/xml"
-        response = Response(dict_to_xml(data), mimetype=type_)
-    else:
-        response = jsonify(data)
-        response.status_code = status
+    with stage("encode"):
+        if is_xml():
+            type_ = "text/xml" if get_config_or_model_meta("API_XML_AS_TEXT", default=False) else "application/xml"
+            response = Response(dict_to_xml(data), mimetype=type_)
+        else:
+            response = json_response(data, status)
 
     return response
@@ -65,6 +65,17 @@ def _is_collection_response(data: Any) -> bool:
     )
 
 
+_PAGINATION_METADATA_KEYS = ("next_cursor", "prev_cursor", "total_count_mode", "total_count_estimated")
+
+
+def _pagination_metadata(data: Any) -> dict[str, Any]:
+    """Carry cursor tokens and count-mode markers through to the envelope."""
+
+    if not isinstance(data, dict):
+        return {}
+    return {key: data[key] for key in _PAGINATION_METADATA_KEYS if key in data}
+
+
 def _raw_dictionary_payload_if_needed(
     output_schema: type[Schema],
     data: dict[str, Any],
@@ -85,6 +96,7 @@ def _raw_dictionary_payload_if_needed(
         "total_count": get_count(data, dict_list),
         "next_url": data.get("next_url"),
         "previous_url": data.get("previous_url"),
+        **_pagination_metadata(data),
     }
 
 
@@ -94,6 +106,7 @@ def _response_envelope(data: Any, value: Any) -> dict[str, Any]:
         "total_count": get_count(data, value),
         "next_url": data.get("next_url") if isinstance(data, dict) else None,
         "previous_url": data.get("previous_url") if isinstance(data, dict) else None,
+        **_pagination_metadata(data),
     }
 
 
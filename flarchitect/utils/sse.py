@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Callable, Iterable
 from contextlib import suppress
 from typing import Any
 
 from flask import Response, current_app, stream_with_context
 
+from flarchitect.utils.json_encoding import json_dumps
+
 
 def sse_message(
     data: Any,
@@ -18,9 +19,13 @@ def sse_message(
     retry: int | None = None,
     encoder: Callable[[Any], str] | None = None,
 ) -> str:
-    """Serialise ``data`` into a compliant SSE message string."""
+    """Serialise ``data`` into a compliant SSE message string.
+
+    Without ``encoder`` the payload is encoded with the ``API_JSON_ENCODER``
+    backend of the current application.
+    """
 
-    encode = encoder or (lambda value: json.dumps(value, default=_json_default))
+    encode = encoder or (lambda value: json_dumps(value, default=_json_default))
     payload = encode(data)
     if not isinstance(payload, str):  # pragma: no cover - defensive
         payload = str(payload)
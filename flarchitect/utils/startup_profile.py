@@ -0,0 +1,107 @@
+"""Boot time breakdown for :class:`~flarchitect.Architect`.
+
+Every ``Architect`` records how long each ``init_app`` phase took (plugins,
+routes, spec, rate limiter, ...) and, per model, how long its schemas,
+routes, relation routes and spec entries took. The profile is kept on
+``architect.startup_profile`` and printed by ``flarchitect startup-profile``.
+
+Model stages record self time like request stages
+(:mod:`flarchitect.utils.timing`). A related model's schemas built while
+generating relation routes count towards that model's ``schemas``, not the
+parent's ``relations``. Model stages are only recorded while a phase is
+open, so routes materialised by requests in ``API_LAZY_SCHEMAS`` mode do not
+touch the profile.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from flarchitect.utils.timing import _NULL_STAGE, StageTimer, _Stage
+
+__all__ = ["MODEL_STAGES", "StartupProfile", "model_stage"]
+
+#: Per-model stages, in report column order.
+MODEL_STAGES = ("schemas", "routes", "relations", "spec")
+
+
+class StartupProfile:
+    """Wall time per ``init_app`` phase and self time per model stage."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self.models = StageTimer()
+        self.total = 0.0
+        self._open = 0
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the wall time of phase ``name``, adding to earlier runs."""
+
+        self._open += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._open -= 1
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+            if not self._open:
+                self.total += elapsed
+
+    def model_stage(self, model: type, name: str) -> contextlib.AbstractContextManager[None]:
+        """Return a context manager recording stage ``name`` of ``model``."""
+
+        if not self._open:
+            return _NULL_STAGE
+        return _Stage(self.models, f"{model.__name__}.{name}")
+
+    def model_timings(self) -> dict[str, dict[str, float]]:
+        """Return self time in seconds per model and stage."""
+
+        timings: dict[str, dict[str, float]] = {}
+        for key, seconds in self.models.timings.items():
+            model, name = key.rsplit(".", 1)
+            timings.setdefault(model, {})[name] = seconds
+        return timings
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profile in milliseconds, rounded to 3 places."""
+
+        return {
+            "total_ms": round(self.total * 1000, 3),
+            "phases_ms": {name: round(seconds * 1000, 3) for name, seconds in self.phases.items()},
+            "models_ms": {model: {name: round(seconds * 1000, 3) for name, seconds in stages.items()} for model, stages in self.model_timings().items()},
+        }
+
+    def report(self, top: int = 20) -> str:
+        """Format the profile as a text table.
+
+        Args:
+            top: Number of models to list, slowest first.
+        """
+
+        lines = [f"Startup: {self.total * 1000:.1f} ms", "", f"{'Phase':<24}{'ms':>10}"]
+        for name, seconds in sorted(self.phases.items(), key=lambda item: -item[1]):
+            lines.append(f"{name:<24}{seconds * 1000:>10.1f}")
+
+        models = sorted(self.model_timings().items(), key=lambda item: -sum(item[1].values()))
+        if models:
+            width = max(24, *(len(model) + 2 for model, _ in models[:top]))
+            lines += ["", f"{'Model':<{width}}" + "".join(f"{name:>10}" for name in (*MODEL_STAGES, "total"))]
+            for model, stages in models[:top]:
+                cells = [stages.get(name, 0.0) for name in MODEL_STAGES]
+                lines.append(f"{model:<{width}}" + "".join(f"{seconds * 1000:>10.1f}" for seconds in (*cells, sum(cells))))
+            if len(models) > top:
+                lines.append(f"... {len(models) - top} more models")
+        return "\n".join(lines)
+
+
+def model_stage(owner: Any, model: type, name: str) -> contextlib.AbstractContextManager[None]:
+    """Record stage ``name`` of ``model`` on ``owner.startup_profile``, if any."""
+
+    profile = getattr(owner, "startup_profile", None)
+    return _NULL_STAGE if profile is None else profile.model_stage(model, name)
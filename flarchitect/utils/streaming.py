@@ -0,0 +1,224 @@
+"""Streamed NDJSON and JSON responses for large collection reads.
+
+With ``API_STREAMING`` enabled, collection ``GET`` routes stream their rows
+instead of building the whole page in memory when the client sends
+``Accept: application/x-ndjson`` or ``?stream=ndjson`` (one JSON object per
+line) or ``?stream=1`` (the usual envelope, written progressively with
+``total_count`` and ``response_ms`` in a trailer after ``value``).
+
+The query is iterated with ``yield_per`` on a session owned by the stream and
+serialised one batch at a time through the route's output schema; each batch
+is expunged once written so memory stays flat however many rows are exported.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from flask import Response, current_app, g, request, stream_with_context
+from marshmallow import Schema
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+
+from flarchitect.utils.config_helpers import get_config_or_model_meta, is_xml
+from flarchitect.utils.core_utils import convert_case
+from flarchitect.utils.json_encoding import get_json_encoder
+from flarchitect.utils.response_filters import _filter_response_data
+from flarchitect.utils.response_helpers import _ensure_response_ms
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+_STREAM_ENVELOPE_VALUES = {"1", "true", "yes", "json"}
+_TRAILER_KEYS = ("total_count", "response_ms")
+
+
+@dataclass
+class StreamedRows:
+    """Collection query handed from ``CrudService.get_query`` to the response layer.
+
+    Attributes:
+        query: Filtered and ordered query; it is not executed until streamed.
+        format: ``"ndjson"`` or ``"json"``.
+        batch_size: Rows fetched per ``yield_per`` batch and dumped together.
+    """
+
+    query: Any
+    format: str
+    batch_size: int = 1000
+
+    def batches(self) -> Iterator[list[Any]]:
+        """Yield lists of rows, expunging each batch once the consumer resumes.
+
+        Rows are read through a private session bound like the query's own:
+        the request session is removed when the view returns, while the
+        stream is still being written.
+        """
+
+        session = _stream_session(self.query)
+        query = self.query.with_session(session) if session is not None else self.query
+        try:
+            batch: list[Any] = []
+            for row in query.yield_per(self.batch_size):
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    _expunge(session)
+                    batch = []
+            if batch:
+                yield batch
+        finally:
+            if session is not None:
+                session.close()
+
+
+def streaming_format(model: Any | None = None) -> str | None:
+    """Return the stream format requested for the current collection ``GET``.
+
+    Args:
+        model: Model whose ``Meta.streaming`` may override ``API_STREAMING``.
+
+    Returns:
+        str | None: ``"ndjson"``, ``"json"`` or ``None`` when the request is not
+        streamed. XML responses and applications with a GET response cache
+        (``API_CACHE_TYPE``) are never streamed.
+    """
+
+    if not get_config_or_model_meta("API_STREAMING", model=model, default=False):
+        return None
+    if is_xml() or get_config_or_model_meta("API_CACHE_TYPE", default=None):
+        return None
+
+    requested = str(request.args.get("stream", "")).strip().lower()
+    if requested == "ndjson":
+        return "ndjson"
+    if requested in _STREAM_ENVELOPE_VALUES:
+        return "json"
+    if not requested and any(mimetype == NDJSON_MIMETYPE for mimetype, _quality in request.accept_mimetypes):
+        return "ndjson"
+    return None
+
+
+def is_streamed_result(result: Any) -> bool:
+    """Return whether a route result carries :class:`StreamedRows`."""
+
+    return isinstance(result, dict) and isinstance(result.get("query"), StreamedRows)
+
+
+def stream_collection_response(schema: Schema, result: dict[str, Any]) -> Response:
+    """Build the streaming :class:`~flask.Response` for a streamed route result.
+
+    The first chunk (which runs the query and dumps the first batch) is
+    produced before returning, so database and serialisation errors raised up
+    to that point are handled by ``standardise_response`` like any other error.
+
+    Args:
+        schema: Output schema instance used to dump each batch.
+        result: Route payload whose ``query`` is a :class:`StreamedRows`.
+
+    Returns:
+        Response: A streamed ``application/x-ndjson`` or ``application/json``
+        response.
+    """
+
+    rows: StreamedRows = result["query"]
+    if rows.format == "ndjson":
+        chunks, mimetype = _ndjson_chunks(schema, rows), NDJSON_MIMETYPE
+    else:
+        chunks, mimetype = _envelope_chunks(schema, rows, result), "application/json"
+    first = next(chunks, None)
+
+    def generate() -> Iterator[str]:
+        if first is not None:
+            yield first
+        yield from chunks
+
+    return current_app.response_class(stream_with_context(generate()), mimetype=mimetype)
+
+
+def _dump_batch(schema: Schema, batch: list[Any]) -> list[Any]:
+    # ``with_entities`` projections yield rows; keep joined columns the schema
+    # does not know about, as the buffered path does.
+    if hasattr(batch[0], "_asdict") and not set(batch[0]._fields) <= set(schema.fields):
+        return [row._asdict() for row in batch]
+    return schema.dump(batch, many=True)
+
+
+def _dumps() -> Callable[[Any], str]:
+    encoder = get_json_encoder()
+    return encoder.dumps if encoder else current_app.json.dumps
+
+
+def _ndjson_chunks(schema: Schema, rows: StreamedRows) -> Iterator[str]:
+    dumps = _dumps()
+    for batch in rows.batches():
+        yield "".join(f"{dumps(item)}\n" for item in _dump_batch(schema, batch))
+
+
+def _envelope_chunks(schema: Schema, rows: StreamedRows, result: dict[str, Any]) -> Iterator[str]:
+    dumps = _dumps()
+    case = get_config_or_model_meta("API_FIELD_CASE", default="snake")
+    head, trailer_keys = _envelope_parts(result)
+    pending = "{" + "".join(f"{dumps(convert_case(key, case))}:{dumps(value)}," for key, value in head.items())
+    pending += f"{dumps(convert_case('value', case))}:["
+
+    count = 0
+    for batch in rows.batches():
+        body = ",".join(dumps(item) for item in _dump_batch(schema, batch))
+        yield pending + ("," if count else "") + body
+        pending = ""
+        count += len(batch)
+
+    trailer = {"total_count": count, "response_ms": _ensure_response_ms(None)}
+    yield pending + "]" + "".join(f",{dumps(convert_case(key, case))}:{dumps(trailer[key])}" for key in trailer_keys) + "}"
+
+
+def _envelope_parts(result: dict[str, Any]) -> tuple[dict[str, Any], list[str]]:
+    """Split the filtered envelope into head fields and trailer keys."""
+
+    data: dict[str, Any] = {
+        "api_version": current_app.config.get("API_VERSION"),
+        "datetime": datetime.now(timezone.utc).isoformat(),
+        "status_code": 200,
+        "errors": None,
+        "response_ms": 0,
+        "total_count": 0,
+        "next_url": result.get("next_url"),
+        "previous_url": result.get("previous_url"),
+    }
+    request_id = getattr(g, "request_id", None)
+    if request_id:
+        data["request_id"] = request_id
+    data = _filter_response_data(data)
+    trailer_keys = [key for key in _TRAILER_KEYS if key in data]
+    return {key: value for key, value in data.items() if key not in _TRAILER_KEYS}, trailer_keys
+
+
+def _stream_session(query: Any) -> Session | None:
+    owner = getattr(query, "session", None)
+    if owner is None or not hasattr(query, "with_session"):
+        return None
+    return Session(bind=owner.get_bind(clause=query.statement))
+
+
+def _expunge(session: Session | None) -> None:
+    # Related objects loaded for the batch go too, not only the rows.
+    # ``expunge_all`` would discard the identity map ``yield_per`` is still
+    # loading into, so objects are removed one by one.
+    if session is None:
+        return
+    for obj in list(session.identity_map.values()):
+        with suppress(InvalidRequestError):
+            session.expunge(obj)
+
+
+__all__ = [
+    "NDJSON_MIMETYPE",
+    "StreamedRows",
+    "is_streamed_result",
+    "stream_collection_response",
+    "streaming_format",
+]
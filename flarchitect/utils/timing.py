@@ -0,0 +1,149 @@
+"""Per-stage request timing for generated routes.
+
+When ``API_SERVER_TIMING`` or ``API_METRICS_SINK`` is set, each request gets
+a :class:`StageTimer` on ``g``. The route pipeline records named stages
+(``auth``, ``roles``, ``rate-limit``, ``deserialise``, ``pre-hook``,
+``filter``, ``count``, ``fetch``, ``post-hook``, ``serialise``,
+``response``, ``encode``). The timings are sent out as a ``Server-Timing``
+header, passed to the metrics sink and added to JSON log lines.
+
+Stages record self time. A stage running inside another, such as ``encode``
+inside ``response``, is subtracted from the outer stage, so the durations
+never overlap. Time outside every stage is not reported.
+
+Without a timer on ``g``, :func:`stage` returns a shared no-op context
+manager, so disabled timing costs one ``g`` lookup per stage.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from flask import g, has_app_context
+
+from flarchitect.utils.config_helpers import get_config_or_model_meta
+
+__all__ = [
+    "StageTimer",
+    "current_timer",
+    "server_timing_header",
+    "stage",
+    "start_request_timer",
+    "timed",
+    "timing_enabled",
+]
+
+_TIMER_KEY = "_flarch_stage_timer"
+_NULL_STAGE = contextlib.nullcontext()
+
+
+class StageTimer:
+    """Accumulate self time per named stage for one request."""
+
+    __slots__ = ("_stack", "timings")
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+        self._stack: list[list[Any]] = []
+
+    def start(self, name: str | None) -> None:
+        """Open stage ``name``. ``None`` opens an unreported region that is
+        still subtracted from the enclosing stage."""
+
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def stop(self) -> None:
+        """Close the innermost open stage."""
+
+        name, started, children = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        if self._stack:
+            self._stack[-1][2] += elapsed
+        if name is not None:
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed - children
+
+    def as_ms(self) -> dict[str, float]:
+        """Return the recorded stages in milliseconds, rounded to 3 places."""
+
+        return {name: round(seconds * 1000, 3) for name, seconds in self.timings.items()}
+
+
+class _Stage:
+    __slots__ = ("name", "timer")
+
+    def __init__(self, timer: StageTimer, name: str | None) -> None:
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.timer.start(self.name)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.timer.stop()
+
+
+def timing_enabled() -> bool:
+    """Return whether requests should collect stage timings."""
+
+    return bool(get_config_or_model_meta("API_SERVER_TIMING", default=False) or get_config_or_model_meta("API_METRICS_SINK", default=None))
+
+
+def start_request_timer() -> StageTimer | None:
+    """Attach a fresh :class:`StageTimer` to ``g`` when timing is enabled."""
+
+    if not timing_enabled():
+        return None
+    timer = StageTimer()
+    setattr(g, _TIMER_KEY, timer)
+    return timer
+
+
+def current_timer() -> StageTimer | None:
+    """Return the timer of the active request, if it collects timings."""
+
+    return g.get(_TIMER_KEY) if has_app_context() else None
+
+
+def stage(name: str | None) -> contextlib.AbstractContextManager[None]:
+    """Return a context manager recording ``name`` on the request's timer."""
+
+    timer = current_timer()
+    return _NULL_STAGE if timer is None else _Stage(timer, name)
+
+
+def timed(name: str | None, func: Callable[..., Any] | None = None) -> Any:
+    """Wrap ``func`` so each call is recorded as stage ``name``.
+
+    Without ``func`` a decorator is returned. ``timed(None, inner)`` marks the
+    wrapped call as excluded time. Wrapping a decorator's inner function this
+    way attributes only the decorator's own work (a rate-limit check, a role
+    lookup) to the enclosing stage.
+    """
+
+    if func is None:
+        return lambda target: timed(name, target)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with stage(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def server_timing_header(timer: StageTimer, total: float | None = None) -> str:
+    """Format ``timer`` as a ``Server-Timing`` header value.
+
+    Args:
+        timer: Timings of the finished request.
+        total: Whole-request duration in seconds, added as ``total``.
+    """
+
+    metrics = [f"{name};dur={seconds * 1000:.3f}" for name, seconds in timer.timings.items()]
+    if total is not None:
+        metrics.append(f"total;dur={total * 1000:.3f}")
+    return ", ".join(metrics)
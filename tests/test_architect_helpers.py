@@ -190,3 +190,37 @@ def test_apply_rate_limit_invalid_logs(monkeypatch):
     assert messages["level"] == 1
     assert messages["msg"].startswith("Rate limit definition not a string")
     assert result is dummy
+
+
+def test_schema_constructor_composes_pipeline_once(monkeypatch):
+    """Schemas, rate limit and roles are composed once per app, not per request."""
+
+    app = create_app(API_RATE_LIMIT="100 per minute", API_RATE_LIMIT_AUTODETECT=False)
+    with app.app_context():
+        architect = Architect(app=app)
+
+    calls = {"schemas": 0, "rate_limit": 0}
+    apply_schemas, apply_rate_limit = architect._apply_schemas, architect._apply_rate_limit
+
+    def counting_schemas(*args, **kwargs):
+        calls["schemas"] += 1
+        return apply_schemas(*args, **kwargs)
+
+    def counting_rate_limit(*args, **kwargs):
+        calls["rate_limit"] += 1
+        return apply_rate_limit(*args, **kwargs)
+
+    monkeypatch.setattr(architect, "_apply_schemas", counting_schemas)
+    monkeypatch.setattr(architect, "_apply_rate_limit", counting_rate_limit)
+
+    @app.get("/ping")
+    @architect.schema_constructor(output_schema=None, auth=False)
+    def ping():
+        return {"pong": True}
+
+    client = app.test_client()
+    responses = [client.get("/ping") for _ in range(3)]
+
+    assert [resp.get_json()["value"] for resp in responses] == [{"pong": True}] * 3
+    assert "X-RateLimit-Limit" in responses[-1].headers
+    assert calls == {"schemas": 1, "rate_limit": 1}
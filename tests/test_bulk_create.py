@@ -0,0 +1,171 @@
+import pytest
+from sqlalchemy import event
+
+from demo.basic_factory.basic_factory import create_app
+
+
+def _author(name, **extra):
+    return {
+        "first_name": name,
+        "last_name": "Bulk",
+        "biography": "",
+        "date_of_birth": "1990-01-01",
+        "nationality": "British",
+        **extra,
+    }
+
+
+def _record_inserts(app):
+    statements = []
+    with app.app_context():
+        engine = app.extensions["sqlalchemy"].engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT INTO AUTHORS"):
+            statements.append(statement)
+
+    return statements
+
+
+def test_bulk_create_returns_created_items_in_order():
+    app = create_app()
+    client = app.test_client()
+    before = client.get("/api/authors?limit=1").get_json()["total_count"]
+
+    resp = client.post("/api/authors", json=[_author("One"), _author("Two"), _author("Three")])
+
+    assert resp.status_code == 200
+    created = resp.get_json()["value"]
+    assert [item["first_name"] for item in created] == ["One", "Two", "Three"]
+    assert all(item["id"] for item in created)
+    assert client.get("/api/authors?limit=1").get_json()["total_count"] == before + 3
+
+
+def test_bulk_create_uses_insert_returning_in_chunks():
+    app = create_app({"API_BULK_CHUNK_SIZE": 2})
+    statements = _record_inserts(app)
+
+    resp = app.test_client().post("/api/authors", json=[_author(str(i)) for i in range(5)])
+
+    assert resp.status_code == 200
+    assert [item["first_name"] for item in resp.get_json()["value"]] == ["0", "1", "2", "3", "4"]
+    assert len(statements) == 3
+    assert all("RETURNING" in statement.upper() for statement in statements)
+
+
+def test_bulk_create_issues_one_statement_per_chunk():
+    app = create_app()
+    with app.app_context():
+        engine = app.extensions["sqlalchemy"].engine
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lstrip().upper())
+
+    resp = app.test_client().post("/api/authors", json=[_author(str(i)) for i in range(50)])
+
+    assert resp.status_code == 200
+    assert [item["first_name"] for item in resp.get_json()["value"]] == [str(i) for i in range(50)]
+    assert sum(statement.startswith("INSERT INTO AUTHORS") for statement in statements) == 1
+    assert not any(statement.startswith("SELECT") and "FROM AUTHORS" in statement for statement in statements)
+
+
+def test_bulk_create_reports_errors_by_index():
+    app = create_app()
+    client = app.test_client()
+    before = client.get("/api/authors?limit=1").get_json()["total_count"]
+
+    resp = client.post("/api/authors", json=[_author("Fine"), {"first_name": "Missing"}, _author("Bad", date_of_birth="nope")])
+
+    assert resp.status_code == 400
+    errors = resp.get_json()["errors"]["error"]
+    assert set(errors) == {"1", "2"}
+    assert "date_of_birth" in errors["2"]
+    assert client.get("/api/authors?limit=1").get_json()["total_count"] == before
+
+
+@pytest.mark.parametrize("payload", [[], [1, 2]])
+def test_bulk_create_rejects_malformed_arrays(payload):
+    resp = create_app().test_client().post("/api/authors", json=payload)
+
+    assert resp.status_code == 400
+
+
+def test_bulk_create_max_items_guard():
+    app = create_app({"API_BULK_MAX_ITEMS": 2})
+
+    resp = app.test_client().post("/api/authors", json=[_author(str(i)) for i in range(3)])
+
+    assert resp.status_code == 413
+
+
+def test_bulk_create_rolls_back_whole_batch_on_integrity_error():
+    app = create_app()
+    client = app.test_client()
+    before = client.get("/api/authors?limit=1").get_json()["total_count"]
+
+    resp = client.post("/api/authors", json=[_author("New"), _author("Clash", id=1)])
+
+    assert resp.status_code == 422
+    assert client.get("/api/authors?limit=1").get_json()["total_count"] == before
+
+
+def test_bulk_create_applies_add_callback_per_object():
+    def shout(obj, model):
+        obj.last_name = obj.last_name.upper()
+        return obj
+
+    app = create_app({"API_ADD_CALLBACK": shout})
+
+    created = app.test_client().post("/api/authors", json=[_author("A"), _author("B")]).get_json()["value"]
+
+    assert [item["last_name"] for item in created] == ["BULK", "BULK"]
+
+
+def test_bulk_add_callback_receives_whole_batch():
+    batches = []
+
+    def tag(objs, model):
+        batches.append(len(objs))
+        for obj in objs:
+            obj.nationality = "Batch"
+        return objs
+
+    app = create_app({"API_BULK_ADD_CALLBACK": tag})
+
+    created = app.test_client().post("/api/authors", json=[_author("A"), _author("B")]).get_json()["value"]
+
+    assert batches == [2]
+    assert {item["nationality"] for item in created} == {"Batch"}
+
+
+class _CreatePolicy:
+    def __init__(self):
+        self.seen = []
+
+    def can_create(self, data, **kwargs):
+        self.seen.append(data["first_name"])
+        return data["first_name"] != "Blocked"
+
+
+class _BulkPolicy:
+    def can_create_many(self, items, **kwargs):
+        return len(items) <= 1
+
+
+def test_bulk_create_checks_can_create_per_item():
+    app = create_app({"API_ACCESS_POLICY": _CreatePolicy})
+
+    resp = app.test_client().post("/api/authors", json=[_author("Allowed"), _author("Blocked")])
+
+    assert resp.status_code == 403
+
+
+def test_bulk_create_prefers_can_create_many():
+    app = create_app({"API_ACCESS_POLICY": _BulkPolicy})
+    client = app.test_client()
+
+    assert client.post("/api/authors", json=[_author("A")]).status_code == 200
+    assert client.post("/api/authors", json=[_author("A"), _author("B")]).status_code == 403
@@ -0,0 +1,114 @@
+"""Collection-level PATCH and DELETE tests."""
+
+from __future__ import annotations
+
+import pytest
+from flask.testing import FlaskClient
+
+from demo.soft_delete.soft_delete import create_app
+from demo.soft_delete.soft_delete.models import Category
+
+HARD_DELETE = {"API_SOFT_DELETE": False}
+
+
+class FirstTwoScope:
+    def scope_query(self, query, *, model, **kwargs):
+        return query.filter(model.id <= 2)
+
+
+@pytest.fixture()
+def bulk_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Category.Meta, "allow_bulk_patch", True, raising=False)
+    monkeypatch.setattr(Category.Meta, "allow_bulk_delete", True, raising=False)
+
+
+@pytest.fixture()
+def client(bulk_enabled: None) -> FlaskClient:
+    return create_app(HARD_DELETE).test_client()
+
+
+def _count(client: FlaskClient, **params) -> int:
+    return len(client.get("/api/categories", query_string={"limit": 100, **params}).json["value"])
+
+
+def test_bulk_patch_updates_matching_rows(client: FlaskClient) -> None:
+    resp = client.patch("/api/categories?id__le=3", json={"name": "archived"})
+
+    assert resp.status_code == 200
+    assert resp.json["value"] == {"affected": 3, "dry_run": False}
+    assert _count(client, name__eq="archived") == 3
+
+
+def test_bulk_dry_run_reports_without_writing(client: FlaskClient) -> None:
+    total = _count(client)
+
+    patch = client.patch("/api/categories?id__le=3&dry_run=1", json={"name": "archived"})
+    delete = client.delete("/api/categories?id__le=2&dry_run=true")
+
+    assert patch.json["value"] == {"affected": 3, "dry_run": True}
+    assert delete.json["value"] == {"affected": 2, "dry_run": True}
+    assert _count(client, name__eq="archived") == 0
+    assert _count(client) == total
+
+
+def test_bulk_delete_removes_matching_rows(client: FlaskClient) -> None:
+    total = _count(client)
+
+    resp = client.delete("/api/categories?id__ge=4&id__le=5")
+
+    assert resp.json["value"] == {"affected": 2, "dry_run": False}
+    assert _count(client) == total - 2
+
+
+def test_bulk_writes_require_a_filter(client: FlaskClient) -> None:
+    total = _count(client)
+
+    assert client.delete("/api/categories").status_code == 400
+    assert client.patch("/api/categories", json={"name": "x"}).status_code == 400
+    assert _count(client) == total
+
+
+def test_bulk_delete_becomes_soft_delete(bulk_enabled: None) -> None:
+    client = create_app().test_client()
+    total = _count(client)
+
+    first = client.delete("/api/categories?id__le=3")
+    second = client.delete("/api/categories?id__le=3")
+
+    assert first.json["value"]["affected"] == 3
+    assert second.json["value"]["affected"] == 0
+    assert _count(client) == total - 3
+    assert _count(client, include_deleted=1) == total
+
+
+def test_bulk_writes_respect_scope_query(bulk_enabled: None) -> None:
+    client = create_app({**HARD_DELETE, "API_ACCESS_POLICY": FirstTwoScope}).test_client()
+
+    resp = client.patch("/api/categories?id__le=5", json={"name": "archived"})
+
+    assert resp.json["value"]["affected"] == 2
+
+
+def test_bulk_routes_are_opt_in() -> None:
+    client = create_app(HARD_DELETE).test_client()
+
+    assert client.patch("/api/categories?id__le=3", json={"name": "x"}).status_code == 405
+    assert client.delete("/api/categories?id__le=3").status_code == 405
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "id__le=3&name=x",
+        "id__le=3&name__equals=x",
+        "id__le=3&nosuch__eq=1",
+        "id__le=3&or[name__eq=x,name__bogus=y]",
+    ],
+)
+def test_bulk_writes_reject_filters_that_do_not_compile(client: FlaskClient, query: str) -> None:
+    total = _count(client)
+
+    assert client.delete(f"/api/categories?{query}").status_code == 400
+    assert client.patch(f"/api/categories?{query}", json={"name": "x"}).status_code == 400
+    assert _count(client) == total
+    assert _count(client, name__eq="x") == 0
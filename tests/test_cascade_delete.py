@@ -0,0 +1,159 @@
+"""Tests for the set-based cascade delete planner."""
+
+from __future__ import annotations
+
+from sqlalchemy import Column, ForeignKey, Integer, String, Table, create_engine, event, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship
+
+from demo.basic_factory.basic_factory import create_app
+from flarchitect.database.cascade import cascade_delete, plan_cascade
+
+
+class Base(DeclarativeBase):
+    """Base declarative class."""
+
+
+tag_links = Table(
+    "customer_tags",
+    Base.metadata,
+    Column("customer_id", ForeignKey("customers.id"), primary_key=True),
+    Column("tag_id", ForeignKey("tags.id"), primary_key=True),
+)
+
+
+class Customer(Base):
+    __tablename__ = "customers"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String)
+    orders: Mapped[list[Order]] = relationship("Order", back_populates="customer")
+    tags: Mapped[list[Tag]] = relationship("Tag", secondary=tag_links)
+    referrals: Mapped[list[Customer]] = relationship("Customer")
+    referred_by_id: Mapped[int | None] = mapped_column(ForeignKey("customers.id"))
+
+
+class Order(Base):
+    __tablename__ = "orders"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    customer_id: Mapped[int] = mapped_column(ForeignKey("customers.id"))
+    customer: Mapped[Customer] = relationship("Customer", back_populates="orders")
+    lines: Mapped[list[OrderLine]] = relationship("OrderLine", back_populates="order")
+
+
+class OrderLine(Base):
+    __tablename__ = "order_lines"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"))
+    quantity: Mapped[int] = mapped_column(Integer, default=1)
+    order: Mapped[Order] = relationship("Order", back_populates="lines")
+
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String)
+
+
+def _seed() -> tuple[Session, list[str]]:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("DELETE"):
+            statements.append(statement)
+
+    session = Session(engine)
+    shared = Tag(name="shared")
+    keep = Customer(name="keep", orders=[Order(lines=[OrderLine()])], tags=[shared])
+    drop = Customer(
+        name="drop",
+        orders=[Order(lines=[OrderLine() for _ in range(50)]) for _ in range(4)],
+        tags=[shared],
+    )
+    session.add_all([keep, drop])
+    session.commit()
+    return session, statements
+
+
+def test_plan_follows_dependents_and_skips_parents_and_cycles():
+    plan = plan_cascade(Customer)
+
+    assert plan.tables() == ["order_lines", "orders", "customer_tags", "customers"]
+    assert plan_cascade(Customer) is plan
+    assert plan_cascade(OrderLine).tables() == ["order_lines"]
+
+
+def test_cascade_delete_runs_one_statement_per_table():
+    session, statements = _seed()
+    drop = session.scalars(select(Customer).where(Customer.name == "drop")).one()
+
+    counts = cascade_delete(session, drop)
+    session.commit()
+
+    assert counts == {"order_lines": 200, "orders": 4, "customer_tags": 1, "customers": 1}
+    assert len(statements) == 4
+    assert session.scalars(select(Customer.name)).all() == ["keep"]
+    assert len(session.scalars(select(OrderLine)).all()) == 1
+    assert session.scalars(select(Tag.name)).all() == ["shared"]
+
+
+def test_cascade_delete_leaf_model():
+    session, _statements = _seed()
+    line = session.scalars(select(OrderLine)).first()
+
+    assert cascade_delete(session, line) == {"order_lines": 1}
+
+
+class Node(Base):
+    __tablename__ = "nodes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int | None] = mapped_column(ForeignKey("nodes.id"))
+    children: Mapped[list[Node]] = relationship("Node")
+    notes: Mapped[list[Note]] = relationship("Note")
+
+
+class Note(Base):
+    __tablename__ = "notes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    node_id: Mapped[int] = mapped_column(ForeignKey("nodes.id"))
+
+
+def test_cascade_delete_self_referential_tree_level_by_level():
+    engine = create_engine("sqlite:///:memory:")
+
+    @event.listens_for(engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    root = Node(children=[Node(children=[Node(notes=[Note()]), Node()]), Node(notes=[Note()])])
+    other = Node(children=[Node()])
+    session.add_all([root, other])
+    session.commit()
+
+    counts = cascade_delete(session, root)
+    session.commit()
+
+    assert plan_cascade(Node).tables() == ["notes", "nodes"]
+    assert counts == {"nodes": 5, "notes": 2}
+    assert len(session.scalars(select(Node)).all()) == 2
+    assert session.scalars(select(Note)).all() == []
+
+
+def test_cascade_delete_mode_selects_the_engine():
+    recursive = create_app({"API_ALLOW_CASCADE_DELETE": True}).test_client()
+    planned = create_app({"API_ALLOW_CASCADE_DELETE": True, "API_CASCADE_DELETE_MODE": "planned"}).test_client()
+
+    assert recursive.delete("/api/authors/2?cascade_delete=1").json["value"] is None
+    deleted = planned.delete("/api/authors/2?cascade_delete=1").json["value"]["deleted"]
+    assert deleted["authors"] == 1
+    assert deleted["books"] > 0
+    assert planned.get("/api/authors/2/books").status_code == 404
@@ -0,0 +1,129 @@
+"""Tests for the ``API_COMPILED_SERIALIZER`` fast dump path."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from marshmallow import Schema
+
+from demo.basic_factory.basic_factory import create_app
+from demo.basic_factory.basic_factory.extensions import db
+from demo.basic_factory.basic_factory.models import Author
+from flarchitect.schemas import compiled
+from flarchitect.schemas.bases import AutoSchema
+from flarchitect.schemas.utils import get_input_output_from_model_or_make
+from tests.test_api_output_types import MixedTypes, app_with_mixed_types  # noqa: F401
+from tests.test_api_output_types import db as mixed_db
+
+
+@pytest.fixture()
+def client() -> FlaskClient:
+    return create_app().test_client()
+
+
+def _payloads(client: FlaskClient, path: str, *, compiled_on: bool) -> str:
+    # Both paths read the same seeded rows, so one app toggles the setting.
+    client.application.config["API_COMPILED_SERIALIZER"] = compiled_on
+    resp = client.get(path)
+    assert resp.status_code == 200
+    return json.dumps(resp.json["value"])
+
+
+def _dump_both(schema: AutoSchema, rows: list) -> tuple[list[dict], list[dict]]:
+    return Schema.dump(schema, rows, many=True), compiled.compiled_dump(schema, rows, True)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/api/authors",
+        "/api/authors/2",
+        "/api/authors?dump=json",
+        "/api/authors?dump=hybrid",
+        "/api/authors?fields=first_name,date_of_birth,website",
+        "/api/authors/1/books",
+        "/api/books?dump=json",
+        "/api/reviews",
+    ],
+)
+def test_compiled_output_is_identical(client: FlaskClient, path: str) -> None:
+    assert _payloads(client, path, compiled_on=True) == _payloads(client, path, compiled_on=False)
+
+
+def test_dump_callback_runs_once_per_row(client: FlaskClient) -> None:
+    calls: list[bool] = []
+
+    def stamp(data, **kwargs):
+        calls.append(kwargs["many"])
+        data["stamped"] = True
+        return data
+
+    client.application.config["API_DUMP_CALLBACK"] = stamp
+    expected = _payloads(client, "/api/authors?limit=5", compiled_on=False)
+    calls.clear()
+
+    assert _payloads(client, "/api/authors?limit=5", compiled_on=True) == expected
+    assert calls == [True] * 5
+
+
+def test_compiled_path_is_used_and_plans_are_cached(client: FlaskClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    client.application.config["API_COMPILED_SERIALIZER"] = True
+    compiled._DUMP_PLAN_CACHE.clear()
+    calls: list[type] = []
+    original = compiled._compile_plan
+    monkeypatch.setattr(compiled, "_compile_plan", lambda schema: calls.append(type(schema)) or original(schema))
+
+    client.get("/api/publishers")
+    client.get("/api/publishers")
+
+    assert len(calls) == 1
+    assert issubclass(calls[0], AutoSchema)
+
+
+def test_field_selection_does_not_leak_into_cached_plans(client: FlaskClient) -> None:
+    client.application.config["API_COMPILED_SERIALIZER"] = True
+    compiled._DUMP_PLAN_CACHE.clear()
+
+    narrowed = client.get("/api/authors?fields=first_name").json["value"]
+    full = _payloads(client, "/api/authors", compiled_on=True)
+
+    assert all(set(row) == {"first_name"} for row in narrowed)
+    assert full == _payloads(client, "/api/authors", compiled_on=False)
+
+
+def test_schemas_with_custom_hooks_fall_back() -> None:
+    from marshmallow import post_dump
+
+    class Custom(AutoSchema):
+        @post_dump
+        def shout(self, data, **kwargs):
+            return data
+
+    assert compiled.is_compilable(AutoSchema())
+    assert not compiled.is_compilable(Custom())
+
+
+def test_compiled_dump_matches_marshmallow_key_order(client: FlaskClient) -> None:
+    with client.application.test_request_context("/api/authors"):
+        _, output_schema = get_input_output_from_model_or_make(Author)
+        rows = db.session.scalars(db.select(Author).limit(5)).all()
+
+        expected, result = _dump_both(type(output_schema)(many=True), rows)
+
+    assert result == expected
+    assert [list(row) for row in result] == [list(row) for row in expected]
+
+
+def test_compiled_dump_matches_marshmallow_for_column_types(app_with_mixed_types: tuple[Flask, int, dict]) -> None:  # noqa: F811
+    app, _, _ = app_with_mixed_types
+
+    with app.test_request_context("/api/mixed_types"):
+        _, output_schema = get_input_output_from_model_or_make(MixedTypes)
+        rows = mixed_db.session.scalars(mixed_db.select(MixedTypes)).all()
+
+        expected, result = _dump_both(type(output_schema)(many=True), rows)
+
+    assert result == expected
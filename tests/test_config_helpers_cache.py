@@ -1,8 +1,9 @@
 from typing import ClassVar
 
-from flask import Flask, g
+from flask import Config, Flask, g
 
-from flarchitect.utils.config_helpers import get_config_or_model_meta
+from flarchitect.utils import config_helpers
+from flarchitect.utils.config_helpers import config_version, get_config_or_model_meta, invalidate_config_cache, set_model_meta
 
 
 class _Model:
@@ -33,6 +34,111 @@ def test_get_config_or_model_meta_caches_in_request_context():
         assert hasattr(g, "_flarch_cfg_cache")
 
 
+def test_get_config_or_model_meta_caches_per_application():
+    app = Flask(__name__)
+    app.config["API_FOO"] = True
+    with app.app_context():
+        assert get_config_or_model_meta("FOO", default=False) is True
+        cache = app.extensions["flarchitect.config_cache"]
+        assert ("FOO", None, None, None, False, "ignore") in cache.entries
+
+    with app.test_request_context("/"):
+        assert get_config_or_model_meta("FOO", default=False) is True
+        assert len(cache.entries) == 1
+
+
+def test_get_config_or_model_meta_caches_misses_with_caller_default():
+    app = Flask(__name__)
+    with app.app_context():
+        assert get_config_or_model_meta("API_DUMP_CALLBACK", model=_Model, default=None) is None
+        assert get_config_or_model_meta("API_DUMP_CALLBACK", model=_Model, default="fallback") == "fallback"
+        assert get_config_or_model_meta("API_DUMP_CALLBACK", model=_Model, return_from_config=True) == (None, "default")
+        assert len(app.extensions["flarchitect.config_cache"].entries) == 1
+
+
+def test_config_writes_invalidate_cached_lookups():
+    app = Flask(__name__)
+    app.config["API_FOO"] = True
+    with app.app_context():
+        assert get_config_or_model_meta("FOO", default=False) is True
+        app.config["API_FOO"] = False
+        assert get_config_or_model_meta("FOO", default=True) is False
+        app.config.update(API_FOO="updated")
+        assert get_config_or_model_meta("FOO") == "updated"
+        del app.config["API_FOO"]
+        assert get_config_or_model_meta("FOO", default="gone") == "gone"
+        app.config.setdefault("API_FOO", "restored")
+        assert get_config_or_model_meta("FOO") == "restored"
+
+
+def test_config_writes_apply_to_the_next_request():
+    app = Flask(__name__)
+    app.config["API_FOO"] = True
+    with app.test_request_context("/"):
+        assert get_config_or_model_meta("FOO", default=False) is True
+    app.config["API_FOO"] = False
+    with app.test_request_context("/"):
+        assert get_config_or_model_meta("FOO", default=True) is False
+
+
+def test_meta_assignments_apply_after_invalidation():
+    class Model:
+        class Meta:
+            pagination_size_default = 10
+
+    app = Flask(__name__)
+    with app.test_request_context("/"):
+        assert get_config_or_model_meta("API_PAGINATION_SIZE_DEFAULT", model=Model) == 10
+    Model.Meta.pagination_size_default = 25
+    with app.test_request_context("/"):
+        assert get_config_or_model_meta("API_PAGINATION_SIZE_DEFAULT", model=Model) == 10
+    invalidate_config_cache()
+    with app.test_request_context("/"):
+        assert get_config_or_model_meta("API_PAGINATION_SIZE_DEFAULT", model=Model) == 25
+
+
+def test_config_version_changes_with_config():
+    app = Flask(__name__)
+    with app.app_context():
+        version = config_version()
+        assert config_version() == version
+        app.config["API_FOO"] = "bar"
+        assert config_version() != version
+        version = config_version()
+        app.config["API_FOO"] = "bar"
+        app.config.update(API_FOO="bar")
+        assert config_version() == version
+        assert isinstance(app.config, Config)
+
+
+def test_full_cache_evicts_least_recently_used_entries(monkeypatch):
+    monkeypatch.setattr(config_helpers, "_CACHE_MAX_ENTRIES", 2)
+    app = Flask(__name__)
+    app.config.update(API_A=1, API_B=2, API_C=3)
+    with app.app_context():
+        version = config_version()
+        for key in ("A", "B", "A", "C", "A"):
+            get_config_or_model_meta(key)
+        entries = app.extensions["flarchitect.config_cache"].entries
+
+        assert [key[0] for key in entries] == ["C", "A"]
+        assert config_version() == version
+
+
+def test_set_model_meta_invalidates_cached_lookups():
+    class Model:
+        pass
+
+    app = Flask(__name__)
+    app.config["API_PAGINATION_SIZE_DEFAULT"] = 20
+    with app.app_context():
+        assert get_config_or_model_meta("API_PAGINATION_SIZE_DEFAULT", model=Model) == 20
+        set_model_meta(Model, pagination_size_default=5)
+        assert get_config_or_model_meta("API_PAGINATION_SIZE_DEFAULT", model=Model) == 5
+        set_model_meta(Model, pagination_size_default=None)
+        assert get_config_or_model_meta("API_PAGINATION_SIZE_DEFAULT", model=Model) == 20
+
+
 def test_get_config_or_model_meta_joins_list_metadata_sources():
     result = get_config_or_model_meta(
         "BLOCK_METHODS",
@@ -0,0 +1,172 @@
+import pytest
+
+from demo.basic_factory.basic_factory import create_app
+
+
+@pytest.fixture
+def client():
+    app = create_app({"API_PAGINATION_MODE": "cursor"})
+    return app.test_client()
+
+
+def _walk(client, url):
+    seen, pages = [], 0
+    payload = client.get(url).get_json()
+    while True:
+        assert payload["status_code"] == 200
+        seen.extend(item["id"] for item in payload["value"])
+        pages += 1
+        if not payload["next_cursor"]:
+            return seen, pages, payload
+        payload = client.get(payload["next_url"]).get_json()
+
+
+def test_cursor_walks_every_row_once(client):
+    seen, pages, last = _walk(client, "/api/books?limit=30")
+
+    assert seen == sorted(set(seen))
+    assert len(seen) == last["total_count"]
+    assert pages == -(-last["total_count"] // 30)
+    assert last["next_url"] is None
+
+
+def test_cursor_first_page_has_no_previous(client):
+    payload = client.get("/api/books?limit=2").get_json()
+
+    assert payload["prev_cursor"] is None
+    assert payload["previous_url"] is None
+    assert "page=" not in payload["next_url"]
+    assert "cursor=" in payload["next_url"]
+
+
+def test_cursor_prev_returns_preceding_page(client):
+    first = client.get("/api/books?limit=2").get_json()
+    second = client.get(first["next_url"]).get_json()
+    back = client.get(second["previous_url"]).get_json()
+
+    assert [item["id"] for item in back["value"]] == [item["id"] for item in first["value"]]
+    assert back["prev_cursor"] is None
+
+
+def test_cursor_honours_order_by_with_ties(client):
+    baseline = client.get("/api/authors?limit=100&order_by=-date_of_birth,id").get_json()
+    expected = [item["id"] for item in baseline["value"]]
+
+    seen, _pages, last = _walk(client, "/api/authors?limit=7&order_by=-date_of_birth")
+
+    assert len(expected) == last["total_count"]
+    assert seen == expected
+
+
+def test_cursor_rejects_mismatched_ordering(client):
+    first = client.get("/api/books?limit=2").get_json()
+    resp = client.get(f"/api/books?limit=2&order_by=-title&cursor={first['next_cursor']}")
+
+    assert resp.status_code == 400
+
+
+def test_cursor_rejects_garbage(client):
+    resp = client.get("/api/books?cursor=not-a-cursor")
+
+    assert resp.status_code == 400
+
+
+def test_cursor_parameter_documented():
+    app = create_app({"API_PAGINATION_MODE": "cursor"})
+    spec = app.test_client().get("/docs/apispec.json").get_json()
+    params = spec["paths"]["/api/books"]["get"]["parameters"]
+    names = {param["name"] for param in params}
+
+    assert "cursor" in names
+    assert "page" not in names
+
+
+def test_meta_override_enables_cursor_mode():
+    app = create_app()
+    with app.app_context():
+        from demo.basic_factory.basic_factory.models import Book
+
+        Book.Meta.pagination_mode = "cursor"
+    try:
+        books = app.test_client().get("/api/books?limit=2").get_json()
+        authors = app.test_client().get("/api/authors?limit=2").get_json()
+    finally:
+        del Book.Meta.pagination_mode
+
+    assert books["next_cursor"]
+    assert "next_cursor" not in authors
+
+
+def _nullable_client():
+    from flask import Flask
+    from flask_sqlalchemy import SQLAlchemy
+    from sqlalchemy import Integer, String
+    from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+    from flarchitect import Architect
+
+    class BaseModel(DeclarativeBase):
+        pass
+
+    db = SQLAlchemy(model_class=BaseModel)
+
+    class Ticket(db.Model):
+        __tablename__ = "tickets"
+
+        id: Mapped[int] = mapped_column(Integer, primary_key=True)
+        label: Mapped[str | None] = mapped_column(String, nullable=True)
+
+        class Meta:
+            pass
+
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        API_BASE_MODEL=db.Model,
+        API_CREATE_DOCS=False,
+        API_PAGINATION_MODE="cursor",
+    )
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        labels = ["b", None, "a", None, "c", "a", None]
+        db.session.add_all(Ticket(id=index, label=label) for index, label in enumerate(labels, start=1))
+        db.session.commit()
+        Architect(app=app)
+    return app.test_client()
+
+
+@pytest.mark.parametrize("order_by", ["label", "-label"])
+def test_cursor_keeps_rows_with_null_sort_keys(order_by):
+    client = _nullable_client()
+
+    seen, _pages, _last = _walk(client, f"/api/tickets?limit=2&order_by={order_by}")
+
+    assert sorted(seen) == list(range(1, 8))
+    nulls_first = order_by.startswith("-")
+    expected = [2, 4, 7, 5, 1, 3, 6] if nulls_first else [3, 6, 1, 5, 2, 4, 7]
+    assert seen == expected
+
+
+def test_cursor_prev_crosses_null_sort_keys():
+    client = _nullable_client()
+    pages = [client.get("/api/tickets?limit=3&order_by=label").get_json()]
+    while pages[-1]["next_url"]:
+        pages.append(client.get(pages[-1]["next_url"]).get_json())
+
+    back = client.get(pages[-1]["previous_url"]).get_json()
+
+    assert [item["id"] for item in back["value"]] == [item["id"] for item in pages[-2]["value"]]
+
+
+def test_cursor_rejects_joined_sort_keys(client):
+    resp = client.get("/api/books?limit=2&order_by=authors.first_name")
+
+    assert resp.status_code == 400
+
+
+def test_cursor_accepts_own_table_prefix(client):
+    qualified = client.get("/api/books?limit=3&order_by=books.title").get_json()
+    plain = client.get("/api/books?limit=3&order_by=title").get_json()
+
+    assert [item["id"] for item in qualified["value"]] == [item["id"] for item in plain["value"]]
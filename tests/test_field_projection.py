@@ -0,0 +1,87 @@
+"""Tests for pushing ``fields=`` selections down into SQL."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from sqlalchemy import event
+
+from demo.basic_factory.basic_factory import create_app
+from demo.basic_factory.basic_factory.extensions import db
+from demo.basic_factory.basic_factory.models import Review
+
+
+@pytest.fixture()
+def app() -> Generator[Flask, None, None]:
+    app = create_app({"API_SERIALIZATION_DEPTH": 1})
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture()
+def review(app: Flask) -> Review:
+    return db.session.get(Review, 1)
+
+
+@pytest.fixture()
+def statements(app: Flask, review: Review) -> Generator[list[str], None, None]:
+    captured: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        captured.append(statement)
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield captured
+    event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture()
+def client(app: Flask) -> FlaskClient:
+    return app.test_client()
+
+
+def test_single_lookup_loads_only_selected_columns_and_keys(client: FlaskClient, review: Review, statements: list[str]) -> None:
+    resp = client.get("/api/reviews/1?fields=reviewer_name")
+
+    assert resp.json["value"] == {"reviewer_name": review.reviewer_name}
+    sql = " ".join(statements)
+    assert "reviews.reviewer_name" in sql
+    assert "reviews.book_id" in sql
+    assert "reviews.review_text" not in sql
+    # Unselected relationships are not eager-loaded.
+    assert "books" not in sql
+
+
+def test_selected_url_relationship_loads_only_its_key(client: FlaskClient, review: Review, statements: list[str]) -> None:
+    resp = client.get("/api/reviews/1?fields=reviewer_name,book")
+
+    assert resp.json["value"] == {"book": f"/api/books/{review.book_id}", "reviewer_name": review.reviewer_name}
+    sql = " ".join(statements)
+    assert "books_1.id" in sql
+    assert "books_1.isbn" not in sql
+    assert "reviews.review_text" not in sql
+
+
+def test_selected_nested_relationship_loads_related_columns(client: FlaskClient, review: Review) -> None:
+    resp = client.get("/api/reviews/1?fields=reviewer_name,book&dump=json")
+
+    assert resp.json["value"]["book"]["isbn"] == review.book.isbn
+
+
+def test_collection_projection_skips_eager_loading(client: FlaskClient, statements: list[str]) -> None:
+    resp = client.get("/api/reviews?fields=id,reviewer_name")
+
+    assert resp.status_code == 200
+    assert [row["id"] for row in resp.json["value"]] == list(range(1, 21))
+    assert "reviews.review_text" not in " ".join(statements)
+
+
+def test_without_fields_everything_is_loaded(client: FlaskClient, review: Review, statements: list[str]) -> None:
+    resp = client.get("/api/reviews/1")
+
+    assert resp.json["value"]["review_text"] == review.review_text
+    assert "reviews.review_text" in " ".join(statements)
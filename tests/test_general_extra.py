@@ -52,24 +52,23 @@ def test_rate_limit_autodetect_disabled_and_socket_blocked():
 
 
 def test_rate_limit_autodetect_success():
-    outcomes = [False, True]  # fail memcached, succeed redis
+    # Services are probed in parallel, so outcomes are keyed by port: fail
+    # memcached and mongodb, succeed redis.
+    open_ports = {6379}
 
     class StubSocket:
-        def __init__(self, should_succeed: bool) -> None:
-            self.should_succeed = should_succeed
-
         def settimeout(self, _):
             return None
 
-        def connect(self, _addr):
-            if not self.should_succeed:
+        def connect(self, addr):
+            if addr[1] not in open_ports:
                 raise OSError
 
         def close(self):
             return None
 
     def socket_factory(*_args, **_kwargs):
-        return StubSocket(outcomes.pop(0))
+        return StubSocket()
 
     services_checked: list[str] = []
 
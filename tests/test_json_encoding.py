@@ -0,0 +1,121 @@
+"""Tests for the ``API_JSON_ENCODER`` setting."""
+
+from __future__ import annotations
+
+import datetime
+import enum
+import json
+import uuid
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+
+from flarchitect.logging import CustomLogger
+from flarchitect.utils import json_encoding
+from flarchitect.utils.json_encoding import get_json_encoder, json_default, resolve_json_encoder
+from flarchitect.utils.response_helpers import create_response
+from flarchitect.utils.sse import sse_message
+
+
+class Colour(enum.Enum):
+    RED = "red"
+
+
+PAYLOAD = {
+    "when": datetime.datetime(2024, 5, 1, 12, 30, 15),
+    "day": datetime.date(2024, 5, 1),
+    "price": Decimal("10.50"),
+    "ref": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "colour": Colour.RED,
+    "nested": [{"b": 2, "a": 1}],
+}
+EXPECTED = {
+    "when": "2024-05-01T12:30:15",
+    "day": "2024-05-01",
+    "price": "10.50",
+    "ref": "12345678-1234-5678-1234-567812345678",
+    "colour": "red",
+    "nested": [{"a": 1, "b": 2}],
+}
+
+
+def _app(**config) -> Flask:
+    app = Flask(__name__)
+    app.config.update(config)
+    return app
+
+
+def test_stdlib_is_the_default() -> None:
+    assert resolve_json_encoder("json") is None
+    assert resolve_json_encoder(None) is None
+    with _app().app_context():
+        assert get_json_encoder() is None
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown API_JSON_ENCODER"):
+        resolve_json_encoder("yaml")
+
+
+def test_missing_backend_falls_back_to_stdlib(monkeypatch) -> None:
+    monkeypatch.setattr(json_encoding.importlib.util, "find_spec", lambda name: None)
+
+    assert resolve_json_encoder("orjson") is None
+    assert resolve_json_encoder("auto") is None
+
+
+def test_callable_backend() -> None:
+    encoder = resolve_json_encoder(lambda obj: json.dumps(obj, default=json_default))
+
+    assert json.loads(encoder.dumpb(PAYLOAD)) == json.loads(json.dumps(EXPECTED))
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec"])
+def test_compiled_backends_handle_common_types(backend: str) -> None:
+    pytest.importorskip(backend)
+    encoder = resolve_json_encoder(backend)
+
+    assert encoder.name == backend
+    assert encoder.dumps(PAYLOAD) == json.dumps(EXPECTED, sort_keys=True, separators=(",", ":"))
+
+
+def test_caller_default_runs_after_native_conversions() -> None:
+    pytest.importorskip("orjson")
+    encoder = resolve_json_encoder("orjson")
+
+    class Opaque:
+        pass
+
+    assert json.loads(encoder.dumps({"x": Opaque(), "p": Decimal("1.5")}, default=lambda value: "opaque")) == {"x": "opaque", "p": "1.5"}
+
+
+def test_create_response_uses_configured_encoder() -> None:
+    pytest.importorskip("orjson")
+    app = _app(API_JSON_ENCODER="orjson", API_VERSION="1.0")
+
+    with app.test_request_context("/"):
+        fast = create_response(value={"items": [1, 2]}, status=201)
+        assert get_json_encoder().name == "orjson"
+
+    with _app(API_VERSION="1.0").test_request_context("/"):
+        plain = create_response(value={"items": [1, 2]}, status=201)
+
+    assert fast.status_code == 201
+    assert fast.mimetype == "application/json"
+    fast_body, plain_body = fast.get_json(), plain.get_json()
+    fast_body.pop("datetime"), plain_body.pop("datetime")
+    assert fast_body == plain_body
+
+
+def test_sse_and_json_logs_use_configured_encoder(capsys) -> None:
+    app = _app(API_JSON_ENCODER=lambda obj: "<encoded>")
+
+    with app.app_context():
+        assert "data: <encoded>" in sse_message({"hello": "world"})
+
+    log = CustomLogger(verbosity_level=1)
+    log.json_mode = True
+    log.json_encoder = resolve_json_encoder(lambda obj: "<log>").dumps
+    log.log(1, "hello")
+    assert capsys.readouterr().out.strip() == "<log>"
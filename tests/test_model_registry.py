@@ -0,0 +1,62 @@
+from types import MappingProxyType
+
+import pytest
+
+from demo.basic_factory.basic_factory import create_app
+from demo.basic_factory.basic_factory.models import Author, Book
+from flarchitect.database.operations import CrudService
+from flarchitect.database.registry import ModelRegistry, describe_model, model_info
+from flarchitect.database.utils import get_primary_key_filters
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+def test_registry_is_built_at_route_setup(app):
+    registry = app.extensions["flarchitect"].model_registry
+
+    assert isinstance(registry, ModelRegistry)
+    assert Author in registry
+    assert Book in registry
+
+
+def test_model_info_is_read_only(app):
+    with app.app_context():
+        info = model_info(Author)
+
+    assert info.primary_key_names == ("id",)
+    assert "books" in info.relationships
+    assert "full_name" in info.hybrids
+    assert isinstance(info.columns, MappingProxyType)
+    with pytest.raises(TypeError):
+        info.columns["other"] = None
+    with pytest.raises(AttributeError):
+        info.primary_key_names = ("other",)
+
+
+def test_model_info_without_registry():
+    assert model_info(Author) is None
+
+    class NotMapped:
+        pass
+
+    app = create_app()
+    with app.app_context():
+        assert model_info(NotMapped) is None
+
+
+def test_helpers_read_from_registry(app):
+    with app.app_context():
+        assert get_primary_key_filters(Author, 3) == {"id": 3}
+        service = CrudService(model=Author, session=app.extensions["sqlalchemy"].session)
+        assert service.fetch_related_model_by_name("books") is Book
+
+
+def test_describe_model_matches_mapper():
+    info = describe_model(Book)
+
+    assert info.model is Book
+    assert info.relation_keys_by_target["Author"] == "author"
+    assert "id" in info.writable_keys
@@ -114,3 +114,60 @@ def test_safe_call_exception_is_none() -> None:
         raise RuntimeError
 
     assert PluginManager._safe_call(boom) is None
+
+
+def test_dispatch_skips_plugins_without_overrides() -> None:
+    calls: list[str] = []
+
+    class _OnlyAfterOp(PluginBase):
+        def after_model_op(self, context: dict[str, Any], output: Any) -> Any | None:
+            calls.append("after")
+            return None
+
+    mgr = PluginManager([_NoopPlugin(), _OnlyAfterOp()])
+
+    assert not mgr.has_hook("before_model_op")
+    assert mgr.has_hook("after_model_op")
+    assert mgr.before_model_op({}) is None
+    assert mgr.after_model_op({}, 1) is None
+    assert calls == ["after"]
+
+
+def test_after_response_runs_off_the_request_thread() -> None:
+    import threading
+
+    seen: list[tuple[str, dict[str, Any]]] = []
+    done = threading.Event()
+
+    class _Metrics(PluginBase):
+        def after_response(self, info: dict[str, Any]) -> None:
+            seen.append((threading.current_thread().name, info))
+            done.set()
+
+    mgr = PluginManager([_Metrics()])
+    mgr.after_response({"status_code": 200})
+
+    assert done.wait(5)
+    mgr.shutdown()
+    assert seen[0][0].startswith("flarchitect-after-response")
+    assert seen[0][1] == {"status_code": 200}
+
+
+def test_after_response_drops_calls_when_queue_is_full() -> None:
+    import threading
+
+    release = threading.Event()
+    calls: list[int] = []
+
+    class _Slow(PluginBase):
+        def after_response(self, info: dict[str, Any]) -> None:
+            release.wait(5)
+            calls.append(info["n"])
+
+    mgr = PluginManager([_Slow()], after_response_workers=1, after_response_queue=2)
+    for n in range(5):
+        mgr.after_response({"n": n})
+    release.set()
+    mgr.shutdown()
+
+    assert calls == [0, 1]
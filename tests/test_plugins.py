@@ -81,3 +81,67 @@ def test_plugin_hooks_and_mutation():
     assert spec.status_code == 200
     assert plugin.spec_started is True
     assert plugin.spec_completed is True
+
+
+def test_after_response_plugin_receives_request_snapshot():
+    import threading
+
+    seen: list[dict[str, Any]] = []
+    done = threading.Event()
+
+    class AuditPlugin(PluginBase):
+        def after_response(self, info: dict[str, Any]) -> None:
+            seen.append(info)
+            done.set()
+
+    app = create_app_models({"API_PLUGINS": [AuditPlugin()]})
+    resp = app.test_client().get("/api/books/1")
+
+    assert done.wait(5)
+    assert seen[0]["status_code"] == resp.status_code == 200
+    assert seen[0]["method"] == "GET"
+    assert seen[0]["path"] == "/api/books/1"
+    assert seen[0]["request_id"] == resp.headers["X-Request-ID"]
+
+
+def test_coroutine_hooks_and_plugins_are_awaited():
+    import asyncio
+
+    seen: list[str] = []
+
+    class AsyncAuditPlugin(PluginBase):
+        async def after_model_op(self, context: dict[str, Any], output: Any) -> Any | None:
+            await asyncio.sleep(0)
+            seen.append(f"plugin:{context['method']}")
+            return None
+
+    async def return_hook(model=None, output=None, **kwargs):
+        await asyncio.sleep(0)
+        seen.append(f"hook:{model.__name__}")
+        return {"output": output}
+
+    app = create_app_models({"API_PLUGINS": [AsyncAuditPlugin()], "API_RETURN_CALLBACK": return_hook})
+    resp = app.test_client().get("/api/books/1")
+
+    assert resp.status_code == 200
+    assert resp.get_json()["value"]["id"] == 1
+    assert seen == ["hook:Book", "plugin:GET"]
+
+
+def test_coroutine_plugin_without_async_support_is_not_swallowed(monkeypatch):
+    import pytest
+
+    from flarchitect.plugins import PluginManager
+
+    class AsyncPlugin(PluginBase):
+        async def before_model_op(self, context: dict[str, Any]) -> dict[str, Any] | None:
+            return {"seen": True}
+
+    class BrokenPlugin(PluginBase):
+        def before_model_op(self, context: dict[str, Any]) -> dict[str, Any] | None:
+            raise ValueError("plugin bug")
+
+    monkeypatch.setattr("importlib.util.find_spec", lambda name, *args: None)
+    assert PluginManager([BrokenPlugin()]).before_model_op({}) is None
+    with pytest.raises(RuntimeError, match="flask\\[async\\]"):
+        PluginManager([AsyncPlugin()]).before_model_op({})
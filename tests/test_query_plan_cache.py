@@ -0,0 +1,82 @@
+import pytest
+
+from demo.basic_factory.basic_factory import create_app
+from flarchitect.database.plans import QueryPlanCache, get_query_plan_cache
+
+
+@pytest.fixture
+def app():
+    return create_app({"API_ALLOW_JOIN": True})
+
+
+def _stats(app):
+    with app.app_context():
+        return get_query_plan_cache().stats()
+
+
+def test_same_shape_hits_and_binds_new_values(app):
+    client = app.test_client()
+
+    first = client.get("/api/authors?id__le=2").get_json()
+    second = client.get("/api/authors?id__le=4").get_json()
+
+    stats = _stats(app)
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert [row["id"] for row in first["value"]] == [1, 2]
+    assert [row["id"] for row in second["value"]] == [1, 2, 3, 4]
+
+
+def test_different_shapes_miss(app):
+    client = app.test_client()
+
+    client.get("/api/authors?id__le=2")
+    client.get("/api/authors?id__ge=2")
+    client.get("/api/authors?id__le=2&join=books")
+
+    assert _stats(app)["misses"] == 3
+
+
+def test_or_groups_key_on_their_condition_keys(app):
+    client = app.test_client()
+
+    two_three = client.get("/api/authors?or[id__eq=2,id__eq=3]").get_json()
+    four_five = client.get("/api/authors?or[id__eq=4,id__eq=5]").get_json()
+    mixed = client.get("/api/authors?or[id__eq=1,first_name__eq=nobody]").get_json()
+
+    stats = _stats(app)
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    assert {row["id"] for row in two_three["value"]} == {2, 3}
+    assert {row["id"] for row in four_five["value"]} == {4, 5}
+    assert {row["id"] for row in mixed["value"]} == {1}
+
+
+def test_invalid_columns_are_not_cached(app):
+    client = app.test_client()
+
+    assert client.get("/api/authors?nope__eq=1").status_code == 400
+    assert client.get("/api/authors?nope__eq=2").status_code == 400
+    assert _stats(app)["size"] == 0
+
+
+def test_cache_size_setting_bounds_entries():
+    app = create_app({"API_QUERY_PLAN_CACHE_SIZE": 2})
+    client = app.test_client()
+
+    for column in ("id__le", "id__ge", "id__lt"):
+        client.get(f"/api/authors?{column}=3")
+
+    stats = _stats(app)
+    assert stats["maxsize"] == 2
+    assert stats["size"] == 2
+
+
+def test_zero_size_disables_storage():
+    cache = QueryPlanCache(0)
+    built = []
+
+    for _ in range(2):
+        cache.get_or_build("key", lambda: built.append(1) or object())
+
+    assert len(built) == 2
+    assert cache.stats() == {"hits": 0, "misses": 2, "size": 0, "maxsize": 0}
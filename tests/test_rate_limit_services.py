@@ -2,9 +2,20 @@
 
 from __future__ import annotations
 
+import json
+import time
+
 import pytest
 
-from flarchitect.utils.general import check_rate_prerequisites, check_rate_services
+from demo.model_extension.model import create_app
+from flarchitect.utils import general, rate_limit
+from flarchitect.utils.general import (
+    check_rate_prerequisites,
+    check_rate_services,
+    clear_rate_service_cache,
+    detect_rate_service,
+    rate_service_detection,
+)
 
 
 class TestRateLimitServices:
@@ -74,3 +85,95 @@ class TestRateLimitServices:
             check_rate_services(
                 config_getter=lambda *_, **__: "redis://",
             )
+
+
+class SlowSocket:
+    """Socket stub that takes ``delay`` seconds per connect attempt."""
+
+    def __init__(self, listening: set[int], delay: float = 0.0) -> None:
+        self.listening = listening
+        self.delay = delay
+
+    def settimeout(self, value: float) -> None:
+        self.timeout = value
+
+    def connect(self, address: tuple[str, int]) -> None:
+        time.sleep(self.delay)
+        if address[1] not in self.listening:
+            raise OSError
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def detect_calls(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record calls to the probe instead of opening real sockets."""
+
+    calls: list[float] = []
+
+    def fake_detect(prereq_checker, socket_factory, timeout):
+        calls.append(timeout)
+        return "redis://127.0.0.1:6379"
+
+    clear_rate_service_cache()
+    monkeypatch.setattr(general, "detect_rate_service", fake_detect)
+    yield calls
+    clear_rate_service_cache()
+
+
+def test_probes_run_in_parallel_and_keep_priority() -> None:
+    started = time.perf_counter()
+    uri = detect_rate_service(
+        prereq_checker=lambda _: None,
+        socket_factory=lambda *_: SlowSocket({6379, 27017}, delay=0.2),
+    )
+
+    # Sequential probing would take 0.6s; Redis still wins over MongoDB.
+    assert time.perf_counter() - started < 0.4
+    assert uri == "redis://127.0.0.1:6379"
+
+
+def test_detection_is_cached_per_process(detect_calls: list[float]) -> None:
+    config = {"API_RATE_LIMIT_DETECT_TIMEOUT": 0.02}
+
+    def getter(key, default=None):
+        return config.get(key, default)
+
+    assert check_rate_services(config_getter=getter) == "redis://127.0.0.1:6379"
+    assert check_rate_services(config_getter=getter) == "redis://127.0.0.1:6379"
+
+    assert detect_calls == [0.02]
+    assert rate_service_detection["source"] == "process"
+
+
+def test_detection_file_is_shared_between_processes(detect_calls: list[float], tmp_path) -> None:
+    cache_file = tmp_path / "rate-limit.json"
+    config = {"API_RATE_LIMIT_DETECT_CACHE_FILE": str(cache_file)}
+
+    def getter(key, default=None):
+        return config.get(key, default)
+
+    check_rate_services(config_getter=getter)
+    # Simulate a fresh worker process: the in-memory cache is gone.
+    clear_rate_service_cache()
+    cache_file.write_text(json.dumps({"uri": None}))
+
+    assert check_rate_services(config_getter=getter) is None
+    assert detect_calls == [0.05]
+    assert rate_service_detection["source"] == "file"
+
+
+def test_lazy_detection_waits_for_first_limited_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+    monkeypatch.setattr(rate_limit, "check_rate_services", lambda: calls.append(1))
+
+    app = create_app({"API_RATE_LIMIT": "2 per minute", "API_RATE_LIMIT_LAZY_DETECT": True})
+    assert calls == []
+    assert app.extensions["flarchitect"].rate_limit_detection["source"] == "lazy"
+
+    client = app.test_client()
+    statuses = [client.get("/api/books?limit=1").status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 429]
+    assert calls == [1]
@@ -0,0 +1,68 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from demo.basic_factory.basic_factory import create_app
+from demo.basic_factory.basic_factory.extensions import db
+from demo.basic_factory.basic_factory.models import Author, Book
+from flarchitect.database.utils import get_related_b_query
+
+
+@pytest.fixture
+def app():
+    return create_app()
+
+
+def _record_statements(app):
+    statements = []
+    with app.app_context():
+        engine = app.extensions["sqlalchemy"].engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(" ".join(statement.lower().split()))
+
+    return statements
+
+
+def test_relation_collection_skips_existence_probe(app):
+    statements = _record_statements(app)
+
+    resp = app.test_client().get("/api/authors/1/books?limit=2")
+
+    assert resp.status_code == 200
+    assert len(resp.get_json()["value"]) == 2
+    book_queries = [sql for sql in statements if sql.startswith("select books.id")]
+    # Only the page fetch touches ``books``; the parent check is a PK lookup.
+    assert len(book_queries) == 1
+    assert statements[0].startswith("select authors.id")
+
+
+def test_relation_collection_missing_parent_is_404(app):
+    resp = app.test_client().get("/api/authors/99999/books")
+
+    assert resp.status_code == 404
+    assert resp.get_json()["errors"]["error"] == "Author not found."
+
+
+def test_relation_collection_existing_parent_without_children(app):
+    with app.app_context():
+        author = Author(first_name="No", last_name="Books", biography="", date_of_birth=date(1990, 1, 1), nationality="British")
+        db.session.add(author)
+        db.session.commit()
+        author_id = author.id
+
+    resp = app.test_client().get(f"/api/authors/{author_id}/books")
+
+    assert resp.status_code == 200
+    assert resp.get_json()["value"] == []
+    assert resp.get_json()["total_count"] == 0
+
+
+def test_related_query_uses_resolved_relationship(app):
+    with app.app_context():
+        books = get_related_b_query(Author, Book, 1, db.session, relationship_attr=Author.books).all()
+
+    assert books
+    assert {book.author_id for book in books} == {1}
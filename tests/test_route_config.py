@@ -0,0 +1,100 @@
+"""Tests for per-route configuration snapshots."""
+
+from __future__ import annotations
+
+import pytest
+from flask.testing import FlaskClient
+
+from demo.basic_factory.basic_factory import create_app
+from demo.basic_factory.basic_factory.models import Book, Publisher
+from flarchitect import Architect
+from flarchitect.core.route_config import activate_route_config, resolve_route_config
+from flarchitect.utils.config_helpers import get_config_or_model_meta
+
+
+@pytest.fixture(autouse=True)
+def publisher_page_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Publisher.Meta, "pagination_size_default", 2, raising=False)
+
+
+def _architect(client: FlaskClient) -> Architect:
+    return client.application.extensions["flarchitect"]
+
+
+def _snapshot(client: FlaskClient, model: type, method: str = "GET", many: bool = True):
+    return next(
+        snapshot
+        for endpoint, snapshot in _architect(client).route_configs.items()
+        if snapshot.model is model and snapshot.method == method and ("collection" in endpoint) == many
+    )
+
+
+def test_snapshots_resolve_model_meta_and_config() -> None:
+    client = create_app({"API_PAGINATION_SIZE_DEFAULT": 10}).test_client()
+
+    assert _snapshot(client, Publisher).get("API_PAGINATION_SIZE_DEFAULT") == 2
+    assert _snapshot(client, Publisher).get("API_PAGINATION_SIZE_DEFAULT", with_model=False) == 10
+    assert _snapshot(client, Book).get("API_PAGINATION_SIZE_DEFAULT") == 10
+    assert _snapshot(client, Book).get("API_FILTER_CALLBACK", "unset") == "unset"
+
+
+def test_lookup_only_answers_the_route_model_and_method() -> None:
+    client = create_app().test_client()
+    snapshot = _snapshot(client, Book)
+
+    assert snapshot.lookup("API_FIELD_CASE") == (True, None)
+    assert snapshot.lookup("API_FIELD_CASE", Book, "GET") == (True, None)
+    assert snapshot.lookup("API_FIELD_CASE", Publisher) == (False, None)
+    assert snapshot.lookup("API_FIELD_CASE", Book, "POST") == (False, None)
+    assert snapshot.lookup("API_NOT_SNAPSHOTTED") == (False, None)
+
+
+def test_snapshots_follow_config_changes() -> None:
+    client = create_app().test_client()
+    assert "publication_date" in client.get("/api/books/1").json["value"]
+    snapshot = _snapshot(client, Book, many=False)
+
+    client.application.config["API_FIELD_CASE"] = "camel"
+    assert "publicationDate" in client.get("/api/books/1").json["value"]
+    assert _snapshot(client, Book, many=False) is not snapshot
+
+
+def test_snapshots_follow_meta_changes() -> None:
+    client = create_app().test_client()
+    assert "publication_date" in client.get("/api/books/1").json["value"]
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(Book.Meta, "field_case", "camel", raising=False)
+        assert "publicationDate" in client.get("/api/books/1").json["value"]
+    assert "publication_date" in client.get("/api/books/1").json["value"]
+
+
+def test_active_snapshot_serves_lookups() -> None:
+    client = create_app().test_client()
+    app = client.application
+    snapshot = resolve_route_config("custom", Book, "GET", app=app)
+    app.config["API_ALLOW_FILTERS"] = False
+
+    with app.test_request_context("/"):
+        with activate_route_config(snapshot):
+            assert get_config_or_model_meta("API_ALLOW_FILTERS", model=Book, default=True) is True
+            assert get_config_or_model_meta("API_ALLOW_FILTERS", model=Publisher, default=True) is False
+        assert get_config_or_model_meta("API_ALLOW_FILTERS", model=Book, default=True) is False
+
+
+def test_debug_route_dumps_snapshots() -> None:
+    client = create_app({"API_CONFIG_DEBUG_ROUTE": "/_route-config", "API_FILTER_CALLBACK": len}).test_client()
+
+    payload = client.get("/_route-config?endpoint=GET_single__publishers_").json["value"]
+
+    (endpoint, snapshot), = payload.items()
+    assert "publishers" in endpoint
+    assert snapshot["model"] == "Publisher"
+    assert snapshot["settings"]["API_PAGINATION_SIZE_DEFAULT"] == {"app": None, "model": 2, "method": 2}
+    assert snapshot["settings"]["API_FILTER_CALLBACK"]["model"] == "builtins.len"
+
+
+def test_debug_route_is_opt_in() -> None:
+    client = create_app().test_client()
+
+    assert client.get("/_route-config").status_code == 404
@@ -0,0 +1,78 @@
+"""Tests for sharing generated schema fields across requests with query strings."""
+
+from __future__ import annotations
+
+import pytest
+from flask.testing import FlaskClient
+
+from demo.basic_factory.basic_factory import create_app
+from demo.basic_factory.basic_factory.extensions import db
+from demo.basic_factory.basic_factory.models import Book
+from flarchitect.schemas.bases import clear_schema_field_cache, schema_field_cache_stats
+
+
+@pytest.fixture()
+def client() -> FlaskClient:
+    client = create_app().test_client()
+    clear_schema_field_cache()
+    return client
+
+
+def _first_book(client: FlaskClient) -> Book:
+    with client.application.app_context():
+        return db.session.get(Book, 1)
+
+
+def test_paging_and_filter_arguments_reuse_cached_fields(client: FlaskClient) -> None:
+    title = _first_book(client).title
+    client.get("/api/books")
+    client.get("/api/books?page=1&limit=1")
+    warm = schema_field_cache_stats()
+
+    for query in ({"page": 2, "limit": 1}, {"title__eq": title}, {"order_by": "-id"}):
+        assert client.get("/api/books", query_string=query).status_code == 200
+
+    stats = schema_field_cache_stats()
+    assert stats["size"] == warm["size"]
+    assert stats["misses"] == warm["misses"]
+    assert stats["hits"] > warm["hits"]
+
+
+def test_dump_override_gets_its_own_entry(client: FlaskClient) -> None:
+    book = _first_book(client)
+
+    as_url = client.get("/api/books/1").json["value"]
+    as_json = client.get("/api/books/1?dump=json").json["value"]
+    again = client.get("/api/books/1").json["value"]
+
+    assert as_url["author"] == f"/api/authors/{book.author_id}"
+    assert as_json["author"]["id"] == book.author_id
+    assert again == as_url
+
+
+def test_dump_relationships_opt_out_is_not_shared(client: FlaskClient) -> None:
+    assert "author" in client.get("/api/books/1").json["value"]
+    assert "author" not in client.get("/api/books/1?dump_relationships=false").json["value"]
+    assert "author" in client.get("/api/books/1").json["value"]
+
+
+def test_dynamic_join_tokens_select_the_entry() -> None:
+    client = create_app({"API_SERIALIZATION_TYPE": "dynamic", "API_ALLOW_JOIN": True}).test_client()
+    book = _first_book(client)
+
+    plain = client.get("/api/books/1").json["value"]
+    joined = client.get("/api/books/1?join=author").json["value"]
+    plain_again = client.get("/api/books/1", query_string={"title__eq": book.title}).json["value"]
+
+    assert "author" not in plain
+    assert joined["author"]["id"] == book.author_id
+    assert plain_again == plain
+
+
+def test_explicit_join_without_add_relations() -> None:
+    client = create_app({"API_ADD_RELATIONS": False, "API_ALLOW_JOIN": True}).test_client()
+    book = _first_book(client)
+
+    assert "author" not in client.get("/api/books/1").json["value"]
+    assert client.get("/api/books/1?join=author").json["value"]["author"] == f"/api/authors/{book.author_id}"
+    assert "author" not in client.get("/api/books/1").json["value"]
@@ -0,0 +1,90 @@
+"""Tests for ``API_SESSION_ROUTER`` read-replica routing."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from demo.basic_factory.basic_factory import create_app
+from demo.basic_factory.basic_factory.extensions import db
+from demo.basic_factory.basic_factory.models import Publisher, Review
+
+NEW_PUBLISHER = {"name": "fresh", "website": "https://fresh.example", "foundation_year": 2020}
+
+
+class CountingFactory:
+    def __init__(self, factory: sessionmaker) -> None:
+        self.factory = factory
+        self.opened: list[Session] = []
+
+    def __call__(self) -> Session:
+        session = self.factory()
+        self.opened.append(session)
+        return session
+
+
+@pytest.fixture()
+def replica(tmp_path) -> CountingFactory:
+    engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    db.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        session.add(Publisher(name="replica", website="https://replica.example", foundation_year=1999))
+        session.commit()
+    return CountingFactory(factory)
+
+
+@pytest.fixture()
+def client(replica: CountingFactory):
+    return create_app({"API_SESSION_ROUTER": {"read": replica}}).test_client()
+
+
+def _names(client, path: str, **headers) -> list[str]:
+    return [row["name"] for row in client.get(path, headers=headers).json["value"]]
+
+
+def test_reads_use_replica_and_writes_use_primary(client, replica: CountingFactory) -> None:
+    assert _names(client, "/api/publishers") == ["replica"]
+    assert client.get("/api/publishers/1").json["value"]["name"] == "replica"
+
+    assert client.post("/api/publishers", json=NEW_PUBLISHER).status_code == 200
+    assert _names(client, "/api/publishers") == ["replica"]
+    with replica.factory() as session:
+        assert session.scalars(select(Publisher.name)).all() == ["replica"]
+    with client.application.app_context():
+        assert "fresh" in db.session.scalars(select(Publisher.name)).all()
+
+
+def test_replica_session_opened_once_per_request_and_closed(client, replica: CountingFactory) -> None:
+    client.get("/api/publishers")
+    client.get("/api/publishers/1")
+
+    assert len(replica.opened) == 2
+    assert all(not session.in_transaction() for session in replica.opened)
+
+
+def test_meta_override_reads_primary(monkeypatch: pytest.MonkeyPatch, replica: CountingFactory) -> None:
+    # Review reads must never lag behind the primary.
+    monkeypatch.setattr(Review.Meta, "session_router", {"read": None}, raising=False)
+    client = create_app({"API_SESSION_ROUTER": {"read": replica}}).test_client()
+
+    assert client.get("/api/reviews").json["value"]
+    assert _names(client, "/api/publishers") == ["replica"]
+
+
+def test_read_your_writes_window_is_per_client(replica: CountingFactory) -> None:
+    client = create_app({"API_SESSION_ROUTER": {"read": replica}, "API_SESSION_STICKY_SECONDS": 30}).test_client()
+    writer = {"Authorization": "Bearer writer"}
+
+    client.post("/api/publishers", json=NEW_PUBLISHER, headers=writer)
+
+    assert "fresh" in _names(client, "/api/publishers?limit=100", **writer)
+    assert _names(client, "/api/publishers", Authorization="Bearer reader") == ["replica"]
+
+
+def test_without_router_routes_keep_the_default_session(replica: CountingFactory) -> None:
+    client = create_app().test_client()
+
+    assert "replica" not in _names(client, "/api/publishers")
+    assert replica.opened == []
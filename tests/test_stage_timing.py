@@ -0,0 +1,102 @@
+"""Tests for per-stage request timing (``API_SERVER_TIMING`` / ``API_METRICS_SINK``)."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+
+from flask import Flask
+
+from demo.model_extension.model import create_app
+from flarchitect.logging import logger
+from flarchitect.utils.timing import StageTimer, server_timing_header, stage, timed
+
+
+def _server_timing(header: str) -> dict[str, float]:
+    metrics = {}
+    for metric in header.split(", "):
+        name, dur = metric.split(";dur=")
+        metrics[name] = float(dur)
+    return metrics
+
+
+def test_server_timing_header_lists_collection_stages() -> None:
+    client = create_app({"API_SERVER_TIMING": True}).test_client()
+
+    resp = client.get("/api/books?limit=5")
+
+    assert resp.status_code == 200
+    metrics = _server_timing(resp.headers["Server-Timing"])
+    assert {"auth", "filter", "count", "fetch", "serialise", "response", "encode", "total"} <= set(metrics)
+    stages = sum(value for name, value in metrics.items() if name != "total")
+    assert stages <= metrics["total"]
+
+
+def test_metrics_sink_receives_write_stages() -> None:
+    events: list[dict[str, Any]] = []
+    client = create_app({"API_METRICS_SINK": events.append}).test_client()
+
+    data = client.get("/api/books/1").get_json()["value"]
+    data.pop("id", None)
+    resp = client.post("/api/books", json=data)
+
+    assert "Server-Timing" not in resp.headers
+    assert [event["method"] for event in events] == ["GET", "POST"]
+    assert events[1]["status_code"] == 200
+    assert {"deserialise", "pre-hook", "post-hook", "serialise"} <= set(events[1]["stages_ms"])
+    assert events[1]["total_ms"] >= sum(events[1]["stages_ms"].values())
+
+
+def test_rate_limit_stage_excludes_the_view() -> None:
+    client = create_app({"API_SERVER_TIMING": True, "API_RATE_LIMIT": "100 per minute"}).test_client()
+
+    metrics = _server_timing(client.get("/api/books?limit=5").headers["Server-Timing"])
+
+    assert "rate-limit" in metrics
+    assert metrics["rate-limit"] < metrics["total"] - metrics["fetch"]
+
+
+def test_timing_disabled_by_default() -> None:
+    client = create_app({}).test_client()
+
+    resp = client.get("/api/books?limit=5")
+
+    assert "Server-Timing" not in resp.headers
+
+
+def test_json_logs_carry_stage_timings(capsys) -> None:
+    app = create_app({"API_SERVER_TIMING": True, "API_JSON_LOGS": True, "API_VERBOSITY_LEVEL": 1})
+    try:
+        app.test_client().get("/api/books?limit=5")
+    finally:
+        logger.json_mode = False
+        logger.verbosity_level = 0
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.startswith("{")]
+    completed = [line for line in lines if line["message"].startswith("Completed GET /api/books")]
+    assert completed and "fetch" in completed[0]["stages_ms"]
+
+
+def test_nested_stages_record_self_time() -> None:
+    app = Flask(__name__)
+    timer = StageTimer()
+
+    with app.test_request_context():
+        from flask import g
+
+        g._flarch_stage_timer = timer
+
+        @timed("outer")
+        def outer() -> None:
+            time.sleep(0.005)
+            with stage("inner"):
+                time.sleep(0.03)
+            timed(None, time.sleep)(0.03)
+
+        outer()
+
+    # Without self-time accounting "outer" would include both 0.03s sleeps.
+    assert timer.timings["inner"] >= 0.03
+    assert 0.005 <= timer.timings["outer"] < 0.03
+    assert server_timing_header(timer).startswith("inner;dur=")
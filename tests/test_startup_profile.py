@@ -0,0 +1,115 @@
+"""Tests for the start-up profile and ``API_LAZY_SCHEMAS``."""
+
+from __future__ import annotations
+
+import gc
+import json
+from typing import Any
+
+from demo.model_extension.model import create_app
+from flarchitect.cli import main
+from flarchitect.schemas.bases import schema_field_cache_stats
+from flarchitect.utils.startup_profile import StartupProfile
+
+
+def test_profile_records_phases_and_model_stages() -> None:
+    profile = create_app({}).extensions["flarchitect"].startup_profile
+
+    assert {"routes", "spec", "rate-limiter"} <= set(profile.phases)
+    assert profile.total >= sum(profile.phases.values()) * 0.99
+    assert {"schemas", "routes", "relations", "spec"} <= set(profile.model_timings()["Book"])
+    assert profile.report(top=1).splitlines()[-1].startswith("... ")
+
+
+def test_model_stages_outside_a_phase_are_ignored() -> None:
+    class Book:
+        pass
+
+    profile = StartupProfile()
+    with profile.model_stage(Book, "schemas"):
+        pass
+    with profile.phase("warmup"), profile.model_stage(Book, "schemas"):
+        pass
+
+    assert list(profile.model_timings()) == ["Book"]
+    assert profile.phases["warmup"] == profile.total
+
+
+def test_lazy_schemas_build_routes_on_first_request() -> None:
+    app = create_app({"API_LAZY_SCHEMAS": True})
+    api = app.extensions["flarchitect"].api
+    pending = len(api._pending_routes)
+
+    assert pending
+    assert all(route["output_schema"] is None for route in api.created_routes.values() if route["method"] == "GET")
+    assert app.extensions["flarchitect"].startup_profile.model_timings()["Book"].get("schemas", 0) == 0
+
+    client = app.test_client()
+    book = client.get("/api/books/1").get_json()["value"]
+    assert {"title", "author", "reviews"} <= set(book)
+    assert client.get("/api/books/1?fields=title").get_json()["value"] == {"title": book["title"]}
+    assert len(api._pending_routes) == pending - 1
+    assert api.created_routes["book"]["output_schema"] is not None
+
+
+def _without_examples(value: Any) -> Any:
+    # Spec examples and field descriptions are randomised per build.
+    if isinstance(value, dict):
+        return {key: _without_examples(item) for key, item in value.items() if key not in {"example", "description"}}
+    if isinstance(value, list):
+        return [_without_examples(item) for item in value]
+    return value
+
+
+def test_lazy_spec_matches_eager_spec() -> None:
+    eager = create_app({}).test_client().get("/docs/apispec.json").get_json()
+    lazy_app = create_app({"API_LAZY_SCHEMAS": True})
+
+    lazy = lazy_app.test_client().get("/docs/apispec.json").get_json()
+
+    assert _without_examples(lazy["paths"]) == _without_examples(eager["paths"])
+    assert lazy["components"]["schemas"].keys() == eager["components"]["schemas"].keys()
+    assert not lazy_app.extensions["flarchitect"].api._pending_routes
+
+
+def test_warmup_builds_pending_routes() -> None:
+    architect = create_app({"API_LAZY_SCHEMAS": True}).extensions["flarchitect"]
+    pending = len(architect.api._pending_routes)
+
+    assert architect.warmup(freeze=False)["routes"] == pending
+    assert architect.warmup(freeze=False)["routes"] == 0
+    assert "warmup" in architect.startup_profile.phases
+
+
+def test_warmup_fills_schema_and_statement_caches() -> None:
+    app = create_app({"API_LAZY_SCHEMAS": True})
+    architect = app.extensions["flarchitect"]
+
+    summary = architect.warmup(freeze=False)
+    assert summary["schemas"] == summary["statements"] > 0
+    assert summary["frozen"] == gc.get_freeze_count()
+
+    misses = schema_field_cache_stats()["misses"]
+    assert app.test_client().get("/api/books").status_code == 200
+    assert schema_field_cache_stats()["misses"] == misses
+
+
+def test_warmup_freezes_the_heap() -> None:
+    architect = create_app({}).extensions["flarchitect"]
+    try:
+        assert architect.warmup()["frozen"] > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_cli_prints_json_profile(capsys) -> None:
+    main(["startup-profile", "demo.model_extension.model:create_app({'API_LAZY_SCHEMAS': True})", "--warmup", "--json"])
+
+    # The demo app logs to stdout while it is created; the JSON comes last.
+    lines = capsys.readouterr().out.splitlines()
+    summary = json.loads("\n".join(lines[lines.index("{") :]))
+    assert summary["app_ms"] >= summary["total_ms"] > 0
+    assert {"routes", "warmup"} <= set(summary["phases_ms"])
+    assert summary["models_ms"]["Book"]["schemas"] > 0
+    assert summary["rate_limit_detection"]["source"]
+    gc.unfreeze()
@@ -0,0 +1,89 @@
+"""Tests for streamed NDJSON and JSON collection responses."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from demo.basic_factory.basic_factory import create_app
+from demo.basic_factory.basic_factory.extensions import db
+from demo.basic_factory.basic_factory.models import Author
+
+STREAMING = {"API_STREAMING": True, "API_STREAM_BATCH_SIZE": 10}
+
+
+@pytest.fixture()
+def client():
+    return create_app(STREAMING).test_client()
+
+
+def test_ndjson_stream_matches_buffered_rows(client) -> None:
+    buffered = client.get("/api/authors?limit=100").json["value"]
+
+    resp = client.get("/api/authors", headers={"Accept": "application/x-ndjson"})
+
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/x-ndjson"
+    assert "Content-Length" not in resp.headers
+    assert [json.loads(line) for line in resp.get_data(as_text=True).splitlines()] == buffered
+
+
+def test_json_stream_envelope_has_trailer(client) -> None:
+    resp = client.get("/api/authors?stream=1&orderby=-id&id__le=10")
+    body = resp.get_data(as_text=True)
+    payload = json.loads(body)
+
+    assert "Content-Length" not in resp.headers
+    assert [row["id"] for row in payload["value"]] == list(range(10, 0, -1))
+    assert payload["total_count"] == 10
+    assert payload["status_code"] == 200
+    assert isinstance(payload["response_ms"], (int, float))
+    assert body.index('"value"') < body.index('"total_count"')
+
+
+def test_stream_honours_explicit_limit_and_page(client) -> None:
+    lines = client.get("/api/authors?stream=ndjson&limit=5&page=2").get_data(as_text=True).splitlines()
+
+    assert [json.loads(line)["id"] for line in lines] == list(range(6, 11))
+
+
+def test_empty_stream_envelope(client) -> None:
+    payload = json.loads(client.get("/api/authors?stream=1&first_name__eq=missing").get_data(as_text=True))
+
+    assert payload["value"] == []
+    assert payload["total_count"] == 0
+
+
+def test_errors_before_first_byte_use_standard_envelope(client) -> None:
+    resp = client.get("/api/authors?stream=1&limit=abc")
+
+    assert resp.status_code == 400
+    assert "Content-Length" in resp.headers
+    assert resp.json["errors"]["error"] == "Items per page must be an integer."
+
+
+def test_streaming_is_opt_in() -> None:
+    client = create_app({**STREAMING, "API_STREAMING": False}).test_client()
+
+    resp = client.get("/api/authors?stream=1", headers={"Accept": "application/x-ndjson"})
+
+    assert "Content-Length" in resp.headers
+    assert len(resp.json["value"]) == 20
+
+
+def test_streamed_batches_are_expunged(client) -> None:
+    from sqlalchemy import inspect
+
+    from flarchitect.utils.streaming import StreamedRows
+
+    with client.application.test_request_context("/api/authors"):
+        rows = StreamedRows(db.session.query(Author).order_by(Author.id), "ndjson", batch_size=25)
+        batches = []
+        for batch in rows.batches():
+            assert all(inspect(author).persistent for author in batch)
+            assert all(inspect(author).detached for previous in batches for author in previous)
+            batches.append(batch)
+
+        assert [len(batch) for batch in batches] == [25, 25, 10]
+        assert not any(isinstance(obj, Author) for obj in db.session.identity_map.values())
@@ -0,0 +1,117 @@
+import pytest
+from sqlalchemy import event
+
+from demo.basic_factory.basic_factory import create_app
+from flarchitect.database.counts import resolve_count_mode
+
+
+def _count_statements(app):
+    statements = []
+    with app.app_context():
+        engine = app.extensions["sqlalchemy"].engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if "count(" in statement.lower():
+            statements.append(statement)
+
+    return statements
+
+
+def test_exact_mode_is_default():
+    app = create_app()
+    payload = app.test_client().get("/api/authors?limit=2").get_json()
+
+    assert payload["total_count"] > 2
+    assert "total_count_estimated" not in payload
+
+
+def test_none_mode_skips_count_and_keeps_links():
+    app = create_app({"API_TOTAL_COUNT_MODE": "none"})
+    statements = _count_statements(app)
+    client = app.test_client()
+
+    first = client.get("/api/authors?limit=2").get_json()
+    assert first["total_count"] is None
+    assert len(first["value"]) == 2
+    assert "page=2" in first["next_url"]
+    assert first["previous_url"] is None
+
+    second = client.get(first["next_url"]).get_json()
+    assert "page=1" in second["previous_url"]
+    assert statements == []
+
+
+def test_none_mode_last_page_has_no_next():
+    app = create_app({"API_TOTAL_COUNT_MODE": "none"})
+    client = app.test_client()
+    total = create_app().test_client().get("/api/authors?limit=1").get_json()["total_count"]
+
+    last = client.get(f"/api/authors?limit=1&page={total}").get_json()
+    assert len(last["value"]) == 1
+    assert last["next_url"] is None
+
+
+def test_estimated_mode_uses_hook_and_marks_value():
+    calls = []
+
+    def estimator(query, model):
+        calls.append(model.__name__)
+        return 1234
+
+    app = create_app({"API_TOTAL_COUNT_MODE": "estimated", "API_TOTAL_COUNT_ESTIMATOR": estimator})
+    payload = app.test_client().get("/api/authors?limit=2").get_json()
+
+    assert calls == ["Author"]
+    assert payload["total_count"] == 1234
+    assert payload["total_count_estimated"] is True
+    assert "page=2" in payload["next_url"]
+
+
+def test_estimated_mode_falls_back_to_exact_without_estimate():
+    exact = create_app().test_client().get("/api/authors?limit=2").get_json()["total_count"]
+    app = create_app({"API_TOTAL_COUNT_MODE": "estimated"})
+    payload = app.test_client().get("/api/authors?limit=2").get_json()
+
+    assert payload["total_count"] == exact
+    assert "total_count_estimated" not in payload
+
+
+def test_cached_mode_reuses_count_per_filter_signature():
+    app = create_app({"API_TOTAL_COUNT_MODE": "cached", "API_TOTAL_COUNT_CACHE_TTL": 300})
+    statements = _count_statements(app)
+    client = app.test_client()
+
+    first = client.get("/api/authors?limit=2").get_json()
+    client.get("/api/authors?limit=2&page=2")
+    assert len(statements) == 1
+
+    filtered = client.get("/api/authors?limit=2&id__le=3").get_json()
+    assert len(statements) == 2
+    assert filtered["total_count"] == 3
+    assert first["total_count"] > 3
+
+    client.get("/api/authors?limit=2&id__le=3&page=2")
+    assert len(statements) == 2
+
+
+@pytest.mark.parametrize(("configured", "expected"), [("CACHED", "cached"), ("bogus", "exact"), (None, "exact")])
+def test_resolve_count_mode(configured, expected):
+    app = create_app({"API_TOTAL_COUNT_MODE": configured})
+    with app.app_context():
+        assert resolve_count_mode() == expected
+
+
+def test_estimate_explain_keeps_filter_values_bound():
+    from sqlalchemy import select
+    from sqlalchemy.dialects import postgresql
+
+    from demo.basic_factory.basic_factory.models import Author
+    from flarchitect.database.counts import _ExplainJSON
+
+    value = "x:name' OR 1=1 --"
+    compiled = _ExplainJSON(select(Author).where(Author.first_name == value)).compile(dialect=postgresql.dialect())
+
+    assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert value not in str(compiled)
+    assert value in compiled.params.values()
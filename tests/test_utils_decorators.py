@@ -229,6 +229,62 @@ def test_fields_respects_disallow_select_fields_flag() -> None:
     assert set(schema.fields.keys()) == {"a", "b"}
 
 
+def test_fields_reads_plain_schema_field_names_once() -> None:
+    """Field names of plain schemas are read once, not rebuilt per request."""
+
+    instances: list[Schema] = []
+
+    class ItemSchema(Schema):
+        a = fields.Integer()
+        b = fields.String()
+
+        class Meta:
+            model = object
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            instances.append(self)
+
+    @fields_decorator(ItemSchema, many=True)
+    def handler(**kwargs: Any) -> Any:
+        return kwargs
+
+    app = _make_app()
+    for _ in range(3):
+        with app.test_request_context("/items?fields=a,missing"):
+            result = handler()
+        assert set(result["schema"].fields) == {"a"}
+        assert result["field_selection"] == {"a": "field"}
+
+    # One instance to read the available names, then one per request.
+    assert len(instances) == 4
+
+
+def test_handle_one_inspects_signature_at_decoration(monkeypatch) -> None:
+    """The accepted keyword arguments are computed once per view."""
+
+    calls: list[Any] = []
+    signature = decorators.inspect.signature
+
+    def counting_signature(func: Any) -> Any:
+        calls.append(func)
+        return signature(func)
+
+    monkeypatch.setattr(decorators.inspect, "signature", counting_signature)
+
+    @decorators.handle_one(None)
+    def view(id: int) -> dict[str, int]:  # noqa: A002 - mirrors route kwargs
+        return {"id": id}
+
+    app = _make_app()
+    for _ in range(3):
+        with app.test_request_context("/items/1"):
+            response = view(id=1, schema=None, unexpected=True)
+        assert response.get_json()["value"] == {"id": 1}
+
+    assert len(calls) == 1
+
+
 # ---------------------------------------------------------------------------
 # standardize_response
 # ---------------------------------------------------------------------------
@@ -1,3 +1,8 @@
+import json
+
+import pytest
+
+from flarchitect.core import routes, websockets
 from flarchitect.core.websockets import _EventBus, broadcast_change
 
 
@@ -32,3 +37,69 @@ def test_broadcast_change_constructs_message_and_publishes():
     # No assertion here; behaviour validated in unit EventBus test. This call
     # should execute without exceptions and exercise code paths.
 
+
+
+Book = type("Book", (), {})
+
+
+@pytest.fixture()
+def bus(monkeypatch):
+    fresh = _EventBus()
+    monkeypatch.setattr(websockets, "_BUS", fresh)
+    return fresh
+
+
+def test_broadcast_reaches_each_subscriber_once_with_shared_message(bus):
+    sub_all = bus.subscribe("all")
+    sub_model = bus.subscribe("book")
+
+    broadcast_change(model=Book, method="post", payload={"id": 1}, id=1)
+
+    first, second = sub_all.queue.get_nowait(), sub_model.queue.get_nowait()
+    assert first is second
+    assert json.loads(first)["payload"] == {"id": 1}
+    assert sub_all.queue.empty() and sub_model.queue.empty()
+
+
+def test_broadcast_without_subscribers_does_not_build_message(bus, monkeypatch):
+    encoded: list[object] = []
+    monkeypatch.setattr(websockets, "json_dumps", lambda obj, default=None: encoded.append(obj) or "{}")
+    bus.subscribe("author")
+
+    assert not bus.has_subscribers("book")
+    broadcast_change(model=Book, method="post", payload={"id": 1})
+    assert encoded == []
+
+    bus.subscribe("all")
+    broadcast_change(model=Book, method="post", payload={"id": 1})
+    assert len(encoded) == 1
+
+
+def test_only_mutating_routes_broadcast(monkeypatch):
+    from demo.model_extension.model import create_app
+
+    calls: list[str] = []
+    monkeypatch.setattr(routes, "broadcast_change", lambda **kwargs: calls.append(kwargs["method"]))
+    client = create_app({}).test_client()
+
+    data = client.get("/api/books/1").get_json()["value"]
+    client.get("/api/books")
+    data.pop("id", None)
+    client.post("/api/books", json=data)
+
+    assert calls == ["POST"]
+
+
+def test_broadcast_dumps_model_instances_with_route_schema(bus):
+    from demo.model_extension.model import create_app
+
+    sub = bus.subscribe("book")
+    client = create_app({}).test_client()
+    data = client.get("/api/books/1").get_json()["value"]
+    data.pop("id", None)
+    created = client.post("/api/books", json=data).get_json()["value"]
+
+    event = json.loads(sub.queue.get_nowait())
+    assert event["method"] == "POST"
+    assert event["payload"]["id"] == created["id"]
+    assert event["payload"]["title"] == created["title"]
@@ -0,0 +1,164 @@
+"""Count configuration lookups per request, with and without the lookup cache.
+
+Builds a small two-model API plus a custom ``schema_constructor`` view, issues
+``--repeat`` requests to each route and reports how many
+``get_config_or_model_meta`` calls were made per request and how many of them
+walked model ``Meta`` and ``app.config`` (a full resolution), plus the cost of
+one repeated lookup in an app context and inside a request, first with the
+application lookup cache disabled and then with it enabled::
+
+    python tools/benchmark_config_lookups.py --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from typing import Any
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from marshmallow import Schema, fields
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+import flarchitect.utils.config_helpers as config_helpers
+from flarchitect import Architect
+
+
+class BaseModel(DeclarativeBase):
+    pass
+
+
+db = SQLAlchemy(model_class=BaseModel)
+
+
+class Author(db.Model):
+    __tablename__ = "authors"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String)
+    books: Mapped[list[Book]] = relationship("Book", back_populates="author")
+
+    class Meta:
+        pass
+
+
+class Book(db.Model):
+    __tablename__ = "books"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    title: Mapped[str] = mapped_column(String)
+    author_id: Mapped[int] = mapped_column(ForeignKey("authors.id"))
+    author: Mapped[Author] = relationship("Author", back_populates="books")
+
+    class Meta:
+        pass
+
+
+class SummarySchema(Schema):
+    books = fields.Integer()
+
+
+def build_app() -> Flask:
+    app = Flask("bench_config")
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        API_BASE_MODEL=db.Model,
+        API_CREATE_DOCS=False,
+        API_RATE_LIMIT_AUTODETECT=False,
+    )
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        author = Author(name="author")
+        db.session.add_all(Book(title=f"book {i}", author=author) for i in range(20))
+        db.session.commit()
+        architect = Architect(app=app)
+
+    @app.get("/summary")
+    @architect.schema_constructor(output_schema=SummarySchema, model=Book, auth=False)
+    def summary():
+        return {"books": db.session.query(Book).count()}
+
+    return app
+
+
+@contextmanager
+def counting() -> Any:
+    counts = {"lookups": 0, "resolved": 0}
+    lookup = config_helpers.get_config_or_model_meta
+    resolve = config_helpers._resolve_config_or_model_meta
+
+    def counted_lookup(*args: Any, **kwargs: Any) -> Any:
+        counts["lookups"] += 1
+        return lookup(*args, **kwargs)
+
+    def counted_resolve(*args: Any, **kwargs: Any) -> Any:
+        counts["resolved"] += 1
+        return resolve(*args, **kwargs)
+
+    modules = [module for name, module in sys.modules.items() if name.startswith("flarchitect") and getattr(module, "get_config_or_model_meta", None) is lookup]
+    for module in modules:
+        module.get_config_or_model_meta = counted_lookup
+    config_helpers._resolve_config_or_model_meta = counted_resolve
+    try:
+        yield counts
+    finally:
+        for module in modules:
+            module.get_config_or_model_meta = lookup
+        config_helpers._resolve_config_or_model_meta = resolve
+
+
+def measure(request: Callable[[], Any], repeat: int) -> tuple[float, float, float]:
+    request()  # warm up
+    with counting() as counts:
+        for _ in range(repeat):
+            request()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        request()
+    elapsed = (time.perf_counter() - started) / repeat
+    return counts["lookups"] / repeat, counts["resolved"] / repeat, elapsed
+
+
+def time_lookup(app: Flask, lookups: int = 20_000) -> tuple[float, float]:
+    def run() -> float:
+        lookup = config_helpers.get_config_or_model_meta
+        lookup("API_PAGINATION_SIZE_DEFAULT", model=Book, default=20)
+        started = time.perf_counter()
+        for _ in range(lookups):
+            lookup("API_PAGINATION_SIZE_DEFAULT", model=Book, default=20)
+        return (time.perf_counter() - started) / lookups
+
+    with app.app_context():
+        in_app = run()
+    with app.test_request_context("/"):
+        in_request = run()
+    return in_app, in_request
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    app = build_app()
+    client = app.test_client()
+    app_cache = config_helpers._app_config_cache
+    for label, cache in (("cache disabled", lambda sources=(): None), ("cache enabled", app_cache)):
+        config_helpers._app_config_cache = cache
+        print(label)
+        for path in ("/api/books", "/api/books/1", "/summary"):
+            lookups, resolved, elapsed = measure(lambda path=path: client.get(path), args.repeat)
+            print(f"  {path:>13}: {lookups:6.1f} lookups  {resolved:6.1f} resolved  {elapsed * 1000:6.2f} ms/request")
+        in_app, in_request = time_lookup(app)
+        print(f"  {'one lookup':>13}: {in_app * 1e6:6.2f} us (app context)  {in_request * 1e6:6.2f} us (request)")
+    config_helpers._app_config_cache = app_cache
+
+
+if __name__ == "__main__":
+    main()
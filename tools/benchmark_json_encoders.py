@@ -0,0 +1,118 @@
+"""Compare ``API_JSON_ENCODER`` backends on realistic response envelopes.
+
+Builds the envelope ``create_response`` returns for a page of ``--rows``
+already-dumped rows (strings, numbers, booleans, nulls, a relationship URL and
+a nested object), plus a variant whose rows carry raw ``datetime``,
+``Decimal``, ``UUID`` and ``Enum`` values, then times Flask's JSON provider and
+every installed backend ``--repeat`` times::
+
+    python tools/benchmark_json_encoders.py --rows 1000 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import enum
+import importlib.util
+import json
+import time
+import uuid
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+
+from flask import Flask
+
+from flarchitect.utils.json_encoding import json_default, resolve_json_encoder
+
+
+class Status(enum.Enum):
+    DRAFT = "draft"
+    LIVE = "live"
+
+
+def envelope(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "api_version": "1.0.0",
+        "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "value": rows,
+        "status_code": 200,
+        "errors": None,
+        "response_ms": 12.0,
+        "total_count": len(rows),
+        "next_url": "/api/orders?limit=1000&page=2",
+        "previous_url": None,
+    }
+
+
+def dumped_rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "reference": f"order-{i:06d}",
+            "total": 19.99 + i,
+            "paid": bool(i % 2),
+            "notes": None if i % 3 else "leave at the door",
+            "placed_at": "2024-01-01T12:30:00",
+            "store": f"/api/stores/{i % 7}",
+            "customer": {"id": i % 50, "name": f"customer-{i % 50}", "email": f"c{i % 50}@example.com"},
+        }
+        for i in range(count)
+    ]
+
+
+def raw_rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "reference": f"order-{i:06d}",
+            "total": Decimal("19.99") + i,
+            "status": Status.LIVE if i % 2 else Status.DRAFT,
+            "placed_at": datetime.datetime(2024, 1, 1, 12, 30) + datetime.timedelta(minutes=i),
+            "token": uuid.UUID(int=i),
+        }
+        for i in range(count)
+    ]
+
+
+def encoders(app: Flask) -> dict[str, Callable[[Any], Any]]:
+    found: dict[str, Callable[[Any], Any]] = {"flask provider": app.json.dumps}
+    for backend in ("orjson", "msgspec"):
+        if importlib.util.find_spec(backend) is not None:
+            found[backend] = resolve_json_encoder(backend).dumpb
+    return found
+
+
+def time_encode(encode: Callable[[Any], Any], payload: Any, repeat: int) -> float:
+    encode(payload)  # warm up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        encode(payload)
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    app = Flask("bench_json")
+    # Flask's provider handles dates, Decimal and UUID; ``Enum`` needs a hook.
+    flask_default = app.json.default
+    app.json.default = lambda value: value.value if isinstance(value, enum.Enum) else flask_default(value)
+
+    for label, payload in (("dumped rows", envelope(dumped_rows(args.rows))), ("raw values", envelope(raw_rows(args.rows)))):
+        with app.app_context():
+            size = len(json.dumps(payload, default=json_default))
+            print(f"{label}: {args.rows} rows, ~{size / 1024:.0f} KiB")
+            baseline = None
+            for name, encode in encoders(app).items():
+                seconds = time_encode(encode, payload, args.repeat)
+                baseline = baseline or seconds
+                print(f"  {name:>15}: {seconds * 1000:8.2f} ms  {baseline / seconds:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
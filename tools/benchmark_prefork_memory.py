@@ -0,0 +1,167 @@
+"""Measure per-worker private memory under a pre-forking server.
+
+Builds an API over ``--models`` generated models backed by a SQLite file,
+then forks ``--workers`` processes the way ``gunicorn --preload`` does. Each
+worker serves every collection and single-item route ``--repeat`` times and
+reports its private memory (``Private_Clean + Private_Dirty`` from
+``/proc/self/smaps_rollup``), which is what it does not share with the parent.
+
+The run is made twice, each in a fresh interpreter. In ``cold`` the parent
+forks straight after creating the app. In ``warm`` it calls
+``Architect.warmup()`` first::
+
+    python tools/benchmark_prefork_memory.py --models 100 --workers 8
+
+Linux only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import DeclarativeBase, mapped_column, relationship
+
+from flarchitect import Architect
+
+
+class BaseModel(DeclarativeBase):
+    pass
+
+
+db = SQLAlchemy(model_class=BaseModel)
+
+
+def make_models(count: int) -> list[type]:
+    """Create ``count`` models, each with a many-to-one to the previous one."""
+
+    models: list[type] = []
+    for index in range(count):
+        attrs: dict[str, Any] = {
+            "__tablename__": f"model_{index}",
+            "id": mapped_column(Integer, primary_key=True),
+            "name": mapped_column(String),
+            "code": mapped_column(String),
+            "rank": mapped_column(Integer),
+            "Meta": type("Meta", (), {}),
+        }
+        if index:
+            attrs["parent_id"] = mapped_column(ForeignKey(f"model_{index - 1}.id"))
+            attrs["parent"] = relationship(f"Model{index - 1}")
+        models.append(type(f"Model{index}", (db.Model,), attrs))
+    return models
+
+
+def build_app(models: list[type], database: Path) -> Flask:
+    app = Flask("bench_prefork")
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{database}",
+        API_BASE_MODEL=db.Model,
+        API_RATE_LIMIT_AUTODETECT=False,
+        API_LAZY_SCHEMAS=True,
+    )
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        for model in models:
+            db.session.add_all(model(name=f"{model.__name__}-{row}", code=str(row), rank=row) for row in range(1, 21))
+        db.session.commit()
+        Architect(app)
+    return app
+
+
+def private_kib() -> int:
+    totals = {}
+    for line in Path("/proc/self/smaps_rollup").read_text().splitlines():
+        key, _, value = line.partition(":")
+        if key in {"Private_Clean", "Private_Dirty"}:
+            totals[key] = int(value.split()[0])
+    return sum(totals.values())
+
+
+def serve(app: Flask, urls: list[str], repeat: int) -> dict[str, Any]:
+    client = app.test_client()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for url in urls:
+            response = client.get(url)
+            assert response.status_code == 200, (url, response.status_code)
+    return {"private_kib": private_kib(), "seconds": time.perf_counter() - started}
+
+
+def run(mode: str, model_count: int, workers: int, repeat: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        models = make_models(model_count)
+        app = build_app(models, Path(tmp) / "bench.db")
+        warmup = app.extensions["flarchitect"].warmup() if mode == "warm" else None
+        urls = [url for index in range(model_count) for url in (f"/api/model-{index}-s", f"/api/model-{index}-s/1")]
+
+        children = []
+        for _ in range(workers):
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:  # worker
+                os.close(read_fd)
+                try:
+                    result = serve(app, urls, repeat)
+                except BaseException as exc:  # report instead of dying silently
+                    result = {"error": repr(exc)}
+                os.write(write_fd, json.dumps(result).encode())
+                os._exit(0)
+            os.close(write_fd)
+            children.append((pid, read_fd))
+
+        results = []
+        for pid, read_fd in children:
+            with os.fdopen(read_fd) as pipe:
+                results.append(json.loads(pipe.read()))
+            os.waitpid(pid, 0)
+    if errors := [result["error"] for result in results if "error" in result]:
+        raise RuntimeError(f"Worker failed: {errors[0]}")
+
+    return {
+        "mode": mode,
+        "warmup": warmup,
+        "private_kib": sum(result["private_kib"] for result in results) / workers,
+        "first_pass_ms": 1000 * sum(result["seconds"] for result in results) / workers / repeat,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--models", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--mode", choices=["cold", "warm"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run(args.mode, args.models, args.workers, args.repeat)))
+        return
+
+    results = {}
+    for mode in ("cold", "warm"):
+        command = [sys.executable, __file__, "--mode", mode, "--models", str(args.models), "--workers", str(args.workers), "--repeat", str(args.repeat)]
+        output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{args.models} models, {args.workers} workers, {args.repeat} pass(es) over {2 * args.models} routes")
+    print(f"{'mode':<8}{'private MiB/worker':>20}{'ms/pass':>12}")
+    for mode, result in results.items():
+        print(f"{mode:<8}{result['private_kib'] / 1024:>20.1f}{result['first_pass_ms']:>12.1f}")
+    saved = (results["cold"]["private_kib"] - results["warm"]["private_kib"]) / 1024
+    print(f"\nwarmup() saves {saved:.1f} MiB per worker, {saved * args.workers:.1f} MiB across {args.workers} workers")
+
+
+if __name__ == "__main__":
+    main()
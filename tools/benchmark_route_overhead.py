@@ -0,0 +1,92 @@
+"""Measure the per-request overhead of ``Architect.schema_constructor`` routes.
+
+Registers a plain Flask no-op view next to ``schema_constructor`` routes that
+return the same constant payload (without a schema, with a small output schema
+and with a route rate limit) and calls each view ``--repeat`` times, each inside
+a fresh request context, printing microseconds per call and the overhead over
+the no-op view::
+
+    python tools/benchmark_route_overhead.py --repeat 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from flask import Flask
+from marshmallow import Schema, fields
+
+from flarchitect import Architect
+
+
+class ItemSchema(Schema):
+    id = fields.Integer()
+    name = fields.String()
+
+
+class LimitedItemSchema(ItemSchema):
+    class Meta:
+        rate_limit = "1000000 per minute"
+
+
+def build_app() -> Flask:
+    app = Flask("bench_overhead")
+    app.config.update(
+        FULL_AUTO=False,
+        API_CREATE_DOCS=False,
+        API_RATE_LIMIT_STORAGE_URI="memory://",
+        API_RATE_LIMIT_AUTODETECT=False,
+    )
+    with app.app_context():
+        architect = Architect(app)
+
+    @app.get("/noop")
+    def noop():
+        return {"id": 1, "name": "item"}
+
+    @app.get("/plain")
+    @architect.schema_constructor(output_schema=None, auth=False)
+    def plain():
+        return {"id": 1, "name": "item"}
+
+    @app.get("/schema")
+    @architect.schema_constructor(output_schema=ItemSchema, auth=False)
+    def schema():
+        return {"id": 1, "name": "item"}
+
+    @app.get("/limited")
+    @architect.schema_constructor(output_schema=LimitedItemSchema, auth=False)
+    def limited():
+        return {"id": 1, "name": "item"}
+
+    return app
+
+
+def time_view(app: Flask, path: str, view: Callable, repeat: int) -> float:
+    for _ in range(10):  # warm up
+        with app.test_request_context(path):
+            view()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        with app.test_request_context(path):
+            view()
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5000)
+    args = parser.parse_args()
+
+    app = build_app()
+    baseline = None
+    for name in ("noop", "plain", "schema", "limited"):
+        seconds = time_view(app, f"/{name}", app.view_functions[name], args.repeat)
+        baseline = baseline if baseline is not None else seconds
+        print(f"{name:>8}: {seconds * 1e6:8.1f} us/call  overhead {(seconds - baseline) * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Compare Marshmallow and ``API_COMPILED_SERIALIZER`` dumps of ``AutoSchema`` output.
+
+Builds an output schema for a model mixing integers, strings, floats,
+booleans, ``Numeric``, ``Enum``, dates and a relationship URL, then dumps the
+same rows ``--repeat`` times through :meth:`marshmallow.Schema.dump` and through
+:func:`flarchitect.schemas.compiled.compiled_dump`, checking both payloads are
+identical and printing rows/second for each::
+
+    python tools/benchmark_serializer.py --rows 1000 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import enum
+import time
+from decimal import Decimal
+
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from marshmallow import Schema
+from sqlalchemy import Boolean, Date, DateTime, Enum, Float, ForeignKey, Integer, Numeric, String
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+from flarchitect import Architect
+from flarchitect.schemas.compiled import compiled_dump
+from flarchitect.schemas.utils import get_input_output_from_model_or_make
+
+
+class BaseModel(DeclarativeBase):
+    pass
+
+
+db = SQLAlchemy(model_class=BaseModel)
+
+
+class Status(enum.Enum):
+    DRAFT = "draft"
+    LIVE = "live"
+
+
+class Store(db.Model):
+    __tablename__ = "stores"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String)
+
+    class Meta:
+        pass
+
+
+class Order(db.Model):
+    __tablename__ = "orders"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    reference: Mapped[str] = mapped_column(String)
+    total: Mapped[Decimal] = mapped_column(Numeric(10, 2))
+    weight: Mapped[float] = mapped_column(Float)
+    paid: Mapped[bool] = mapped_column(Boolean)
+    status: Mapped[Status] = mapped_column(Enum(Status))
+    placed_at: Mapped[datetime.datetime] = mapped_column(DateTime)
+    ships_on: Mapped[datetime.date] = mapped_column(Date)
+    store_id: Mapped[int] = mapped_column(ForeignKey("stores.id"))
+    store: Mapped[Store] = relationship("Store")
+
+    class Meta:
+        pass
+
+
+def build_app(rows: int) -> Flask:
+    app = Flask("bench_serializer")
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        API_BASE_MODEL=db.Model,
+        API_CREATE_DOCS=False,
+        API_VERBOSITY_LEVEL=0,
+    )
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        store = Store(name="main")
+        db.session.add_all(
+            Order(
+                reference=f"order-{i}",
+                total=Decimal("19.99") + i,
+                weight=0.5 * i,
+                paid=bool(i % 2),
+                status=Status.LIVE if i % 3 else Status.DRAFT,
+                placed_at=datetime.datetime(2024, 1, 1) + datetime.timedelta(minutes=i),
+                ships_on=datetime.date(2024, 1, 1) + datetime.timedelta(days=i % 30),
+                store=store,
+            )
+            for i in range(rows)
+        )
+        db.session.commit()
+        Architect(app=app)
+    return app
+
+
+def time_dump(dump, repeat: int) -> tuple[float, object]:
+    result = dump()  # warm up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        dump()
+    return (time.perf_counter() - started) / repeat, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    app = build_app(args.rows)
+    with app.test_request_context("/api/orders"):
+        _, output_schema = get_input_output_from_model_or_make(Order)
+        schema = type(output_schema)(many=True)
+        orders = db.session.scalars(db.select(Order).options(db.selectinload(Order.store))).all()
+
+        plain, expected = time_dump(lambda: Schema.dump(schema, orders, many=True), args.repeat)
+        fast, result = time_dump(lambda: compiled_dump(schema, orders, True), args.repeat)
+
+    if result != expected:
+        raise SystemExit("compiled output differs from marshmallow output")
+    for label, seconds in (("marshmallow", plain), ("compiled", fast)):
+        print(f"{label:>11}: {args.rows / seconds:10.0f} rows/s  {seconds * 1000:7.2f} ms per dump")
+    print(f"    speedup: {plain / fast:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()